@@ -21,6 +21,9 @@ Beginner Tips:
     - Methods modify in-place and return self for chaining
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from animaid.css_types import (
     # Layout enums
     AlignContent,
@@ -33,7 +36,8 @@ from animaid.css_types import (
     # Primitives
     Color,
     ColorValue,
-    # Base class
+    # Base classes
+    CSSEnum,
     CSSValue,
     Display,
     # Container/decoration enums
@@ -77,27 +81,62 @@ from animaid.html_set import HTMLSet
 from animaid.html_string import HTMLString
 from animaid.html_tuple import HTMLTuple
 
-# Conditional import for App and input widgets (requires tutorial dependencies)
-try:
+if TYPE_CHECKING:
     from animaid.animate import App
     from animaid.html_button import HTMLButton
+    from animaid.html_button import HTMLButton as Button
     from animaid.html_checkbox import HTMLCheckbox
+    from animaid.html_checkbox import HTMLCheckbox as Checkbox
     from animaid.html_select import HTMLSelect
+    from animaid.html_select import HTMLSelect as Select
     from animaid.html_slider import HTMLSlider
+    from animaid.html_slider import HTMLSlider as Slider
     from animaid.html_text_input import HTMLTextInput
+    from animaid.html_text_input import HTMLTextInput as TextInput
     from animaid.input_event import InputEvent
     from animaid.window import Window, WindowConfig
 
-except ImportError:
-    App = None  # type: ignore[misc, assignment]
-    Window = None  # type: ignore[misc, assignment]
-    WindowConfig = None  # type: ignore[misc, assignment]
-    HTMLButton = None  # type: ignore[misc, assignment]
-    HTMLCheckbox = None  # type: ignore[misc, assignment]
-    HTMLSelect = None  # type: ignore[misc, assignment]
-    HTMLSlider = None  # type: ignore[misc, assignment]
-    HTMLTextInput = None  # type: ignore[misc, assignment]
-    InputEvent = None  # type: ignore[misc, assignment]
+
+# App, Window and the input widgets are imported on first access (PEP 562).
+# They pull in asyncio and the optional tutorial dependencies, which would
+# otherwise more than double the cost of "import animaid". If those
+# dependencies are missing the names resolve to None, as before.
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "App": ("animaid.animate", "App"),
+    "Window": ("animaid.window", "Window"),
+    "WindowConfig": ("animaid.window", "WindowConfig"),
+    "HTMLButton": ("animaid.html_button", "HTMLButton"),
+    "HTMLCheckbox": ("animaid.html_checkbox", "HTMLCheckbox"),
+    "HTMLSelect": ("animaid.html_select", "HTMLSelect"),
+    "HTMLSlider": ("animaid.html_slider", "HTMLSlider"),
+    "HTMLTextInput": ("animaid.html_text_input", "HTMLTextInput"),
+    "InputEvent": ("animaid.input_event", "InputEvent"),
+    # Input widget aliases
+    "Button": ("animaid.html_button", "HTMLButton"),
+    "TextInput": ("animaid.html_text_input", "HTMLTextInput"),
+    "Checkbox": ("animaid.html_checkbox", "HTMLCheckbox"),
+    "Slider": ("animaid.html_slider", "HTMLSlider"),
+    "Select": ("animaid.html_select", "HTMLSelect"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import App, Window and the input widgets on first access."""
+    target = _LAZY_IMPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr = target
+    try:
+        value = getattr(importlib.import_module(module_name), attr)
+    except ImportError:
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
+
 
 __version__ = "0.5.0"
 
@@ -119,13 +158,6 @@ h_float = HTMLFloat
 h_tuple = HTMLTuple
 h_set = HTMLSet
 
-# Input widget aliases (for when tutorial dependencies are available)
-Button = HTMLButton
-TextInput = HTMLTextInput
-Checkbox = HTMLCheckbox
-Slider = HTMLSlider
-Select = HTMLSelect
-
 # Container aliases
 Container = HTMLContainer
 Row = HTMLRow
@@ -193,6 +225,7 @@ __all__ = [
     "h_tuple",
     "h_set",
     # CSS value types
+    "CSSEnum",
     "CSSValue",
     "Color",
     "Size",
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import html
 import uuid
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Self
 
 from animaid.css_types import (
     AlignItems,
@@ -19,6 +20,11 @@ if TYPE_CHECKING:
     from animaid.animate import App
 
 
+# Tag literals shared by every container render path.
+_DIV_OPEN = "<div"
+_DIV_CLOSE = "</div>"
+
+
 def _to_css(value: object) -> str:
     """Convert a value to its CSS string representation."""
     if hasattr(value, "to_css"):
@@ -67,26 +73,40 @@ class HTMLContainer(HTMLObject):
             css_key = key.replace("_", "-")
             self._styles[css_key] = _to_css(value)
 
-    def _notify(self) -> None:
-        """Publish change notification via pypubsub."""
-        try:
-            from pubsub import pub
-
-            pub.sendMessage("animaid.changed", obs_id=self._obs_id)
-        except ImportError:
-            pass  # pypubsub not installed
-
     def render(self) -> str:
         """Render the container and all children.
 
         Returns:
             HTML string with container div and rendered children.
         """
-        children_html = self._render_children()
+        out: list[str] = []
+        self._render_into(out)
+        return "".join(out)
+
+    def _render_into(self, out: list[str]) -> None:
+        """Append this container's HTML fragments to a shared output list.
+
+        Nested containers write into the same list, so a whole tree is
+        joined once at the top-level render() instead of once per level.
+        Subclasses that change the markup override this, not render().
+
+        Args:
+            out: List of HTML fragments being accumulated.
+        """
+        out.append(self._open_tag())
+        self._render_children_into(out)
+        out.append(_DIV_CLOSE)
+
+    def _open_tag(self) -> str:
+        """Build the opening div tag including class and style attributes.
+
+        Returns:
+            The opening tag, e.g. '<div style="display: flex">'.
+        """
         attrs = self._build_attributes()
         if attrs:
-            return f"<div {attrs}>{children_html}</div>"
-        return f"<div>{children_html}</div>"
+            return f"{_DIV_OPEN} {attrs}>"
+        return f"{_DIV_OPEN}>"
 
     def _render_children(self) -> str:
         """Render all children to HTML.
@@ -94,16 +114,41 @@ class HTMLContainer(HTMLObject):
         Returns:
             Concatenated HTML of all children.
         """
-        parts = []
+        out: list[str] = []
+        self._render_children_into(out)
+        return "".join(out)
+
+    def _render_children_into(self, out: list[str]) -> None:
+        """Append the HTML of all children to a shared output list.
+
+        Args:
+            out: List of HTML fragments being accumulated.
+        """
+        # Adjacent plain values are collected and escaped with a single
+        # html.escape() call, since escaping is per-character and so
+        # distributes over concatenation.
+        pending: list[str] = []
         for child in self._children:
-            if hasattr(child, "render"):
-                parts.append(child.render())
+            if type(child) is str:
+                pending.append(child)
+            elif hasattr(child, "render"):
+                if pending:
+                    out.append(html.escape("".join(pending)))
+                    pending.clear()
+                if isinstance(child, HTMLObject):
+                    child._render_into(out)
+                else:
+                    out.append(child.render())
+            elif hasattr(child, "__html__"):
+                # Already-safe markup (e.g. markupsafe.Markup) is not escaped
+                if pending:
+                    out.append(html.escape("".join(pending)))
+                    pending.clear()
+                out.append(child.__html__())
             else:
-                # Escape plain strings for safety
-                import html
-
-                parts.append(html.escape(str(child)))
-        return "".join(parts)
+                pending.append(str(child))
+        if pending:
+            out.append(html.escape("".join(pending)))
 
     def __html__(self) -> str:
         """Jinja2 auto-escaping protocol."""
@@ -113,7 +158,7 @@ class HTMLContainer(HTMLObject):
     # Child Management
     # =========================================================================
 
-    def append(self, child: Any) -> "HTMLContainer":
+    def append(self, child: Any) -> Self:
         """Add a child element and trigger update.
 
         Args:
@@ -126,20 +171,26 @@ class HTMLContainer(HTMLObject):
         self._notify()
         return self
 
-    def extend(self, children: list[Any]) -> "HTMLContainer":
+    def extend(self, children: list[Any]) -> Self:
         """Add multiple child elements.
 
+        Children are stored as given, in one list.extend() call; plain
+        strings are escaped when rendered. An empty batch changes nothing
+        and so publishes no notification.
+
         Args:
             children: List of elements to add.
 
         Returns:
             Self for method chaining.
         """
+        if not children:
+            return self
         self._children.extend(children)
         self._notify()
         return self
 
-    def insert(self, index: int, child: Any) -> "HTMLContainer":
+    def insert(self, index: int, child: Any) -> Self:
         """Insert a child at a specific position.
 
         Args:
@@ -153,7 +204,7 @@ class HTMLContainer(HTMLObject):
         self._notify()
         return self
 
-    def remove(self, child: Any) -> "HTMLContainer":
+    def remove(self, child: Any) -> Self:
         """Remove a child element.
 
         Args:
@@ -179,7 +230,7 @@ class HTMLContainer(HTMLObject):
         self._notify()
         return child
 
-    def clear(self) -> "HTMLContainer":
+    def clear(self) -> Self:
         """Remove all children.
 
         Returns:
@@ -210,7 +261,7 @@ class HTMLContainer(HTMLObject):
     # Styling Methods
     # =========================================================================
 
-    def styled(self, **styles: str | CSSValue) -> "HTMLContainer":
+    def styled(self, **styles: str | CSSValue) -> Self:
         """Apply additional inline styles.
 
         Args:
@@ -225,7 +276,7 @@ class HTMLContainer(HTMLObject):
         self._notify()
         return self
 
-    def add_class(self, *class_names: str) -> "HTMLContainer":
+    def add_class(self, *class_names: str) -> Self:
         """Add CSS classes.
 
         Args:
@@ -240,7 +291,7 @@ class HTMLContainer(HTMLObject):
         self._notify()
         return self
 
-    def remove_class(self, *class_names: str) -> "HTMLContainer":
+    def remove_class(self, *class_names: str) -> Self:
         """Remove CSS classes.
 
         Args:
@@ -259,7 +310,7 @@ class HTMLContainer(HTMLObject):
     # Common Layout Methods
     # =========================================================================
 
-    def gap(self, size: Size | str | int) -> "HTMLContainer":
+    def gap(self, size: Size | str | int) -> Self:
         """Set the gap between child elements.
 
         Args:
@@ -274,7 +325,7 @@ class HTMLContainer(HTMLObject):
         self._notify()
         return self
 
-    def padding(self, size: Spacing | Size | str | int) -> "HTMLContainer":
+    def padding(self, size: Spacing | Size | str | int) -> Self:
         """Set internal padding.
 
         Args:
@@ -289,7 +340,7 @@ class HTMLContainer(HTMLObject):
         self._notify()
         return self
 
-    def margin(self, size: Spacing | Size | str | int) -> "HTMLContainer":
+    def margin(self, size: Spacing | Size | str | int) -> Self:
         """Set external margin.
 
         Args:
@@ -304,7 +355,7 @@ class HTMLContainer(HTMLObject):
         self._notify()
         return self
 
-    def width(self, size: Size | str | int) -> "HTMLContainer":
+    def width(self, size: Size | str | int) -> Self:
         """Set container width.
 
         Args:
@@ -319,7 +370,7 @@ class HTMLContainer(HTMLObject):
         self._notify()
         return self
 
-    def height(self, size: Size | str | int) -> "HTMLContainer":
+    def height(self, size: Size | str | int) -> Self:
         """Set container height.
 
         Args:
@@ -334,7 +385,7 @@ class HTMLContainer(HTMLObject):
         self._notify()
         return self
 
-    def max_width(self, size: Size | str | int) -> "HTMLContainer":
+    def max_width(self, size: Size | str | int) -> Self:
         """Set maximum container width.
 
         Args:
@@ -349,7 +400,7 @@ class HTMLContainer(HTMLObject):
         self._notify()
         return self
 
-    def max_height(self, size: Size | str | int) -> "HTMLContainer":
+    def max_height(self, size: Size | str | int) -> Self:
         """Set maximum container height.
 
         Args:
@@ -364,7 +415,7 @@ class HTMLContainer(HTMLObject):
         self._notify()
         return self
 
-    def min_width(self, size: Size | str | int) -> "HTMLContainer":
+    def min_width(self, size: Size | str | int) -> Self:
         """Set minimum container width.
 
         Args:
@@ -379,7 +430,7 @@ class HTMLContainer(HTMLObject):
         self._notify()
         return self
 
-    def min_height(self, size: Size | str | int) -> "HTMLContainer":
+    def min_height(self, size: Size | str | int) -> Self:
         """Set minimum container height.
 
         Args:
@@ -398,7 +449,7 @@ class HTMLContainer(HTMLObject):
     # Full-Window Layout Methods
     # =========================================================================
 
-    def full_width(self) -> "HTMLContainer":
+    def full_width(self) -> Self:
         """Expand container to fill the full width of its parent.
 
         Returns:
@@ -411,7 +462,7 @@ class HTMLContainer(HTMLObject):
         self._notify()
         return self
 
-    def full_height(self) -> "HTMLContainer":
+    def full_height(self) -> Self:
         """Expand container to fill the full viewport height.
 
         Returns:
@@ -424,7 +475,7 @@ class HTMLContainer(HTMLObject):
         self._notify()
         return self
 
-    def full_screen(self) -> "HTMLContainer":
+    def full_screen(self) -> Self:
         """Expand container to fill the entire viewport (width and height).
 
         Returns:
@@ -438,7 +489,7 @@ class HTMLContainer(HTMLObject):
         self._notify()
         return self
 
-    def expand(self) -> "HTMLContainer":
+    def expand(self) -> Self:
         """Make this container expand to fill available space in a flex parent.
 
         Use this on a child container to make it grow and fill remaining space.
@@ -3,16 +3,14 @@
 from __future__ import annotations
 
 import html
-from typing import Any
+from typing import Any, ClassVar
 
-from animaid.containers.base import HTMLContainer, _to_css
+from animaid.containers.base import _DIV_CLOSE, HTMLContainer, _to_css
 from animaid.css_types import (
     Color,
     CSSValue,
     RadiusSize,
     ShadowSize,
-    Size,
-    Spacing,
 )
 
 
@@ -42,6 +40,21 @@ class HTMLCard(HTMLContainer):
 
     _title: str | None
 
+    # Style tables for the presets, built once per class
+    _DEFAULT_PRESET: ClassVar[dict[str, str]] = {
+        "border": "1px solid #e5e7eb",
+        "box-shadow": ShadowSize.SM.css,
+        "border-radius": RadiusSize.DEFAULT.css,
+    }
+    _ELEVATED_PRESET: ClassVar[dict[str, str]] = {
+        "box-shadow": ShadowSize.LG.css,
+        "border-radius": RadiusSize.LG.css,
+    }
+    _OUTLINED_PRESET: ClassVar[dict[str, str]] = {
+        "border": "1px solid #e5e7eb",
+        "box-shadow": ShadowSize.NONE.css,
+    }
+
     def __init__(
         self,
         children: list[Any] | None = None,
@@ -61,34 +74,29 @@ class HTMLCard(HTMLContainer):
 
         # Default card styles
         self._styles.setdefault("background-color", "white")
-        self._styles.setdefault("border-radius", RadiusSize.DEFAULT.to_css())
+        self._styles.setdefault("border-radius", RadiusSize.DEFAULT.css)
         self._styles.setdefault("padding", "16px")
 
-    def render(self) -> str:
-        """Render the card with optional title.
+    def _render_into(self, out: list[str]) -> None:
+        """Render the card with optional title into a shared output list.
 
-        Returns:
-            HTML string with card structure.
+        Args:
+            out: List of HTML fragments being accumulated.
         """
-        parts = []
+        out.append(self._open_tag())
 
         # Render title if present
         if self._title:
             escaped_title = html.escape(self._title)
-            parts.append(
+            out.append(
                 f'<div style="font-weight: bold; font-size: 1.1em; '
                 f'margin-bottom: 12px; padding-bottom: 8px; '
                 f'border-bottom: 1px solid #e5e7eb;">{escaped_title}</div>'
             )
 
         # Render children
-        parts.append(self._render_children())
-
-        content = "".join(parts)
-        attrs = self._build_attributes()
-        if attrs:
-            return f"<div {attrs}>{content}</div>"
-        return f"<div>{content}</div>"
+        self._render_children_into(out)
+        out.append(_DIV_CLOSE)
 
     # =========================================================================
     # Title Methods
@@ -130,7 +138,7 @@ class HTMLCard(HTMLContainer):
             >>> card.shadow(ShadowSize.LG)  # Larger shadow
         """
         if isinstance(size, ShadowSize):
-            self._styles["box-shadow"] = size.to_css()
+            self._styles["box-shadow"] = size.css
         else:
             self._styles["box-shadow"] = size
         self._notify()
@@ -142,7 +150,7 @@ class HTMLCard(HTMLContainer):
         Returns:
             Self for method chaining.
         """
-        self._styles["box-shadow"] = ShadowSize.NONE.to_css()
+        self._styles["box-shadow"] = ShadowSize.NONE.css
         self._notify()
         return self
 
@@ -164,7 +172,7 @@ class HTMLCard(HTMLContainer):
             >>> card.rounded(RadiusSize.LG)  # More rounded
         """
         if isinstance(size, RadiusSize):
-            self._styles["border-radius"] = size.to_css()
+            self._styles["border-radius"] = size.css
         else:
             self._styles["border-radius"] = size
         self._notify()
@@ -176,7 +184,7 @@ class HTMLCard(HTMLContainer):
         Returns:
             Self for method chaining.
         """
-        self._styles["border-radius"] = RadiusSize.NONE.to_css()
+        self._styles["border-radius"] = RadiusSize.NONE.css
         self._notify()
         return self
 
@@ -235,9 +243,7 @@ class HTMLCard(HTMLContainer):
         Returns:
             Self for method chaining.
         """
-        self._styles["border"] = "1px solid #e5e7eb"
-        self._styles["box-shadow"] = ShadowSize.SM.to_css()
-        self._styles["border-radius"] = RadiusSize.DEFAULT.to_css()
+        self._styles.update(self._DEFAULT_PRESET)
         self._notify()
         return self
 
@@ -247,10 +253,8 @@ class HTMLCard(HTMLContainer):
         Returns:
             Self for method chaining.
         """
-        self._styles["box-shadow"] = ShadowSize.LG.to_css()
-        self._styles["border-radius"] = RadiusSize.LG.to_css()
-        if "border" in self._styles:
-            del self._styles["border"]
+        self._styles.update(self._ELEVATED_PRESET)
+        self._styles.pop("border", None)
         self._notify()
         return self
 
@@ -260,8 +264,7 @@ class HTMLCard(HTMLContainer):
         Returns:
             Self for method chaining.
         """
-        self._styles["border"] = "1px solid #e5e7eb"
-        self._styles["box-shadow"] = ShadowSize.NONE.to_css()
+        self._styles.update(self._OUTLINED_PRESET)
         self._notify()
         return self
 
@@ -273,7 +276,7 @@ class HTMLCard(HTMLContainer):
         """
         if "border" in self._styles:
             del self._styles["border"]
-        self._styles["box-shadow"] = ShadowSize.NONE.to_css()
+        self._styles["box-shadow"] = ShadowSize.NONE.css
         self._notify()
         return self
 
@@ -289,55 +292,6 @@ class HTMLCard(HTMLContainer):
         self._styles["background-color"] = _to_css(color)
         if "border" in self._styles:
             del self._styles["border"]
-        self._styles["box-shadow"] = ShadowSize.NONE.to_css()
+        self._styles["box-shadow"] = ShadowSize.NONE.css
         self._notify()
         return self
-
-    # =========================================================================
-    # Override base methods for correct return type
-    # =========================================================================
-
-    def styled(self, **styles: str | CSSValue) -> "HTMLCard":
-        """Apply additional inline styles."""
-        super().styled(**styles)
-        return self
-
-    def add_class(self, *class_names: str) -> "HTMLCard":
-        """Add CSS classes."""
-        super().add_class(*class_names)
-        return self
-
-    def gap(self, size: Size | str | int) -> "HTMLCard":
-        """Set the gap between child elements."""
-        super().gap(size)
-        return self
-
-    def padding(self, size: Spacing | Size | str | int) -> "HTMLCard":
-        """Set internal padding."""
-        super().padding(size)
-        return self
-
-    def margin(self, size: Spacing | Size | str | int) -> "HTMLCard":
-        """Set external margin."""
-        super().margin(size)
-        return self
-
-    def width(self, size: Size | str | int) -> "HTMLCard":
-        """Set container width."""
-        super().width(size)
-        return self
-
-    def height(self, size: Size | str | int) -> "HTMLCard":
-        """Set container height."""
-        super().height(size)
-        return self
-
-    def max_width(self, size: Size | str | int) -> "HTMLCard":
-        """Set maximum container width."""
-        super().max_width(size)
-        return self
-
-    def min_width(self, size: Size | str | int) -> "HTMLCard":
-        """Set minimum container width."""
-        super().min_width(size)
-        return self
@@ -2,16 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, ClassVar
 
-from animaid.containers.base import HTMLContainer, _to_css
+from animaid.containers.base import HTMLContainer
 from animaid.css_types import (
     AlignItems,
     CSSValue,
     FlexWrap,
     JustifyContent,
-    Size,
-    Spacing,
 )
 
 
@@ -37,6 +35,16 @@ class HTMLColumn(HTMLContainer):
         >>> column = HTMLColumn(items).stack()
     """
 
+    # Style tables for the multi-property presets, built once per class
+    _FORM_PRESET: ClassVar[dict[str, str]] = {
+        "gap": "12px",
+        "align-items": "stretch",
+    }
+    _CENTERED_PRESET: ClassVar[dict[str, str]] = {
+        "justify-content": "center",
+        "align-items": "center",
+    }
+
     def __init__(
         self,
         children: list[Any] | None = None,
@@ -72,7 +80,7 @@ class HTMLColumn(HTMLContainer):
         """
         if isinstance(value, str):
             value = AlignItems(value)
-        self._styles["align-items"] = value.to_css()
+        self._styles["align-items"] = value.css
         self._notify()
         return self
 
@@ -92,7 +100,7 @@ class HTMLColumn(HTMLContainer):
         """
         if isinstance(value, str):
             value = JustifyContent(value)
-        self._styles["justify-content"] = value.to_css()
+        self._styles["justify-content"] = value.css
         self._notify()
         return self
 
@@ -111,7 +119,7 @@ class HTMLColumn(HTMLContainer):
         """
         if isinstance(value, str):
             value = FlexWrap(value)
-        self._styles["flex-wrap"] = value.to_css()
+        self._styles["flex-wrap"] = value.css
         self._notify()
         return self
 
@@ -154,8 +162,7 @@ class HTMLColumn(HTMLContainer):
         Returns:
             Self for method chaining.
         """
-        self._styles["gap"] = "12px"
-        self._styles["align-items"] = "stretch"
+        self._styles.update(self._FORM_PRESET)
         self._notify()
         return self
 
@@ -165,8 +172,7 @@ class HTMLColumn(HTMLContainer):
         Returns:
             Self for method chaining.
         """
-        self._styles["justify-content"] = "center"
-        self._styles["align-items"] = "center"
+        self._styles.update(self._CENTERED_PRESET)
         self._notify()
         return self
 
@@ -209,91 +215,3 @@ class HTMLColumn(HTMLContainer):
         self._styles["align-items"] = "stretch"
         self._notify()
         return self
-
-    # =========================================================================
-    # Override base methods for correct return type
-    # =========================================================================
-
-    def styled(self, **styles: str | CSSValue) -> "HTMLColumn":
-        """Apply additional inline styles.
-
-        Args:
-            **styles: CSS property-value pairs.
-
-        Returns:
-            Self for method chaining.
-        """
-        super().styled(**styles)
-        return self
-
-    def add_class(self, *class_names: str) -> "HTMLColumn":
-        """Add CSS classes.
-
-        Args:
-            *class_names: CSS class names to add.
-
-        Returns:
-            Self for method chaining.
-        """
-        super().add_class(*class_names)
-        return self
-
-    def gap(self, size: Size | str | int) -> "HTMLColumn":
-        """Set the gap between child elements.
-
-        Args:
-            size: Gap size.
-
-        Returns:
-            Self for method chaining.
-        """
-        super().gap(size)
-        return self
-
-    def padding(self, size: Spacing | Size | str | int) -> "HTMLColumn":
-        """Set internal padding.
-
-        Args:
-            size: Padding size.
-
-        Returns:
-            Self for method chaining.
-        """
-        super().padding(size)
-        return self
-
-    def margin(self, size: Spacing | Size | str | int) -> "HTMLColumn":
-        """Set external margin.
-
-        Args:
-            size: Margin size.
-
-        Returns:
-            Self for method chaining.
-        """
-        super().margin(size)
-        return self
-
-    def width(self, size: Size | str | int) -> "HTMLColumn":
-        """Set container width.
-
-        Args:
-            size: Width.
-
-        Returns:
-            Self for method chaining.
-        """
-        super().width(size)
-        return self
-
-    def height(self, size: Size | str | int) -> "HTMLColumn":
-        """Set container height.
-
-        Args:
-            size: Height.
-
-        Returns:
-            Self for method chaining.
-        """
-        super().height(size)
-        return self
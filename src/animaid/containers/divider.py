@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import html
 import uuid
+from typing import ClassVar
 
 from animaid.css_types import Color, CSSValue, DividerStyle, Size
 from animaid.html_object import HTMLObject
@@ -42,6 +43,12 @@ class HTMLDivider(HTMLObject):
     _is_vertical: bool
     _obs_id: str
 
+    # Style table for the bold preset, built once per class
+    _BOLD_PRESET: ClassVar[dict[str, str]] = {
+        "border-color": "#374151",
+        "border-width": "2px",
+    }
+
     def __init__(
         self,
         label: str | None = None,
@@ -61,21 +68,12 @@ class HTMLDivider(HTMLObject):
 
         # Default styles
         self._styles["border-color"] = "#e5e7eb"
-        self._styles["border-style"] = DividerStyle.SOLID.to_css()
+        self._styles["border-style"] = DividerStyle.SOLID.css
 
         for key, value in styles.items():
             css_key = key.replace("_", "-")
             self._styles[css_key] = _to_css(value)
 
-    def _notify(self) -> None:
-        """Publish change notification via pypubsub."""
-        try:
-            from pubsub import pub
-
-            pub.sendMessage("animaid.changed", obs_id=self._obs_id)
-        except ImportError:
-            pass
-
     def render(self) -> str:
         """Render the divider.
 
@@ -169,7 +167,7 @@ class HTMLDivider(HTMLObject):
             Self for method chaining.
         """
         if isinstance(value, DividerStyle):
-            self._styles["border-style"] = value.to_css()
+            self._styles["border-style"] = value.css
         else:
             self._styles["border-style"] = value
         self._notify()
@@ -181,7 +179,7 @@ class HTMLDivider(HTMLObject):
         Returns:
             Self for method chaining.
         """
-        self._styles["border-style"] = DividerStyle.SOLID.to_css()
+        self._styles["border-style"] = DividerStyle.SOLID.css
         self._notify()
         return self
 
@@ -191,7 +189,7 @@ class HTMLDivider(HTMLObject):
         Returns:
             Self for method chaining.
         """
-        self._styles["border-style"] = DividerStyle.DASHED.to_css()
+        self._styles["border-style"] = DividerStyle.DASHED.css
         self._notify()
         return self
 
@@ -201,7 +199,7 @@ class HTMLDivider(HTMLObject):
         Returns:
             Self for method chaining.
         """
-        self._styles["border-style"] = DividerStyle.DOTTED.to_css()
+        self._styles["border-style"] = DividerStyle.DOTTED.css
         self._notify()
         return self
 
@@ -287,8 +285,7 @@ class HTMLDivider(HTMLObject):
         Returns:
             Self for method chaining.
         """
-        self._styles["border-color"] = "#374151"
-        self._styles["border-width"] = "2px"
+        self._styles.update(self._BOLD_PRESET)
         self._notify()
         return self
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, ClassVar
 
 from animaid.containers.base import HTMLContainer, _to_css
 from animaid.css_types import (
@@ -11,7 +11,6 @@ from animaid.css_types import (
     FlexWrap,
     JustifyContent,
     Size,
-    Spacing,
 )
 
 
@@ -36,6 +35,26 @@ class HTMLRow(HTMLContainer):
         >>> row = HTMLRow(buttons).buttons()
     """
 
+    # Style tables for the multi-property presets, built once per class
+    _BUTTONS_PRESET: ClassVar[dict[str, str]] = {
+        "gap": "8px",
+        "justify-content": "flex-end",
+        "align-items": "center",
+    }
+    _TOOLBAR_PRESET: ClassVar[dict[str, str]] = {
+        "gap": "4px",
+        "align-items": "center",
+        "padding": "4px 8px",
+    }
+    _CENTERED_PRESET: ClassVar[dict[str, str]] = {
+        "justify-content": "center",
+        "align-items": "center",
+    }
+    _SPACED_PRESET: ClassVar[dict[str, str]] = {
+        "justify-content": "space-between",
+        "align-items": "center",
+    }
+
     def __init__(
         self,
         children: list[Any] | None = None,
@@ -71,7 +90,7 @@ class HTMLRow(HTMLContainer):
         """
         if isinstance(value, str):
             value = AlignItems(value)
-        self._styles["align-items"] = value.to_css()
+        self._styles["align-items"] = value.css
         self._notify()
         return self
 
@@ -91,7 +110,7 @@ class HTMLRow(HTMLContainer):
         """
         if isinstance(value, str):
             value = JustifyContent(value)
-        self._styles["justify-content"] = value.to_css()
+        self._styles["justify-content"] = value.css
         self._notify()
         return self
 
@@ -115,7 +134,7 @@ class HTMLRow(HTMLContainer):
         """
         if isinstance(value, str):
             value = FlexWrap(value)
-        self._styles["flex-wrap"] = value.to_css()
+        self._styles["flex-wrap"] = value.css
         self._notify()
         return self
 
@@ -125,7 +144,7 @@ class HTMLRow(HTMLContainer):
         Returns:
             Self for method chaining.
         """
-        self._styles["flex-wrap"] = FlexWrap.NOWRAP.to_css()
+        self._styles["flex-wrap"] = FlexWrap.NOWRAP.css
         self._notify()
         return self
 
@@ -179,9 +198,7 @@ class HTMLRow(HTMLContainer):
         Returns:
             Self for method chaining.
         """
-        self._styles["gap"] = "8px"
-        self._styles["justify-content"] = "flex-end"
-        self._styles["align-items"] = "center"
+        self._styles.update(self._BUTTONS_PRESET)
         self._notify()
         return self
 
@@ -193,9 +210,7 @@ class HTMLRow(HTMLContainer):
         Returns:
             Self for method chaining.
         """
-        self._styles["gap"] = "4px"
-        self._styles["align-items"] = "center"
-        self._styles["padding"] = "4px 8px"
+        self._styles.update(self._TOOLBAR_PRESET)
         self._notify()
         return self
 
@@ -205,8 +220,7 @@ class HTMLRow(HTMLContainer):
         Returns:
             Self for method chaining.
         """
-        self._styles["justify-content"] = "center"
-        self._styles["align-items"] = "center"
+        self._styles.update(self._CENTERED_PRESET)
         self._notify()
         return self
 
@@ -216,8 +230,7 @@ class HTMLRow(HTMLContainer):
         Returns:
             Self for method chaining.
         """
-        self._styles["justify-content"] = "space-between"
-        self._styles["align-items"] = "center"
+        self._styles.update(self._SPACED_PRESET)
         self._notify()
         return self
 
@@ -240,91 +253,3 @@ class HTMLRow(HTMLContainer):
         self._styles["justify-content"] = "flex-end"
         self._notify()
         return self
-
-    # =========================================================================
-    # Override styled and add_class for correct return type
-    # =========================================================================
-
-    def styled(self, **styles: str | CSSValue) -> "HTMLRow":
-        """Apply additional inline styles.
-
-        Args:
-            **styles: CSS property-value pairs.
-
-        Returns:
-            Self for method chaining.
-        """
-        super().styled(**styles)
-        return self
-
-    def add_class(self, *class_names: str) -> "HTMLRow":
-        """Add CSS classes.
-
-        Args:
-            *class_names: CSS class names to add.
-
-        Returns:
-            Self for method chaining.
-        """
-        super().add_class(*class_names)
-        return self
-
-    def gap(self, size: Size | str | int) -> "HTMLRow":
-        """Set the gap between child elements.
-
-        Args:
-            size: Gap size.
-
-        Returns:
-            Self for method chaining.
-        """
-        super().gap(size)
-        return self
-
-    def padding(self, size: "Spacing | Size | str | int") -> "HTMLRow":
-        """Set internal padding.
-
-        Args:
-            size: Padding size.
-
-        Returns:
-            Self for method chaining.
-        """
-        super().padding(size)
-        return self
-
-    def margin(self, size: "Spacing | Size | str | int") -> "HTMLRow":
-        """Set external margin.
-
-        Args:
-            size: Margin size.
-
-        Returns:
-            Self for method chaining.
-        """
-        super().margin(size)
-        return self
-
-    def width(self, size: Size | str | int) -> "HTMLRow":
-        """Set container width.
-
-        Args:
-            size: Width.
-
-        Returns:
-            Self for method chaining.
-        """
-        super().width(size)
-        return self
-
-    def height(self, size: Size | str | int) -> "HTMLRow":
-        """Set container height.
-
-        Args:
-            size: Height.
-
-        Returns:
-            Self for method chaining.
-        """
-        super().height(size)
-        return self
@@ -56,28 +56,14 @@ class HTMLSpacer(HTMLObject):
             css_key = key.replace("_", "-")
             self._styles[css_key] = _to_css(value)
 
-    def _notify(self) -> None:
-        """Publish change notification via pypubsub."""
-        try:
-            from pubsub import pub
-
-            pub.sendMessage("animaid.changed", obs_id=self._obs_id)
-        except ImportError:
-            pass
-
     def render(self) -> str:
         """Render the spacer.
 
         Returns:
             HTML string for the spacer div.
         """
-        style_parts = []
-        for key, value in self._styles.items():
-            style_parts.append(f"{key}: {value}")
-
-        if style_parts:
-            style_str = "; ".join(style_parts)
-            return f'<div style="{style_str}"></div>'
+        if self._styles:
+            return f'<div style="{self._build_style_string()}"></div>'
         return "<div></div>"
 
     def __html__(self) -> str:
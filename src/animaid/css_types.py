@@ -9,8 +9,14 @@ from __future__ import annotations
 import re
 from abc import ABC, abstractmethod
 from enum import Enum
+from functools import lru_cache
 from typing import ClassVar
 
+# Maximum number of distinct instances each interning factory keeps alive.
+# Factories like Size.px() return a shared instance per argument tuple;
+# that is safe because the CSS value types are immutable.
+_INTERN_CACHE_SIZE = 256
+
 # =============================================================================
 # Base Protocol
 # =============================================================================
@@ -23,6 +29,8 @@ class CSSValue(ABC):
     representation. They also support str() conversion for backward compatibility.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def to_css(self) -> str:
         """Return the CSS string representation of this value."""
@@ -36,10 +44,47 @@ class CSSValue(ABC):
         return f"{self.__class__.__name__}({self.to_css()!r})"
 
 
+class CSSEnum(Enum):
+    """Base class for enums whose members are CSS keyword values.
+
+    Each member stores its CSS text in a plain ``css`` attribute when the
+    class is created, so reading it avoids the ``Enum.value`` descriptor.
+    """
+
+    css: str
+
+    def __init__(self, value: str) -> None:
+        self.css = value
+
+    def to_css(self) -> str:
+        """Return the CSS value."""
+        return self.css
+
+    def __str__(self) -> str:
+        return self.css
+
+
 # =============================================================================
 # Size Class
 # =============================================================================
 
+_UNIT_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz%")
+
+
+def _is_digits(s: str) -> bool:
+    """Return True if s is a non-empty run of ASCII digits."""
+    return s.isascii() and s.isdigit()
+
+
+def _is_css_number(s: str) -> bool:
+    """Return True if s is a plain decimal like '10', '-1.5' or '.5'."""
+    if s.startswith("-"):
+        s = s[1:]
+    whole, dot, frac = s.partition(".")
+    if dot:
+        return (not whole or _is_digits(whole)) and _is_digits(frac)
+    return _is_digits(whole)
+
 
 class Size(CSSValue):
     """Represents a CSS size/length value with units.
@@ -55,37 +100,43 @@ class Size(CSSValue):
         Size('auto')
     """
 
+    __slots__ = ("_value", "_unit", "_css", "_hash")
+
     # Valid CSS length units
-    VALID_UNITS: ClassVar[set[str]] = {
-        "px",
-        "em",
-        "rem",
-        "%",
-        "vh",
-        "vw",
-        "vmin",
-        "vmax",
-        "pt",
-        "pc",
-        "in",
-        "cm",
-        "mm",
-        "ex",
-        "ch",
-        "fr",
-    }
+    VALID_UNITS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "px",
+            "em",
+            "rem",
+            "%",
+            "vh",
+            "vw",
+            "vmin",
+            "vmax",
+            "pt",
+            "pc",
+            "in",
+            "cm",
+            "mm",
+            "ex",
+            "ch",
+            "fr",
+        }
+    )
 
     # Special keyword values
-    KEYWORDS: ClassVar[set[str]] = {
-        "auto",
-        "inherit",
-        "initial",
-        "unset",
-        "none",
-        "min-content",
-        "max-content",
-        "fit-content",
-    }
+    KEYWORDS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "auto",
+            "inherit",
+            "initial",
+            "unset",
+            "none",
+            "min-content",
+            "max-content",
+            "fit-content",
+        }
+    )
 
     def __init__(self, value: float | str, unit: str = "") -> None:
         """Create a Size from a value and optional unit.
@@ -106,6 +157,9 @@ class Size(CSSValue):
                 raise ValueError(f"Invalid unit '{unit}'. Valid units: {valid}")
             self._value = value
             self._unit = unit
+        # Size is immutable, so the CSS text and hash are computed once
+        self._css = self._format_css()
+        self._hash = hash((self._value, self._unit))
 
     def _parse_string(self, s: str) -> tuple[float | None, str]:
         """Parse a CSS size string into value and unit."""
@@ -115,27 +169,39 @@ class Size(CSSValue):
         if s in self.KEYWORDS:
             return None, s
 
-        # Try to parse numeric value with unit
-        match = re.match(r"^(-?\d*\.?\d+)\s*([a-z%]+)?$", s)
-        if match:
-            value = float(match.group(1))
-            unit = match.group(2) or "px"  # Default to px if no unit
-            if unit not in self.VALID_UNITS:
+        # Split off the trailing unit letters, e.g. "10px" -> "10", "px"
+        end = len(s)
+        while end and s[end - 1] in _UNIT_CHARS:
+            end -= 1
+        number = s[:end].rstrip()
+        unit = s[end:]
+
+        if _is_css_number(number):
+            if not unit:
+                unit = "px"  # Default to px if no unit
+            elif unit not in self.VALID_UNITS:
                 raise ValueError(f"Invalid unit '{unit}' in '{s}'")
-            return value, unit
+            return float(number), unit
 
         raise ValueError(f"Cannot parse size value: '{s}'")
 
     def to_css(self) -> str:
         """Return the CSS string representation."""
-        if self._value is None:
+        return self._css
+
+    def _format_css(self) -> str:
+        """Format the value and unit as a CSS string."""
+        value = self._value
+        if value is None:
             return self._unit  # Keyword like "auto"
-        if self._unit:
-            # Format without trailing zeros
-            if self._value == int(self._value):
-                return f"{int(self._value)}{self._unit}"
-            return f"{self._value}{self._unit}"
-        return str(int(self._value) if self._value == int(self._value) else self._value)
+        # Format without trailing zeros: 10.0 -> "10"
+        if type(value) is int:
+            number = str(value)
+        elif isinstance(value, float):
+            number = str(int(value)) if value.is_integer() else str(value)
+        else:
+            number = str(int(value) if value == int(value) else value)
+        return f"{number}{self._unit}"
 
     @property
     def value(self) -> float | None:
@@ -154,21 +220,25 @@ class Size(CSSValue):
 
     # Factory methods for common units
     @classmethod
+    @lru_cache(maxsize=_INTERN_CACHE_SIZE, typed=True)
     def px(cls, value: float) -> Size:
         """Create a pixel size."""
         return cls(value, "px")
 
     @classmethod
+    @lru_cache(maxsize=_INTERN_CACHE_SIZE, typed=True)
     def em(cls, value: float) -> Size:
         """Create an em size."""
         return cls(value, "em")
 
     @classmethod
+    @lru_cache(maxsize=_INTERN_CACHE_SIZE, typed=True)
     def rem(cls, value: float) -> Size:
         """Create a rem size."""
         return cls(value, "rem")
 
     @classmethod
+    @lru_cache(maxsize=_INTERN_CACHE_SIZE, typed=True)
     def percent(cls, value: float) -> Size:
         """Create a percentage size."""
         return cls(value, "%")
@@ -189,16 +259,19 @@ class Size(CSSValue):
         return cls(value, "fr")
 
     @classmethod
+    @lru_cache(maxsize=_INTERN_CACHE_SIZE, typed=True)
     def auto(cls) -> Size:
         """Create an 'auto' size."""
         return cls("auto")
 
     @classmethod
+    @lru_cache(maxsize=_INTERN_CACHE_SIZE, typed=True)
     def none(cls) -> Size:
         """Create a 'none' size."""
         return cls("none")
 
     @classmethod
+    @lru_cache(maxsize=_INTERN_CACHE_SIZE, typed=True)
     def inherit(cls) -> Size:
         """Create an 'inherit' size."""
         return cls("inherit")
@@ -263,20 +336,29 @@ class Size(CSSValue):
         return cls(25, "%")
 
     def __eq__(self, other: object) -> bool:
+        # Interned factories make identity the most common match
+        if self is other:
+            return True
         if isinstance(other, Size):
             return self._value == other._value and self._unit == other._unit
         if isinstance(other, str):
-            return self.to_css() == other
+            return self._css == other
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash((self._value, self._unit))
+        return self._hash
 
 
 # =============================================================================
 # Color Class
 # =============================================================================
 
+# Translation table that deletes hex digits, for one-pass hex validation
+_DROP_HEX = str.maketrans("", "", "0123456789abcdefABCDEF")
+
+# rgb(), rgba(), hsl() and hsla() color functions (arguments not validated)
+_COLOR_FUNC_RE = re.compile(r"(rgba?|hsla?)\s*\((.+)\)$")
+
 
 class Color(CSSValue):
     """Represents a CSS color value.
@@ -294,36 +376,40 @@ class Color(CSSValue):
         Color('rgba(255, 128, 0, 0.5)')
     """
 
+    __slots__ = ("_value", "_key", "_hash")
+
     # Named CSS colors (subset of most common)
-    NAMED_COLORS: ClassVar[set[str]] = {
-        "black",
-        "white",
-        "red",
-        "green",
-        "blue",
-        "yellow",
-        "cyan",
-        "magenta",
-        "gray",
-        "grey",
-        "orange",
-        "pink",
-        "purple",
-        "brown",
-        "navy",
-        "teal",
-        "olive",
-        "maroon",
-        "aqua",
-        "fuchsia",
-        "lime",
-        "silver",
-        "transparent",
-        "currentcolor",
-        "inherit",
-        "initial",
-        "unset",
-    }
+    NAMED_COLORS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "black",
+            "white",
+            "red",
+            "green",
+            "blue",
+            "yellow",
+            "cyan",
+            "magenta",
+            "gray",
+            "grey",
+            "orange",
+            "pink",
+            "purple",
+            "brown",
+            "navy",
+            "teal",
+            "olive",
+            "maroon",
+            "aqua",
+            "fuchsia",
+            "lime",
+            "silver",
+            "transparent",
+            "currentcolor",
+            "inherit",
+            "initial",
+            "unset",
+        }
+    )
 
     # Class-level color instances (set after class definition)
     transparent: ClassVar[Color]
@@ -366,7 +452,21 @@ class Color(CSSValue):
         Raises:
             ValueError: If the color format is invalid.
         """
-        self._value = self._validate(value.strip())
+        self._set_value(self._validate(value.strip()))
+
+    def _set_value(self, value: str) -> None:
+        """Store a validated CSS color string and its normalised key."""
+        self._value = value
+        # Colors compare case-insensitively; normalise once for eq/hash
+        self._key = value.lower()
+        self._hash = hash(self._key)
+
+    @classmethod
+    def _from_css(cls, value: str) -> Color:
+        """Create a Color from CSS text the caller has already validated."""
+        color = cls.__new__(cls)
+        color._set_value(value)
+        return color
 
     def _validate(self, value: str) -> str:
         """Validate and normalize a color value."""
@@ -379,14 +479,13 @@ class Color(CSSValue):
         # Hex colors
         if value.startswith("#"):
             hex_part = value[1:]
-            valid_hex = all(c in "0123456789abcdefABCDEF" for c in hex_part)
-            if len(hex_part) in (3, 4, 6, 8) and valid_hex:
+            # Deleting every hex digit leaves "" only for a valid code
+            if len(hex_part) in (3, 4, 6, 8) and not hex_part.translate(_DROP_HEX):
                 return value
             raise ValueError(f"Invalid hex color: '{value}'")
 
         # rgb/rgba/hsl/hsla functions
-        func_match = re.match(r"^(rgba?|hsla?)\s*\((.+)\)$", lower)
-        if func_match:
+        if _COLOR_FUNC_RE.match(lower):
             return value  # Accept as-is, browser will validate
 
         raise ValueError(
@@ -400,6 +499,7 @@ class Color(CSSValue):
 
     # Factory methods
     @classmethod
+    @lru_cache(maxsize=_INTERN_CACHE_SIZE, typed=True)
     def hex(cls, code: str) -> Color:
         """Create a color from a hex code.
 
@@ -411,6 +511,7 @@ class Color(CSSValue):
         return cls(code)
 
     @classmethod
+    @lru_cache(maxsize=_INTERN_CACHE_SIZE, typed=True)
     def rgb(cls, r: int, g: int, b: int) -> Color:
         """Create an RGB color.
 
@@ -422,9 +523,10 @@ class Color(CSSValue):
         for name, val in [("r", r), ("g", g), ("b", b)]:
             if not 0 <= val <= 255:
                 raise ValueError(f"{name} must be 0-255, got {val}")
-        return cls(f"rgb({r}, {g}, {b})")
+        return cls._from_css(f"rgb({r}, {g}, {b})")
 
     @classmethod
+    @lru_cache(maxsize=_INTERN_CACHE_SIZE, typed=True)
     def rgba(cls, r: int, g: int, b: int, a: float) -> Color:
         """Create an RGBA color with alpha.
 
@@ -439,9 +541,10 @@ class Color(CSSValue):
                 raise ValueError(f"{name} must be 0-255, got {val}")
         if not 0.0 <= a <= 1.0:
             raise ValueError(f"alpha must be 0.0-1.0, got {a}")
-        return cls(f"rgba({r}, {g}, {b}, {a})")
+        return cls._from_css(f"rgba({r}, {g}, {b}, {a})")
 
     @classmethod
+    @lru_cache(maxsize=_INTERN_CACHE_SIZE, typed=True)
     def hsl(cls, h: int, s: int, lightness: int) -> Color:
         """Create an HSL color.
 
@@ -456,9 +559,10 @@ class Color(CSSValue):
             raise ValueError(f"saturation must be 0-100, got {s}")
         if not 0 <= lightness <= 100:
             raise ValueError(f"lightness must be 0-100, got {lightness}")
-        return cls(f"hsl({h}, {s}%, {lightness}%)")
+        return cls._from_css(f"hsl({h}, {s}%, {lightness}%)")
 
     @classmethod
+    @lru_cache(maxsize=_INTERN_CACHE_SIZE, typed=True)
     def hsla(cls, h: int, s: int, lightness: int, a: float) -> Color:
         """Create an HSLA color with alpha.
 
@@ -476,17 +580,19 @@ class Color(CSSValue):
             raise ValueError(f"lightness must be 0-100, got {lightness}")
         if not 0.0 <= a <= 1.0:
             raise ValueError(f"alpha must be 0.0-1.0, got {a}")
-        return cls(f"hsla({h}, {s}%, {lightness}%, {a})")
+        return cls._from_css(f"hsla({h}, {s}%, {lightness}%, {a})")
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if isinstance(other, Color):
-            return self._value.lower() == other._value.lower()
+            return self._key == other._key
         if isinstance(other, str):
-            return self._value.lower() == other.lower()
+            return self._key == other.lower()
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self._value.lower())
+        return self._hash
 
 
 # Named color class attributes (for Color.red, Color.blue, etc.)
@@ -524,13 +630,20 @@ Color.muted = Color("#6b7280")
 Color.light_gray = Color("#f5f5f5")
 Color.dark_gray = Color("#374151")
 
+# Plain color names passed to Border(), etc. resolve to the shared constants
+_NAMED_COLOR_CONSTANTS: dict[str, Color] = {
+    name: getattr(Color, name)
+    for name in Color.NAMED_COLORS
+    if isinstance(getattr(Color, name, None), Color)
+}
+
 
 # =============================================================================
 # Text Enums
 # =============================================================================
 
 
-class FontWeight(Enum):
+class FontWeight(CSSEnum):
     """CSS font-weight values."""
 
     NORMAL = "normal"
@@ -547,29 +660,16 @@ class FontWeight(Enum):
     W800 = "800"
     W900 = "900"
 
-    def to_css(self) -> str:
-        """Return the CSS value."""
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
 
-
-class FontStyle(Enum):
+class FontStyle(CSSEnum):
     """CSS font-style values."""
 
     NORMAL = "normal"
     ITALIC = "italic"
     OBLIQUE = "oblique"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
-class TextTransform(Enum):
+class TextTransform(CSSEnum):
     """CSS text-transform values."""
 
     NONE = "none"
@@ -577,14 +677,8 @@ class TextTransform(Enum):
     LOWERCASE = "lowercase"
     CAPITALIZE = "capitalize"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
-class TextDecoration(Enum):
+class TextDecoration(CSSEnum):
     """CSS text-decoration values."""
 
     NONE = "none"
@@ -592,14 +686,8 @@ class TextDecoration(Enum):
     OVERLINE = "overline"
     LINE_THROUGH = "line-through"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
-class TextAlign(Enum):
+class TextAlign(CSSEnum):
     """CSS text-align values."""
 
     LEFT = "left"
@@ -609,19 +697,13 @@ class TextAlign(Enum):
     START = "start"
     END = "end"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
 # =============================================================================
 # Layout Enums
 # =============================================================================
 
 
-class Display(Enum):
+class Display(CSSEnum):
     """CSS display values."""
 
     BLOCK = "block"
@@ -634,14 +716,8 @@ class Display(Enum):
     NONE = "none"
     CONTENTS = "contents"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
-class FlexDirection(Enum):
+class FlexDirection(CSSEnum):
     """CSS flex-direction values."""
 
     ROW = "row"
@@ -649,28 +725,16 @@ class FlexDirection(Enum):
     COLUMN = "column"
     COLUMN_REVERSE = "column-reverse"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
-class FlexWrap(Enum):
+class FlexWrap(CSSEnum):
     """CSS flex-wrap values."""
 
     NOWRAP = "nowrap"
     WRAP = "wrap"
     WRAP_REVERSE = "wrap-reverse"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
-class AlignItems(Enum):
+class AlignItems(CSSEnum):
     """CSS align-items values."""
 
     START = "start"
@@ -681,14 +745,8 @@ class AlignItems(Enum):
     FLEX_START = "flex-start"
     FLEX_END = "flex-end"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
-class JustifyContent(Enum):
+class JustifyContent(CSSEnum):
     """CSS justify-content values."""
 
     START = "start"
@@ -701,14 +759,8 @@ class JustifyContent(Enum):
     FLEX_START = "flex-start"
     FLEX_END = "flex-end"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
-class Position(Enum):
+class Position(CSSEnum):
     """CSS position values."""
 
     STATIC = "static"
@@ -717,14 +769,8 @@ class Position(Enum):
     FIXED = "fixed"
     STICKY = "sticky"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
-class Overflow(Enum):
+class Overflow(CSSEnum):
     """CSS overflow values."""
 
     VISIBLE = "visible"
@@ -733,14 +779,8 @@ class Overflow(Enum):
     AUTO = "auto"
     CLIP = "clip"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
-class JustifyItems(Enum):
+class JustifyItems(CSSEnum):
     """CSS justify-items values for grid containers."""
 
     START = "start"
@@ -749,14 +789,8 @@ class JustifyItems(Enum):
     STRETCH = "stretch"
     BASELINE = "baseline"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
-class AlignContent(Enum):
+class AlignContent(CSSEnum):
     """CSS align-content values for multi-line flex/grid containers."""
 
     START = "start"
@@ -767,14 +801,8 @@ class AlignContent(Enum):
     SPACE_AROUND = "space-around"
     SPACE_EVENLY = "space-evenly"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
-class GridAutoFlow(Enum):
+class GridAutoFlow(CSSEnum):
     """CSS grid-auto-flow values."""
 
     ROW = "row"
@@ -782,14 +810,8 @@ class GridAutoFlow(Enum):
     ROW_DENSE = "row dense"
     COLUMN_DENSE = "column dense"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
-class PlaceItems(Enum):
+class PlaceItems(CSSEnum):
     """CSS place-items shorthand (align + justify)."""
 
     START = "start"
@@ -797,14 +819,8 @@ class PlaceItems(Enum):
     CENTER = "center"
     STRETCH = "stretch"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
-class ShadowSize(Enum):
+class ShadowSize(CSSEnum):
     """Predefined box-shadow sizes for cards/containers."""
 
     NONE = "none"
@@ -814,14 +830,8 @@ class ShadowSize(Enum):
     LG = "0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -4px rgba(0, 0, 0, 0.1)"
     XL = "0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 8px 10px -6px rgba(0, 0, 0, 0.1)"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
-class RadiusSize(Enum):
+class RadiusSize(CSSEnum):
     """Predefined border-radius sizes."""
 
     NONE = "0"
@@ -833,14 +843,8 @@ class RadiusSize(Enum):
     XXL = "16px"
     FULL = "9999px"  # Fully rounded (pill shape)
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
-class DividerStyle(Enum):
+class DividerStyle(CSSEnum):
     """Divider line styles (maps to border-style)."""
 
     SOLID = "solid"
@@ -848,19 +852,13 @@ class DividerStyle(Enum):
     DOTTED = "dotted"
     DOUBLE = "double"
 
-    def to_css(self) -> str:
-        return self.value
-
-    def __str__(self) -> str:
-        return self.value
-
 
 # =============================================================================
 # Border Enum and Class
 # =============================================================================
 
 
-class BorderStyle(Enum):
+class BorderStyle(CSSEnum):
     """CSS border-style values."""
 
     NONE = "none"
@@ -874,11 +872,37 @@ class BorderStyle(Enum):
     OUTSET = "outset"
     HIDDEN = "hidden"
 
-    def to_css(self) -> str:
-        return self.value
 
-    def __str__(self) -> str:
-        return self.value
+def _as_size(value: Size | str | int | float) -> Size:
+    """Normalize a width/spacing argument to a Size.
+
+    Already-built Size instances are returned unchanged; numbers are pixels.
+    """
+    if isinstance(value, Size):
+        return value
+    if isinstance(value, (int, float)):
+        return Size.px(value)
+    return Size(value)
+
+
+def _as_color(value: Color | str) -> Color:
+    """Normalize a color argument to a Color, reusing Color instances."""
+    if type(value) is Color or not isinstance(value, str):
+        return value
+    named = _NAMED_COLOR_CONSTANTS.get(value)
+    if named is not None:
+        return named
+    return Color(value)
+
+
+def _as_border_style(value: BorderStyle | str) -> BorderStyle:
+    """Normalize a border style argument to a BorderStyle member."""
+    if not isinstance(value, str):
+        return value
+    try:
+        return BorderStyle(value)
+    except ValueError:
+        raise ValueError(f"Invalid border style: '{value}'")
 
 
 class Border(CSSValue):
@@ -893,6 +917,8 @@ class Border(CSSValue):
         Border('2px dashed blue')
     """
 
+    __slots__ = ("_width", "_style", "_color", "_css", "_hash")
+
     def __init__(
         self,
         width: Size | str | int | float = "1px",
@@ -906,32 +932,17 @@ class Border(CSSValue):
             style: Border style (BorderStyle enum or string)
             color: Border color (Color or string)
         """
-        # Normalize width
-        if isinstance(width, (int, float)):
-            self._width = Size.px(width)
-        elif isinstance(width, str):
-            self._width = Size(width)
-        else:
-            self._width = width
-
-        # Normalize style
-        if isinstance(style, str):
-            try:
-                self._style = BorderStyle(style)
-            except ValueError:
-                raise ValueError(f"Invalid border style: '{style}'")
-        else:
-            self._style = style
+        self._width = _as_size(width)
+        self._style = _as_border_style(style)
+        self._color = _as_color(color)
 
-        # Normalize color
-        if isinstance(color, str):
-            self._color = Color(color)
-        else:
-            self._color = color
+        # Border is immutable, so the shorthand and hash are computed once
+        self._css = f"{self._width.to_css()} {self._style.css} {self._color.to_css()}"
+        self._hash = hash((self._width, self._style, self._color))
 
     def to_css(self) -> str:
         """Return the CSS border shorthand."""
-        return f"{self._width.to_css()} {self._style.to_css()} {self._color.to_css()}"
+        return self._css
 
     @property
     def width_value(self) -> Size:
@@ -1002,7 +1013,7 @@ class Border(CSSValue):
             >>> Border.solid(2, "red")
             Border('2px solid red')
         """
-        return cls(width, BorderStyle.SOLID, color)
+        return cls._intern(width, BorderStyle.SOLID, color)
 
     @classmethod
     def dashed(
@@ -1020,7 +1031,7 @@ class Border(CSSValue):
             >>> Border.dashed(2, "blue")
             Border('2px dashed blue')
         """
-        return cls(width, BorderStyle.DASHED, color)
+        return cls._intern(width, BorderStyle.DASHED, color)
 
     @classmethod
     def dotted(
@@ -1036,7 +1047,7 @@ class Border(CSSValue):
             >>> Border.dotted()
             Border('1px dotted black')
         """
-        return cls(width, BorderStyle.DOTTED, color)
+        return cls._intern(width, BorderStyle.DOTTED, color)
 
     @classmethod
     def double(
@@ -1052,9 +1063,38 @@ class Border(CSSValue):
             >>> Border.double()
             Border('3px double black')
         """
-        return cls(width, BorderStyle.DOUBLE, color)
+        return cls._intern(width, BorderStyle.DOUBLE, color)
+
+    @classmethod
+    def _intern(
+        cls,
+        width: Size | str | int | float,
+        style: BorderStyle | str,
+        color: Color | str,
+    ) -> Border:
+        """Return a shared Border for these arguments.
+
+        A Color is keyed on its exact CSS text: Color equality ignores case,
+        so keying on the object would hand back a Border built from another
+        spelling of the same color.
+        """
+        if isinstance(color, Color):
+            color = color.to_css()
+        return cls._interned(width, style, color)
+
+    @classmethod
+    @lru_cache(maxsize=_INTERN_CACHE_SIZE, typed=True)
+    def _interned(
+        cls,
+        width: Size | str | int | float,
+        style: BorderStyle | str,
+        color: str,
+    ) -> Border:
+        """Build a Border once per distinct argument set (see _intern())."""
+        return cls(width, style, color)
 
     @classmethod
+    @lru_cache(maxsize=_INTERN_CACHE_SIZE, typed=True)
     def none(cls) -> Border:
         """Create a border with no visible style.
 
@@ -1084,7 +1124,7 @@ class Border(CSSValue):
             >>> Border.thin("red")
             Border('1px solid red')
         """
-        return cls(1, style, color)
+        return cls._intern(1, style, color)
 
     @classmethod
     def medium(
@@ -1100,7 +1140,7 @@ class Border(CSSValue):
             >>> Border.medium()
             Border('2px solid black')
         """
-        return cls(2, style, color)
+        return cls._intern(2, style, color)
 
     @classmethod
     def thick(
@@ -1118,9 +1158,11 @@ class Border(CSSValue):
             >>> Border.thick("navy")
             Border('4px solid navy')
         """
-        return cls(4, style, color)
+        return cls._intern(4, style, color)
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if isinstance(other, Border):
             return (
                 self._width == other._width
@@ -1128,11 +1170,11 @@ class Border(CSSValue):
                 and self._color == other._color
             )
         if isinstance(other, str):
-            return self.to_css() == other
+            return self._css == other
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash((self._width, self._style, self._color))
+        return self._hash
 
 
 # =============================================================================
@@ -1152,6 +1194,8 @@ class Spacing(CSSValue):
         Spacing('1px 2px 3px 4px')
     """
 
+    __slots__ = ("_edges", "_css")
+
     def __init__(
         self,
         top: Size | str | int | float,
@@ -1167,69 +1211,74 @@ class Spacing(CSSValue):
             bottom: Bottom value
             left: Left value
         """
-        self._top = self._normalize(top)
-        self._right = self._normalize(right) if right is not None else None
-        self._bottom = self._normalize(bottom) if bottom is not None else None
-        self._left = self._normalize(left) if left is not None else None
-
-    def _normalize(self, value: Size | str | int | float) -> Size:
-        """Normalize a value to Size."""
-        if isinstance(value, Size):
-            return value
-        if isinstance(value, (int, float)):
-            return Size.px(value)
-        return Size(value)
+        top_size = _as_size(top)
+        right_size = _as_size(right) if right is not None else None
+        bottom_size = _as_size(bottom) if bottom is not None else None
+        left_size = _as_size(left) if left is not None else None
+
+        # Spacing is immutable, so the CSS value is formatted once up front
+        self._css = self._format_css(top_size, right_size, bottom_size, left_size)
+
+        # Resolve omitted edges once, following the CSS shorthand rules
+        if right_size is None:
+            right_size = top_size
+        self._edges: tuple[Size, Size, Size, Size] = (
+            top_size,
+            right_size,
+            bottom_size if bottom_size is not None else top_size,
+            left_size if left_size is not None else right_size,
+        )
 
     def to_css(self) -> str:
         """Return the CSS spacing value."""
-        if self._right is None:
+        return self._css
+
+    @staticmethod
+    def _format_css(
+        top: Size, right: Size | None, bottom: Size | None, left: Size | None
+    ) -> str:
+        """Format the 1-4 given edge values as a CSS spacing string."""
+        if right is None:
             # Single value: all sides
-            return self._top.to_css()
-        if self._bottom is None:
+            return top._css
+        if bottom is None:
             # Two values: vertical horizontal
-            return f"{self._top.to_css()} {self._right.to_css()}"
-        if self._left is None:
+            return f"{top._css} {right._css}"
+        if left is None:
             # Three values: top horizontal bottom
-            top = self._top.to_css()
-            right = self._right.to_css()
-            bottom = self._bottom.to_css()
-            return f"{top} {right} {bottom}"
+            return f"{top._css} {right._css} {bottom._css}"
         # Four values: top right bottom left
-        top = self._top.to_css()
-        right = self._right.to_css()
-        bottom = self._bottom.to_css()
-        left = self._left.to_css()
-        return f"{top} {right} {bottom} {left}"
+        return f"{top._css} {right._css} {bottom._css} {left._css}"
 
     @property
     def top(self) -> Size:
         """Top spacing."""
-        return self._top
+        return self._edges[0]
 
     @property
     def right(self) -> Size:
         """Right spacing (same as top if not specified)."""
-        return self._right if self._right is not None else self._top
+        return self._edges[1]
 
     @property
     def bottom(self) -> Size:
         """Bottom spacing (same as top if not specified)."""
-        return self._bottom if self._bottom is not None else self._top
+        return self._edges[2]
 
     @property
     def left(self) -> Size:
         """Left spacing (same as right if not specified)."""
-        if self._left is not None:
-            return self._left
-        return self._right if self._right is not None else self._top
+        return self._edges[3]
 
     # Factory methods
     @classmethod
+    @lru_cache(maxsize=_INTERN_CACHE_SIZE, typed=True)
     def all(cls, value: Size | str | int | float) -> Spacing:
         """Create uniform spacing on all sides."""
         return cls(value)
 
     @classmethod
+    @lru_cache(maxsize=_INTERN_CACHE_SIZE, typed=True)
     def symmetric(
         cls,
         vertical: Size | str | int | float,
@@ -1328,14 +1377,16 @@ class Spacing(CSSValue):
         return cls(16, 24)
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if isinstance(other, Spacing):
-            return self.to_css() == other.to_css()
+            return self._css == other._css
         if isinstance(other, str):
-            return self.to_css() == other
+            return self._css == other
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self.to_css())
+        return hash(self._css)
 
 
 # =============================================================================
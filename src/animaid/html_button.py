@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import html
 import threading
 from collections.abc import Callable
-from typing import Self
+from typing import ClassVar, Self
+
+from animaid.html_object import _escape, _escape_str, _join_styles
 
 
 class HTMLButton:
@@ -25,6 +26,16 @@ class HTMLButton:
         ...     app.add(HTMLButton("Click").on_click(on_click))
     """
 
+    # Style tables for the sizing presets, built once per class
+    _LARGE_PRESET: ClassVar[dict[str, str]] = {
+        "font-size": "18px",
+        "padding": "14px 28px",
+    }
+    _SMALL_PRESET: ClassVar[dict[str, str]] = {
+        "font-size": "12px",
+        "padding": "6px 12px",
+    }
+
     def __init__(self, label: str) -> None:
         """Create a button with the given label.
 
@@ -73,12 +84,12 @@ class HTMLButton:
             A string containing valid HTML for the button.
         """
         attrs = self._build_attributes()
-        escaped_label = html.escape(self._label)
+        escaped_label = _escape_str(self._label)
 
         # Add data-anim-id for event handling
         anim_id_attr = ""
         if self._anim_id:
-            anim_id_attr = f' data-anim-id="{html.escape(self._anim_id)}"'
+            anim_id_attr = f' data-anim-id="{_escape(self._anim_id)}"'
 
         if attrs:
             return f"<button {attrs}{anim_id_attr}>{escaped_label}</button>"
@@ -100,17 +111,18 @@ class HTMLButton:
         Returns:
             A new instance with the combined styles.
         """
+        return self._with_styles(
+            {key.replace("_", "-"): value for key, value in styles.items()}
+        )
+
+    def _with_styles(self, styles: dict[str, str]) -> HTMLButton:
+        """Return a copy with CSS-named styles merged over the current ones."""
         new_button = HTMLButton(self._label)
         new_button._on_click = self._on_click
         new_button._anim_id = self._anim_id
-        new_button._styles = dict(self._styles)
+        new_button._styles = {**self._styles, **styles}
         new_button._css_classes = list(self._css_classes)
 
-        # Add new styles, converting underscores to hyphens
-        for key, value in styles.items():
-            css_key = key.replace("_", "-")
-            new_button._styles[css_key] = value
-
         return new_button
 
     def add_class(self, *class_names: str) -> "HTMLButton":
@@ -133,7 +145,7 @@ class HTMLButton:
         """Convert internal styles dict to CSS style attribute value."""
         if not self._styles:
             return ""
-        return "; ".join(f"{k}: {v}" for k, v in self._styles.items())
+        return _join_styles(tuple([(k, str(v)) for k, v in self._styles.items()]))
 
     def _build_class_string(self) -> str:
         """Convert internal classes list to CSS class attribute value."""
@@ -194,7 +206,7 @@ class HTMLButton:
         Returns:
             A new instance with large styling.
         """
-        return self.styled(font_size="18px", padding="14px 28px")
+        return self._with_styles(self._LARGE_PRESET)
 
     def small(self) -> "HTMLButton":
         """Return a copy styled with smaller text and padding.
@@ -202,4 +214,4 @@ class HTMLButton:
         Returns:
             A new instance with small styling.
         """
-        return self.styled(font_size="12px", padding="6px 12px")
+        return self._with_styles(self._SMALL_PRESET)
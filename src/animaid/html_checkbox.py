@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import html
 import threading
 from collections.abc import Callable
-from typing import Self
+from typing import ClassVar, Self
+
+from animaid.html_object import _escape, _escape_str, _join_styles
 
 
 class HTMLCheckbox:
@@ -26,6 +27,10 @@ class HTMLCheckbox:
         ...     print(terms.checked)  # True/False synced from browser
     """
 
+    # Style tables for the sizing presets, built once per class
+    _LARGE_PRESET: ClassVar[dict[str, str]] = {"font-size": "18px"}
+    _SMALL_PRESET: ClassVar[dict[str, str]] = {"font-size": "12px"}
+
     def __init__(
         self,
         label: str,
@@ -112,13 +117,13 @@ class HTMLCheckbox:
             A string containing valid HTML for the checkbox.
         """
         attrs = self._build_attributes()
-        escaped_label = html.escape(self._label)
+        escaped_label = _escape_str(self._label)
         checked_attr = " checked" if self._value else ""
 
         # Add data-anim-id for event handling
         anim_id_attr = ""
         if self._anim_id:
-            anim_id_attr = f' data-anim-id="{html.escape(self._anim_id)}"'
+            anim_id_attr = f' data-anim-id="{_escape(self._anim_id)}"'
 
         checkbox_html = (
             f'<input type="checkbox" class="anim-checkbox"{anim_id_attr}{checked_attr}>'
@@ -142,17 +147,18 @@ class HTMLCheckbox:
         Returns:
             A new instance with the combined styles.
         """
+        return self._with_styles(
+            {key.replace("_", "-"): value for key, value in styles.items()}
+        )
+
+    def _with_styles(self, styles: dict[str, str]) -> HTMLCheckbox:
+        """Return a copy with CSS-named styles merged over the current ones."""
         new_checkbox = HTMLCheckbox(self._label, self._value)
         new_checkbox._on_change = self._on_change
         new_checkbox._anim_id = self._anim_id
-        new_checkbox._styles = dict(self._styles)
+        new_checkbox._styles = {**self._styles, **styles}
         new_checkbox._css_classes = list(self._css_classes)
 
-        # Add new styles, converting underscores to hyphens
-        for key, value in styles.items():
-            css_key = key.replace("_", "-")
-            new_checkbox._styles[css_key] = value
-
         return new_checkbox
 
     def add_class(self, *class_names: str) -> "HTMLCheckbox":
@@ -175,7 +181,7 @@ class HTMLCheckbox:
         """Convert internal styles dict to CSS style attribute value."""
         if not self._styles:
             return ""
-        return "; ".join(f"{k}: {v}" for k, v in self._styles.items())
+        return _join_styles(tuple([(k, str(v)) for k, v in self._styles.items()]))
 
     def _build_class_string(self) -> str:
         """Convert internal classes list to CSS class attribute value."""
@@ -204,7 +210,7 @@ class HTMLCheckbox:
         Returns:
             A new instance with large styling.
         """
-        return self.styled(font_size="18px")
+        return self._with_styles(self._LARGE_PRESET)
 
     def small(self) -> "HTMLCheckbox":
         """Return a copy with smaller text and checkbox.
@@ -212,4 +218,4 @@ class HTMLCheckbox:
         Returns:
             A new instance with small styling.
         """
-        return self.styled(font_size="12px")
+        return self._with_styles(self._SMALL_PRESET)
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import html
 import uuid
 from enum import Enum
-from typing import Any, Self
+from functools import lru_cache
+from typing import Any, ClassVar, Self
 
 from animaid.css_types import (
     BorderValue,
@@ -14,7 +14,13 @@ from animaid.css_types import (
     SizeValue,
     SpacingValue,
 )
-from animaid.html_object import HTMLObject
+from animaid.html_object import (
+    _PLAIN_TYPES,
+    HTMLObject,
+    _escape,
+    _join_styles,
+    _open_tag,
+)
 
 
 def _to_css(value: object) -> str:
@@ -31,6 +37,11 @@ class DictFormat(Enum):
     TABLE = "table"  # <table><tr><td>key</td><td>value</td></tr></table>
     DIVS = "divs"  # Flexbox divs
 
+    # Members are singletons compared by identity, so the identity hash is
+    # consistent with equality and avoids Enum's Python-level __hash__ when
+    # used in template cache keys.
+    __hash__ = object.__hash__
+
 
 class DictLayout(Enum):
     """Layout direction for dictionary entries."""
@@ -39,6 +50,55 @@ class DictLayout(Enum):
     HORIZONTAL = "horizontal"  # Entries side by side
     GRID = "grid"  # Grid layout
 
+    __hash__ = object.__hash__  # see DictFormat
+
+
+# Tag names per format: (container, key, value, row wrapper or "")
+_FORMAT_TAGS: dict[DictFormat, tuple[str, str, str, str]] = {
+    DictFormat.DEFINITION_LIST: ("dl", "dt", "dd", ""),
+    DictFormat.TABLE: ("table", "td", "td", "tr"),
+    DictFormat.DIVS: ("div", "div", "div", ""),
+}
+
+
+@lru_cache(maxsize=256)
+def _compile_template(
+    fmt: DictFormat,
+    attrs: str,
+    key_attrs: str,
+    value_attrs: str,
+    last_value_attrs: str,
+    separator: str,
+    show_keys: bool,
+) -> tuple[str, str, str, str, str, str]:
+    """Build the constant fragments of a rendered dictionary.
+
+    Each entry renders as ``key_open + key + mid + value + tail`` (or
+    ``mid + value + tail`` when keys are hidden), with ``last_mid`` used
+    for the final entry. Adjacent literal fragments are merged, so a
+    render only interleaves escaped keys and rendered values with them.
+
+    Returns:
+        Tuple of (open_tag, key_open, mid, last_mid, tail, close_tag).
+    """
+    container, key_tag, value_tag, row_tag = _FORMAT_TAGS[fmt]
+    row_open = f"<{row_tag}>" if row_tag else ""
+    row_close = f"</{row_tag}>" if row_tag else ""
+    if show_keys:
+        key_open = row_open + _open_tag(key_tag, key_attrs)
+        key_close = f"{separator}</{key_tag}>"
+    else:
+        key_open = ""
+        key_close = row_open
+    return (
+        _open_tag(container, attrs),
+        key_open,
+        key_close + _open_tag(value_tag, value_attrs),
+        key_close + _open_tag(value_tag, last_value_attrs),
+        f"</{value_tag}>{row_close}",
+        f"</{container}>",
+    )
+
 
 class HTMLDict(HTMLObject, dict):
     """A dict subclass that renders as styled HTML.
@@ -74,6 +134,9 @@ class HTMLDict(HTMLObject, dict):
     _show_keys: bool
     _obs_id: str
 
+    # grid-template-columns values by column count, shared by all instances
+    _GRID_TEMPLATES: ClassVar[dict[int, str]] = {}
+
     def __init__(
         self, data: dict[Any, Any] | None = None, **styles: str | CSSValue
     ) -> None:
@@ -103,15 +166,6 @@ class HTMLDict(HTMLObject, dict):
             css_key = key.replace("_", "-")
             self._styles[css_key] = _to_css(value)
 
-    def _notify(self) -> None:
-        """Publish change notification via pypubsub."""
-        try:
-            from pubsub import pub
-
-            pub.sendMessage("animaid.changed", obs_id=self._obs_id)
-        except ImportError:
-            pass  # pypubsub not installed
-
     def _copy_with_settings(
         self,
         new_styles: dict[str, str] | None = None,
@@ -656,24 +710,27 @@ class HTMLDict(HTMLObject, dict):
         Returns:
             HTML string for the value.
         """
+        # Plain strings are the common case; checking the exact type first
+        # skips the comparatively slow ABC isinstance() check below.
+        if type(item) is str:
+            return _escape(item)
         if isinstance(item, HTMLObject):
             return item.render()
-        elif isinstance(item, str):
-            return html.escape(item)
-        else:
-            return html.escape(str(item))
+        # str() also turns str subclasses into exact strings, so only plain
+        # str values ever become escape-cache keys
+        return _escape(str(item))
 
     def _build_key_style_string(self) -> str:
         """Build CSS style string for keys."""
         if not self._key_styles:
             return ""
-        return "; ".join(f"{k}: {v}" for k, v in self._key_styles.items())
+        return _join_styles(tuple(self._key_styles.items()))
 
     def _build_value_style_string(self) -> str:
         """Build CSS style string for values."""
         if not self._value_styles:
             return ""
-        return "; ".join(f"{k}: {v}" for k, v in self._value_styles.items())
+        return _join_styles(tuple(self._value_styles.items()))
 
     def _build_key_attributes(self) -> str:
         """Build attribute string for key elements."""
@@ -701,7 +758,7 @@ class HTMLDict(HTMLObject, dict):
                 styles["border-bottom"] = self._entry_separator
 
         if styles:
-            style_str = "; ".join(f"{k}: {v}" for k, v in styles.items())
+            style_str = _join_styles(tuple(styles.items()))
             parts.append(f'style="{style_str}"')
 
         return " ".join(parts)
@@ -719,114 +776,60 @@ class HTMLDict(HTMLObject, dict):
                 styles.setdefault("display", "grid")
                 # Each entry is key + value, so multiply columns by 2
                 cols = self._grid_columns * 2 if self._show_keys else self._grid_columns
-                styles.setdefault("grid-template-columns", f"repeat({cols}, auto)")
+                template = self._GRID_TEMPLATES.get(cols)
+                if template is None:
+                    template = self._GRID_TEMPLATES[cols] = f"repeat({cols}, auto)"
+                styles.setdefault("grid-template-columns", template)
             else:
                 styles.setdefault("display", "flex")
                 styles.setdefault("flex-direction", "column")
 
         return styles
 
-    def _render_as_definition_list(self) -> str:
-        """Render as a definition list."""
-        container_styles = self._get_container_styles()
-        self._styles = container_styles
-
-        attrs = self._build_attributes()
-        key_attrs = self._build_key_attributes()
-        total = len(self)
-
-        items_html = []
-        for i, (key, value) in enumerate(self.items()):
-            key_html = html.escape(str(key))
-            value_html = self._render_item(value)
-            value_attrs = self._build_value_attributes(i, total)
-
-            if self._key_value_separator:
-                key_html += self._key_value_separator
-
-            if self._show_keys:
-                if key_attrs:
-                    items_html.append(f"<dt {key_attrs}>{key_html}</dt>")
-                else:
-                    items_html.append(f"<dt>{key_html}</dt>")
+    def _template(self, total: int) -> tuple[str, str, str, str, str, str]:
+        """Return the literal fragments for rendering ``total`` entries."""
+        self._styles = self._get_container_styles()
+        return _compile_template(
+            self._format,
+            self._build_attributes(),
+            self._build_key_attributes(),
+            self._build_value_attributes(0, total),
+            self._build_value_attributes(total - 1, total),
+            self._key_value_separator,
+            self._show_keys,
+        )
+
+    def _render_into(self, out: list[str]) -> None:
+        """Append this dictionary's HTML fragments to a shared output list.
+
+        Nested HTML objects write into the same list rather than returning
+        a string that would then be copied into this one.
 
-            if value_attrs:
-                items_html.append(f"<dd {value_attrs}>{value_html}</dd>")
-            else:
-                items_html.append(f"<dd>{value_html}</dd>")
-
-        if attrs:
-            return f"<dl {attrs}>{''.join(items_html)}</dl>"
-        return f"<dl>{''.join(items_html)}</dl>"
-
-    def _render_as_table(self) -> str:
-        """Render as a table."""
-        container_styles = self._get_container_styles()
-        self._styles = container_styles
-
-        attrs = self._build_attributes()
-        key_attrs = self._build_key_attributes()
-        total = len(self)
-
-        rows_html = []
-        for i, (key, value) in enumerate(self.items()):
-            key_html = html.escape(str(key))
-            value_html = self._render_item(value)
-            value_attrs = self._build_value_attributes(i, total)
-
-            if self._key_value_separator:
-                key_html += self._key_value_separator
-
-            row_parts = []
-            if self._show_keys:
-                if key_attrs:
-                    row_parts.append(f"<td {key_attrs}>{key_html}</td>")
-                else:
-                    row_parts.append(f"<td>{key_html}</td>")
-
-            if value_attrs:
-                row_parts.append(f"<td {value_attrs}>{value_html}</td>")
-            else:
-                row_parts.append(f"<td>{value_html}</td>")
-
-            rows_html.append(f"<tr>{''.join(row_parts)}</tr>")
-
-        if attrs:
-            return f"<table {attrs}>{''.join(rows_html)}</table>"
-        return f"<table>{''.join(rows_html)}</table>"
-
-    def _render_as_divs(self) -> str:
-        """Render as flexbox divs."""
-        container_styles = self._get_container_styles()
-        self._styles = container_styles
-
-        attrs = self._build_attributes()
-        key_attrs = self._build_key_attributes()
+        Args:
+            out: List of HTML fragments being accumulated.
+        """
         total = len(self)
-
-        items_html = []
+        if total == 0:
+            out.append(self.render())
+            return
+
+        show_keys = self._show_keys
+        open_tag, key_open, mid, last_mid, tail, close_tag = self._template(total)
+        render_item = self._render_item
+        last = total - 1
+        append = out.append
+        append(open_tag)
         for i, (key, value) in enumerate(self.items()):
-            key_html = html.escape(str(key))
-            value_html = self._render_item(value)
-            value_attrs = self._build_value_attributes(i, total)
-
-            if self._key_value_separator:
-                key_html += self._key_value_separator
-
-            if self._show_keys:
-                if key_attrs:
-                    items_html.append(f"<div {key_attrs}>{key_html}</div>")
-                else:
-                    items_html.append(f"<div>{key_html}</div>")
-
-            if value_attrs:
-                items_html.append(f"<div {value_attrs}>{value_html}</div>")
+            if show_keys:
+                append(key_open)
+                append(_escape(str(key)))
+            append(last_mid if i == last else mid)
+            if type(value) is not str and isinstance(value, HTMLObject):
+                value._render_into(out)
             else:
-                items_html.append(f"<div>{value_html}</div>")
-
-        if attrs:
-            return f"<div {attrs}>{''.join(items_html)}</div>"
-        return f"<div>{''.join(items_html)}</div>"
+                append(render_item(value))
+            append(tail)
+        append(close_tag)
 
     def render(self) -> str:
         """Return HTML representation of this dictionary.
@@ -834,7 +837,8 @@ class HTMLDict(HTMLObject, dict):
         Returns:
             A string containing valid HTML.
         """
-        if len(self) == 0:
+        total = len(self)
+        if total == 0:
             if self._format == DictFormat.DEFINITION_LIST:
                 return "<dl></dl>"
             elif self._format == DictFormat.TABLE:
@@ -842,12 +846,34 @@ class HTMLDict(HTMLObject, dict):
             else:
                 return "<div></div>"
 
-        if self._format == DictFormat.DEFINITION_LIST:
-            return self._render_as_definition_list()
-        elif self._format == DictFormat.TABLE:
-            return self._render_as_table()
+        show_keys = self._show_keys
+        open_tag, key_open, mid, last_mid, tail, close_tag = self._template(total)
+
+        # Lay out every literal fragment up front, then fill the key and
+        # value slots with slice assignment and join once.
+        # Plain str and int values are escaped inline rather than through a
+        # _render_item() call each; anything else takes the general path.
+        render_item = self._render_item
+        values = [
+            _escape(str(value)) if type(value) in _PLAIN_TYPES else render_item(value)
+            for value in self.values()
+        ]
+        if show_keys:
+            parts = [open_tag, *([key_open, "", mid, "", tail] * total), close_tag]
+            parts[2:-1:5] = [
+                _escape(key if type(key) is str else str(key)) for key in self
+            ]
+            parts[4:-1:5] = values
         else:
-            return self._render_as_divs()
+            parts = [open_tag, *([mid, "", tail] * total), close_tag]
+            parts[2:-1:3] = values
+        parts[-4] = last_mid
+        return "".join(parts)
+
+    # Jinja2 calls __html__ once per template reference; binding it straight
+    # to render() skips the extra call. The result is not cached because the
+    # dict, its styles and any nested HTML values can all change in place.
+    __html__ = render
 
     # -------------------------------------------------------------------------
     # Dict operation overrides
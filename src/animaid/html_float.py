@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import html
 import uuid
-from typing import TYPE_CHECKING, Any, Self
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, ClassVar, Self
 
 from animaid.css_types import (
     BorderValue,
@@ -13,7 +13,7 @@ from animaid.css_types import (
     SizeValue,
     SpacingValue,
 )
-from animaid.html_object import HTMLObject
+from animaid.html_object import HTMLObject, _escape, _open_tag, _styled_open_tag
 
 if TYPE_CHECKING:
     pass
@@ -26,6 +26,39 @@ def _to_css(value: object) -> str:
     return str(value)
 
 
+def _compile_format(
+    display_format: str, options: dict[str, object]
+) -> Callable[[float], str]:
+    """Specialize a display format and its options into a formatter.
+
+    Format methods call this once, so render() makes a single call to a
+    bound str.format instead of re-reading the format settings.
+
+    Args:
+        display_format: Format name ("comma", "currency", "percent", ...).
+        options: Format options collected by the format methods.
+
+    Returns:
+        A callable that formats a float for display.
+    """
+    if display_format == "comma":
+        return "{:,}".format
+    elif display_format == "currency":
+        symbol = f"{options.get('symbol', '$')}".replace("{", "{{").replace("}", "}}")
+        return f"{symbol}{{:,.{options.get('decimals', 2)}f}}".format
+    elif display_format == "percent":
+        # The "%" presentation type multiplies by 100 and appends "%"
+        return f"{{:.{options.get('decimals', 2)}%}}".format
+    elif display_format == "decimal":
+        return f"{{:.{options.get('places', 2)}f}}".format
+    elif display_format == "scientific":
+        return f"{{:.{options.get('precision', 2)}e}}".format
+    elif display_format == "significant":
+        return f"{{:.{options.get('figures', 3)}g}}".format
+    else:
+        return str
+
+
 class HTMLFloat(HTMLObject, float):
     """A float subclass that renders as styled HTML.
 
@@ -49,13 +82,58 @@ class HTMLFloat(HTMLObject, float):
         '<span>3.14</span>'
     """
 
+    __slots__ = (
+        "_styles",
+        "_css_classes",
+        "_tag",
+        "_display_format",
+        "_format_options",
+        "_formatter",
+        "_obs_id",
+        "_anim_id",
+    )
+
     _styles: dict[str, str]
     _css_classes: list[str]
     _tag: str
     _display_format: str
     _format_options: dict[str, object]
+    _formatter: Callable[[float], str]
     _obs_id: str
 
+    # Style tables for the multi-property presets, built once per class
+    _SUCCESS_PRESET: ClassVar[dict[str, str]] = {
+        "color": "#2e7d32",
+        "background-color": "#e8f5e9",
+        "padding": "2px 6px",
+        "border-radius": "4px",
+    }
+    _WARNING_PRESET: ClassVar[dict[str, str]] = {
+        "color": "#e65100",
+        "background-color": "#fff3e0",
+        "padding": "2px 6px",
+        "border-radius": "4px",
+    }
+    _ERROR_PRESET: ClassVar[dict[str, str]] = {
+        "color": "#c62828",
+        "background-color": "#ffebee",
+        "padding": "2px 6px",
+        "border-radius": "4px",
+    }
+    _INFO_PRESET: ClassVar[dict[str, str]] = {
+        "color": "#1565c0",
+        "background-color": "#e3f2fd",
+        "padding": "2px 6px",
+        "border-radius": "4px",
+    }
+    _BADGE_PRESET: ClassVar[dict[str, str]] = {
+        "background-color": "#e0e0e0",
+        "padding": "4px 10px",
+        "border-radius": "12px",
+        "font-size": "0.85em",
+        "font-weight": "500",
+    }
+
     def __new__(cls, value: float = 0.0, **styles: str | CSSValue) -> Self:
         """Create a new HTMLFloat instance.
 
@@ -81,21 +159,13 @@ class HTMLFloat(HTMLObject, float):
         self._tag = "span"
         self._display_format = "default"
         self._format_options = {}
+        self._formatter = str
         self._obs_id = str(uuid.uuid4())
 
         for key, val in styles.items():
             css_key = key.replace("_", "-")
             self._styles[css_key] = _to_css(val)
 
-    def _notify(self) -> None:
-        """Publish change notification via pypubsub."""
-        try:
-            from pubsub import pub
-
-            pub.sendMessage("animaid.changed", obs_id=self._obs_id)
-        except ImportError:
-            pass  # pypubsub not installed
-
     def _copy_with_settings(
         self,
         new_styles: dict[str, str] | None = None,
@@ -137,6 +207,9 @@ class HTMLFloat(HTMLObject, float):
             result._display_format = new_format
         if new_format_options:
             result._format_options.update(new_format_options)
+        result._formatter = _compile_format(
+            result._display_format, result._format_options
+        )
 
         return result  # type: ignore[return-value]
 
@@ -183,28 +256,7 @@ class HTMLFloat(HTMLObject, float):
 
     def _format_value(self) -> str:
         """Format the float value based on display format settings."""
-        value = float(self)
-
-        if self._display_format == "comma":
-            return f"{value:,}"
-        elif self._display_format == "currency":
-            symbol = self._format_options.get("symbol", "$")
-            decimals = self._format_options.get("decimals", 2)
-            return f"{symbol}{value:,.{decimals}f}"
-        elif self._display_format == "percent":
-            decimals = self._format_options.get("decimals", 2)
-            return f"{value * 100:.{decimals}f}%"
-        elif self._display_format == "decimal":
-            places = self._format_options.get("places", 2)
-            return f"{value:.{places}f}"
-        elif self._display_format == "scientific":
-            precision = self._format_options.get("precision", 2)
-            return f"{value:.{precision}e}"
-        elif self._display_format == "significant":
-            figures = self._format_options.get("figures", 3)
-            return f"{value:.{figures}g}"
-        else:
-            return str(value)
+        return self._formatter(float(self))
 
     def render(self) -> str:
         """Return HTML representation of this float.
@@ -212,18 +264,54 @@ class HTMLFloat(HTMLObject, float):
         Returns:
             A string containing valid HTML.
         """
-        content = html.escape(self._format_value())
-        attrs = self._build_attributes()
-
-        if attrs:
-            return f"<{self._tag} {attrs}>{content}</{self._tag}>"
+        tag = self._tag
+        formatter = self._formatter
+        if formatter is str:
+            # float.__str__ only emits digits, ".", "-", "+", "e", "inf" and
+            # "nan", so there is nothing to escape
+            content = str(float(self))
         else:
-            return f"<{self._tag}>{content}</{self._tag}>"
+            content = _escape(formatter(float(self)))
+        styles = self._styles
+        classes = self._css_classes
+        if not styles and not classes:
+            return f"<{tag}>{content}</{tag}>"
+        open_tag = _styled_open_tag(tag, tuple(styles.items()), tuple(classes))
+        return f"{open_tag}{content}</{tag}>"
+
+    def render_many(self, values: Iterable[float]) -> list[str]:
+        """Render several numbers with this float's format and styles.
+
+        The opening tag and formatter are resolved once, so this is much
+        cheaper than wrapping each value in its own HTMLFloat. Any iterable
+        of numbers works, including a NumPy array.
+
+        Args:
+            values: Numbers to render.
+
+        Returns:
+            One HTML string per value.
+
+        Examples:
+            >>> HTMLFloat(0).currency().render_many([1.5, 2000])
+            ['<span>$1.50</span>', '<span>$2,000.00</span>']
+        """
+        open_tag = _open_tag(self._tag, self._build_attributes())
+        close_tag = f"</{self._tag}>"
+        formatter = self._formatter
+        return [
+            f"{open_tag}{_escape(formatter(float(value)))}{close_tag}"
+            for value in values
+        ]
 
     # -------------------------------------------------------------------------
     # Number Formatting Methods
     # -------------------------------------------------------------------------
 
+    def _set_formatter(self) -> None:
+        """Recompile the formatter after the display format changes."""
+        self._formatter = _compile_format(self._display_format, self._format_options)
+
     def comma(self) -> Self:
         """Apply thousand separator formatting in-place.
 
@@ -232,6 +320,7 @@ class HTMLFloat(HTMLObject, float):
             '<span>1,234,567.89</span>'
         """
         self._display_format = "comma"
+        self._set_formatter()
         self._notify()
         return self
 
@@ -251,6 +340,7 @@ class HTMLFloat(HTMLObject, float):
         self._display_format = "currency"
         self._format_options["symbol"] = symbol
         self._format_options["decimals"] = decimals
+        self._set_formatter()
         self._notify()
         return self
 
@@ -270,6 +360,7 @@ class HTMLFloat(HTMLObject, float):
         """
         self._display_format = "percent"
         self._format_options["decimals"] = decimals
+        self._set_formatter()
         self._notify()
         return self
 
@@ -287,6 +378,7 @@ class HTMLFloat(HTMLObject, float):
         """
         self._display_format = "decimal"
         self._format_options["places"] = places
+        self._set_formatter()
         self._notify()
         return self
 
@@ -302,6 +394,7 @@ class HTMLFloat(HTMLObject, float):
         """
         self._display_format = "scientific"
         self._format_options["precision"] = precision
+        self._set_formatter()
         self._notify()
         return self
 
@@ -319,6 +412,7 @@ class HTMLFloat(HTMLObject, float):
         """
         self._display_format = "significant"
         self._format_options["figures"] = figures
+        self._set_formatter()
         self._notify()
         return self
 
@@ -460,47 +554,31 @@ class HTMLFloat(HTMLObject, float):
 
     def success(self) -> Self:
         """Apply success style (green) in-place."""
-        self._styles["color"] = "#2e7d32"
-        self._styles["background-color"] = "#e8f5e9"
-        self._styles["padding"] = "2px 6px"
-        self._styles["border-radius"] = "4px"
+        self._styles.update(self._SUCCESS_PRESET)
         self._notify()
         return self
 
     def warning(self) -> Self:
         """Apply warning style (orange) in-place."""
-        self._styles["color"] = "#e65100"
-        self._styles["background-color"] = "#fff3e0"
-        self._styles["padding"] = "2px 6px"
-        self._styles["border-radius"] = "4px"
+        self._styles.update(self._WARNING_PRESET)
         self._notify()
         return self
 
     def error(self) -> Self:
         """Apply error style (red) in-place."""
-        self._styles["color"] = "#c62828"
-        self._styles["background-color"] = "#ffebee"
-        self._styles["padding"] = "2px 6px"
-        self._styles["border-radius"] = "4px"
+        self._styles.update(self._ERROR_PRESET)
         self._notify()
         return self
 
     def info(self) -> Self:
         """Apply info style (blue) in-place."""
-        self._styles["color"] = "#1565c0"
-        self._styles["background-color"] = "#e3f2fd"
-        self._styles["padding"] = "2px 6px"
-        self._styles["border-radius"] = "4px"
+        self._styles.update(self._INFO_PRESET)
         self._notify()
         return self
 
     def badge(self) -> Self:
         """Apply badge/pill style in-place."""
-        self._styles["background-color"] = "#e0e0e0"
-        self._styles["padding"] = "4px 10px"
-        self._styles["border-radius"] = "12px"
-        self._styles["font-size"] = "0.85em"
-        self._styles["font-weight"] = "500"
+        self._styles.update(self._BADGE_PRESET)
         self._notify()
         return self
 
@@ -554,20 +632,25 @@ class HTMLFloat(HTMLObject, float):
     # Arithmetic Operations (always return HTMLFloat)
     # -------------------------------------------------------------------------
 
-    def _preserve_settings(self, result: HTMLFloat) -> HTMLFloat:
-        """Copy settings to a new HTMLFloat."""
+    def _respawn(self, value: float) -> HTMLFloat:
+        """Create an HTMLFloat for an arithmetic result with these settings.
+
+        Skips __init__ (and its uuid4() call), since every setting is
+        copied from self, including the observable ID.
+        """
+        result = float.__new__(HTMLFloat, value)
         result._styles = self._styles.copy()
         result._css_classes = self._css_classes.copy()
         result._tag = self._tag
         result._display_format = self._display_format
         result._format_options = self._format_options.copy()
+        result._formatter = self._formatter
         result._obs_id = self._obs_id  # Preserve ID so updates still work
         return result
 
     def __add__(self, other: int | float) -> HTMLFloat:
         """Add: HTMLFloat + number."""
-        result = HTMLFloat(float(self) + float(other))
-        return self._preserve_settings(result)
+        return self._respawn(float(self) + float(other))
 
     def __radd__(self, other: int | float) -> HTMLFloat:
         """Reverse add: number + HTMLFloat."""
@@ -575,18 +658,15 @@ class HTMLFloat(HTMLObject, float):
 
     def __sub__(self, other: int | float) -> HTMLFloat:
         """Subtract: HTMLFloat - number."""
-        result = HTMLFloat(float(self) - float(other))
-        return self._preserve_settings(result)
+        return self._respawn(float(self) - float(other))
 
     def __rsub__(self, other: int | float) -> HTMLFloat:
         """Reverse subtract: number - HTMLFloat."""
-        result = HTMLFloat(float(other) - float(self))
-        return self._preserve_settings(result)
+        return self._respawn(float(other) - float(self))
 
     def __mul__(self, other: int | float) -> HTMLFloat:
         """Multiply: HTMLFloat * number."""
-        result = HTMLFloat(float(self) * float(other))
-        return self._preserve_settings(result)
+        return self._respawn(float(self) * float(other))
 
     def __rmul__(self, other: int | float) -> HTMLFloat:
         """Reverse multiply: number * HTMLFloat."""
@@ -594,60 +674,50 @@ class HTMLFloat(HTMLObject, float):
 
     def __truediv__(self, other: int | float) -> HTMLFloat:
         """True divide: HTMLFloat / number."""
-        result = HTMLFloat(float(self) / float(other))
-        return self._preserve_settings(result)
+        return self._respawn(float(self) / float(other))
 
     def __rtruediv__(self, other: int | float) -> HTMLFloat:
         """Reverse true divide: number / HTMLFloat."""
-        result = HTMLFloat(float(other) / float(self))
-        return self._preserve_settings(result)
+        return self._respawn(float(other) / float(self))
 
     def __floordiv__(self, other: int | float) -> HTMLFloat:
         """Floor divide: HTMLFloat // number."""
-        result = HTMLFloat(float(self) // float(other))
-        return self._preserve_settings(result)
+        return self._respawn(float(self) // float(other))
 
     def __rfloordiv__(self, other: int | float) -> HTMLFloat:
         """Reverse floor divide: number // HTMLFloat."""
-        result = HTMLFloat(float(other) // float(self))
-        return self._preserve_settings(result)
+        return self._respawn(float(other) // float(self))
 
     def __mod__(self, other: int | float) -> HTMLFloat:
         """Modulo: HTMLFloat % number."""
-        result = HTMLFloat(float(self) % float(other))
-        return self._preserve_settings(result)
+        return self._respawn(float(self) % float(other))
 
     def __rmod__(self, other: int | float) -> HTMLFloat:
         """Reverse modulo: number % HTMLFloat."""
-        result = HTMLFloat(float(other) % float(self))
-        return self._preserve_settings(result)
+        return self._respawn(float(other) % float(self))
 
     def __pow__(self, other: Any) -> Any:  # type: ignore[override]
         """Power: HTMLFloat ** number."""
-        result = HTMLFloat(float(self) ** float(other))
-        return self._preserve_settings(result)
+        return self._respawn(float(self) ** float(other))
 
     def __neg__(self) -> HTMLFloat:
         """Negate: -HTMLFloat."""
-        result = HTMLFloat(-float(self))
-        return self._preserve_settings(result)
+        return self._respawn(-float(self))
 
     def __pos__(self) -> HTMLFloat:
         """Positive: +HTMLFloat."""
-        result = HTMLFloat(+float(self))
-        return self._preserve_settings(result)
+        return self._respawn(+float(self))
 
     def __abs__(self) -> HTMLFloat:
         """Absolute value: abs(HTMLFloat)."""
-        result = HTMLFloat(abs(float(self)))
-        return self._preserve_settings(result)
+        return self._respawn(abs(float(self)))
 
     def __repr__(self) -> str:
         """Return a detailed representation for debugging."""
         format_info = ""
         if self._display_format != "default":
             format_info = f", format={self._display_format!r}"
-        styles_repr = ", ".join(f"{k}={v!r}" for k, v in self._styles.items())
+        styles_repr = ", ".join([f"{k}={v!r}" for k, v in self._styles.items()])
         if styles_repr:
             return f"HTMLFloat({float(self)}{format_info}, {styles_repr})"
         return f"HTMLFloat({float(self)}{format_info})"
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import html
 import uuid
-from typing import TYPE_CHECKING, Any, Self
+from collections.abc import Iterable
+from typing import Any, ClassVar, Self
 
 from animaid.css_types import (
     BorderValue,
@@ -13,10 +13,8 @@ from animaid.css_types import (
     SizeValue,
     SpacingValue,
 )
-from animaid.html_object import HTMLObject
-
-if TYPE_CHECKING:
-    from animaid.html_float import HTMLFloat
+from animaid.html_float import HTMLFloat
+from animaid.html_object import HTMLObject, _escape, _open_tag, _styled_open_tag
 
 
 def _to_css(value: object) -> str:
@@ -26,6 +24,10 @@ def _to_css(value: object) -> str:
     return str(value)
 
 
+# Ordinal suffix by last digit; 11th, 12th and 13th are handled separately
+_ORDINAL_SUFFIXES = ("th", "st", "nd", "rd", "th", "th", "th", "th", "th", "th")
+
+
 class HTMLInt(HTMLObject, int):
     """An int subclass that renders as styled HTML.
 
@@ -54,8 +56,42 @@ class HTMLInt(HTMLObject, int):
     _tag: str
     _display_format: str
     _format_options: dict[str, object]
+    _formatted_value: str | None
     _obs_id: str
 
+    # Style tables for the multi-property presets, built once per class
+    _SUCCESS_PRESET: ClassVar[dict[str, str]] = {
+        "color": "#2e7d32",
+        "background-color": "#e8f5e9",
+        "padding": "2px 6px",
+        "border-radius": "4px",
+    }
+    _WARNING_PRESET: ClassVar[dict[str, str]] = {
+        "color": "#e65100",
+        "background-color": "#fff3e0",
+        "padding": "2px 6px",
+        "border-radius": "4px",
+    }
+    _ERROR_PRESET: ClassVar[dict[str, str]] = {
+        "color": "#c62828",
+        "background-color": "#ffebee",
+        "padding": "2px 6px",
+        "border-radius": "4px",
+    }
+    _INFO_PRESET: ClassVar[dict[str, str]] = {
+        "color": "#1565c0",
+        "background-color": "#e3f2fd",
+        "padding": "2px 6px",
+        "border-radius": "4px",
+    }
+    _BADGE_PRESET: ClassVar[dict[str, str]] = {
+        "background-color": "#e0e0e0",
+        "padding": "4px 10px",
+        "border-radius": "12px",
+        "font-size": "0.85em",
+        "font-weight": "500",
+    }
+
     def __new__(cls, value: int = 0, **styles: str | CSSValue) -> Self:
         """Create a new HTMLInt instance.
 
@@ -81,21 +117,13 @@ class HTMLInt(HTMLObject, int):
         self._tag = "span"
         self._display_format = "default"
         self._format_options = {}
+        self._formatted_value = None
         self._obs_id = str(uuid.uuid4())
 
         for key, val in styles.items():
             css_key = key.replace("_", "-")
             self._styles[css_key] = _to_css(val)
 
-    def _notify(self) -> None:
-        """Publish change notification via pypubsub."""
-        try:
-            from pubsub import pub
-
-            pub.sendMessage("animaid.changed", obs_id=self._obs_id)
-        except ImportError:
-            pass  # pypubsub not installed
-
     def _copy_with_settings(
         self,
         new_styles: dict[str, str] | None = None,
@@ -137,6 +165,7 @@ class HTMLInt(HTMLObject, int):
             result._display_format = new_format
         if new_format_options:
             result._format_options.update(new_format_options)
+        result._reset_formatted()
 
         return result  # type: ignore[return-value]
 
@@ -181,10 +210,8 @@ class HTMLInt(HTMLObject, int):
         self._notify()
         return self
 
-    def _format_value(self) -> str:
-        """Format the integer value based on display format settings."""
-        value = int(self)
-
+    def _format_value(self, value: int) -> str:
+        """Format an integer based on this object's display format settings."""
         if self._display_format == "comma":
             return f"{value:,}"
         elif self._display_format == "currency":
@@ -203,10 +230,8 @@ class HTMLInt(HTMLObject, int):
     @staticmethod
     def _to_ordinal(n: int) -> str:
         """Convert an integer to its ordinal string (1st, 2nd, 3rd, etc.)."""
-        if 11 <= abs(n) % 100 <= 13:
-            suffix = "th"
-        else:
-            suffix = {1: "st", 2: "nd", 3: "rd"}.get(abs(n) % 10, "th")
+        last_two = abs(n) % 100
+        suffix = "th" if 11 <= last_two <= 13 else _ORDINAL_SUFFIXES[last_two % 10]
         return f"{n}{suffix}"
 
     def render(self) -> str:
@@ -215,18 +240,63 @@ class HTMLInt(HTMLObject, int):
         Returns:
             A string containing valid HTML.
         """
-        content = html.escape(self._format_value())
-        attrs = self._build_attributes()
+        tag = self._tag
+        content = self._formatted_value
+        if content is None:
+            # Formatted on first render, not on construction: huge ints are
+            # valid values even past the int-to-str digit limit
+            content = self._formatted_value = _escape(self._format_value(int(self)))
+        styles = self._styles
+        classes = self._css_classes
+        if not styles and not classes:
+            return f"<{tag}>{content}</{tag}>"
+        open_tag = _styled_open_tag(tag, tuple(styles.items()), tuple(classes))
+        return f"{open_tag}{content}</{tag}>"
+
+    # Bound directly so Jinja2's __html__ lookups skip a call. Not cached:
+    # styles, classes, tag and format all change in place.
+    __html__ = render
+
+    def render_many(self, values: Iterable[int]) -> list[str]:
+        """Render several integers with this integer's format and styles.
+
+        The opening tag is built once, so this is much cheaper than wrapping
+        each value in its own HTMLInt. Any iterable of integers works,
+        including a NumPy array.
 
-        if attrs:
-            return f"<{self._tag} {attrs}>{content}</{self._tag}>"
-        else:
-            return f"<{self._tag}>{content}</{self._tag}>"
+        Args:
+            values: Integers to render.
+
+        Returns:
+            One HTML string per value.
+
+        Examples:
+            >>> HTMLInt(0).comma().render_many([1500, 2000000])
+            ['<span>1,500</span>', '<span>2,000,000</span>']
+        """
+        open_tag = _open_tag(self._tag, self._build_attributes())
+        close_tag = f"</{self._tag}>"
+        if self._display_format == "default":
+            # Plain digits and "-" never need escaping
+            return [f"{open_tag}{int(value)}{close_tag}" for value in values]
+        format_value = self._format_value
+        return [
+            f"{open_tag}{_escape(format_value(int(value)))}{close_tag}"
+            for value in values
+        ]
 
     # -------------------------------------------------------------------------
     # Number Formatting Methods
     # -------------------------------------------------------------------------
 
+    def _reset_formatted(self) -> None:
+        """Drop the formatted text after the display format changes.
+
+        The integer itself never changes, so render() formats and escapes
+        it once and reuses the text until the format changes again.
+        """
+        self._formatted_value = None
+
     def comma(self) -> Self:
         """Apply thousand separator formatting in-place.
 
@@ -235,6 +305,7 @@ class HTMLInt(HTMLObject, int):
             '<span>1,234,567</span>'
         """
         self._display_format = "comma"
+        self._reset_formatted()
         self._notify()
         return self
 
@@ -252,6 +323,7 @@ class HTMLInt(HTMLObject, int):
         """
         self._display_format = "currency"
         self._format_options["symbol"] = symbol
+        self._reset_formatted()
         self._notify()
         return self
 
@@ -263,6 +335,7 @@ class HTMLInt(HTMLObject, int):
             '<span>85%</span>'
         """
         self._display_format = "percent"
+        self._reset_formatted()
         self._notify()
         return self
 
@@ -276,6 +349,7 @@ class HTMLInt(HTMLObject, int):
             '<span>22nd</span>'
         """
         self._display_format = "ordinal"
+        self._reset_formatted()
         self._notify()
         return self
 
@@ -291,6 +365,7 @@ class HTMLInt(HTMLObject, int):
         """
         self._display_format = "padded"
         self._format_options["width"] = width
+        self._reset_formatted()
         self._notify()
         return self
 
@@ -432,47 +507,31 @@ class HTMLInt(HTMLObject, int):
 
     def success(self) -> Self:
         """Apply success style (green) in-place."""
-        self._styles["color"] = "#2e7d32"
-        self._styles["background-color"] = "#e8f5e9"
-        self._styles["padding"] = "2px 6px"
-        self._styles["border-radius"] = "4px"
+        self._styles.update(self._SUCCESS_PRESET)
         self._notify()
         return self
 
     def warning(self) -> Self:
         """Apply warning style (orange) in-place."""
-        self._styles["color"] = "#e65100"
-        self._styles["background-color"] = "#fff3e0"
-        self._styles["padding"] = "2px 6px"
-        self._styles["border-radius"] = "4px"
+        self._styles.update(self._WARNING_PRESET)
         self._notify()
         return self
 
     def error(self) -> Self:
         """Apply error style (red) in-place."""
-        self._styles["color"] = "#c62828"
-        self._styles["background-color"] = "#ffebee"
-        self._styles["padding"] = "2px 6px"
-        self._styles["border-radius"] = "4px"
+        self._styles.update(self._ERROR_PRESET)
         self._notify()
         return self
 
     def info(self) -> Self:
         """Apply info style (blue) in-place."""
-        self._styles["color"] = "#1565c0"
-        self._styles["background-color"] = "#e3f2fd"
-        self._styles["padding"] = "2px 6px"
-        self._styles["border-radius"] = "4px"
+        self._styles.update(self._INFO_PRESET)
         self._notify()
         return self
 
     def badge(self) -> Self:
         """Apply badge/pill style in-place."""
-        self._styles["background-color"] = "#e0e0e0"
-        self._styles["padding"] = "4px 10px"
-        self._styles["border-radius"] = "12px"
-        self._styles["font-size"] = "0.85em"
-        self._styles["font-weight"] = "500"
+        self._styles.update(self._BADGE_PRESET)
         self._notify()
         return self
 
@@ -526,30 +585,43 @@ class HTMLInt(HTMLObject, int):
     # Arithmetic Operations (return HTMLInt or HTMLFloat)
     # -------------------------------------------------------------------------
 
-    def _preserve_settings(self, result: HTMLInt | HTMLFloat) -> HTMLInt | HTMLFloat:
-        """Copy settings to a new HTMLInt or HTMLFloat."""
+    def _respawn(self, value: int) -> HTMLInt:
+        """Create an HTMLInt for an arithmetic result with these settings.
+
+        Skips __init__ (and its uuid4() call), since every setting is
+        copied from self, including the observable ID.
+        """
+        result = int.__new__(HTMLInt, value)
         result._styles = self._styles.copy()
         result._css_classes = self._css_classes.copy()
         result._tag = self._tag
         result._display_format = self._display_format
         result._format_options = self._format_options.copy()
         result._obs_id = self._obs_id  # Preserve ID so updates still work
+        result._reset_formatted()
+        return result
+
+    def _respawn_float(self, value: float) -> HTMLFloat:
+        """Create an HTMLFloat for an arithmetic result with these settings."""
+        result = float.__new__(HTMLFloat, value)
+        result._styles = self._styles.copy()
+        result._css_classes = self._css_classes.copy()
+        result._tag = self._tag
+        result._display_format = self._display_format
+        result._format_options = self._format_options.copy()
+        result._obs_id = self._obs_id
+        # HTMLFloat renders through a formatter compiled from the format
+        result._set_formatter()
         return result
 
     def __add__(self, other: Any) -> Any:  # type: ignore[override]
         """Add: HTMLInt + number."""
-        from animaid.html_float import HTMLFloat
-
-        result: Any
         if isinstance(other, float) and not isinstance(other, int):
-            result = HTMLFloat(int(self) + other)
-            return self._preserve_settings(result)
+            return self._respawn_float(int(self) + other)
         elif isinstance(other, HTMLFloat):
-            result = HTMLFloat(int(self) + float(other))
-            return self._preserve_settings(result)
+            return self._respawn_float(int(self) + float(other))
         else:
-            result = HTMLInt(int.__add__(self, int(other)))
-            return self._preserve_settings(result)
+            return self._respawn(int.__add__(self, int(other)))
 
     def __radd__(self, other: Any) -> Any:  # type: ignore[override]
         """Reverse add: number + HTMLInt."""
@@ -557,45 +629,28 @@ class HTMLInt(HTMLObject, int):
 
     def __sub__(self, other: Any) -> Any:  # type: ignore[override]
         """Subtract: HTMLInt - number."""
-        from animaid.html_float import HTMLFloat
-
-        result: Any
         if isinstance(other, float) and not isinstance(other, int):
-            result = HTMLFloat(int(self) - other)
-            return self._preserve_settings(result)
+            return self._respawn_float(int(self) - other)
         elif isinstance(other, HTMLFloat):
-            result = HTMLFloat(int(self) - float(other))
-            return self._preserve_settings(result)
+            return self._respawn_float(int(self) - float(other))
         else:
-            result = HTMLInt(int.__sub__(self, int(other)))
-            return self._preserve_settings(result)
+            return self._respawn(int.__sub__(self, int(other)))
 
     def __rsub__(self, other: Any) -> Any:  # type: ignore[override]
         """Reverse subtract: number - HTMLInt."""
-        from animaid.html_float import HTMLFloat
-
-        result: Any
         if isinstance(other, float):
-            result = HTMLFloat(other - int(self))
-            return self._preserve_settings(result)
+            return self._respawn_float(other - int(self))
         else:
-            result = HTMLInt(other - int(self))
-            return self._preserve_settings(result)
+            return self._respawn(other - int(self))
 
     def __mul__(self, other: Any) -> Any:  # type: ignore[override]
         """Multiply: HTMLInt * number."""
-        from animaid.html_float import HTMLFloat
-
-        result: Any
         if isinstance(other, float) and not isinstance(other, int):
-            result = HTMLFloat(int(self) * other)
-            return self._preserve_settings(result)
+            return self._respawn_float(int(self) * other)
         elif isinstance(other, HTMLFloat):
-            result = HTMLFloat(int(self) * float(other))
-            return self._preserve_settings(result)
+            return self._respawn_float(int(self) * float(other))
         else:
-            result = HTMLInt(int.__mul__(self, int(other)))
-            return self._preserve_settings(result)
+            return self._respawn(int.__mul__(self, int(other)))
 
     def __rmul__(self, other: Any) -> Any:  # type: ignore[override]
         """Reverse multiply: number * HTMLInt."""
@@ -603,64 +658,50 @@ class HTMLInt(HTMLObject, int):
 
     def __truediv__(self, other: Any) -> Any:  # type: ignore[override]
         """True divide: HTMLInt / number (always returns HTMLFloat)."""
-        from animaid.html_float import HTMLFloat
-
-        result = HTMLFloat(int(self) / other)
-        return self._preserve_settings(result)
+        return self._respawn_float(int(self) / other)
 
     def __rtruediv__(self, other: Any) -> Any:  # type: ignore[override]
         """Reverse true divide: number / HTMLInt."""
-        from animaid.html_float import HTMLFloat
-
-        result = HTMLFloat(other / int(self))
-        return self._preserve_settings(result)
+        return self._respawn_float(other / int(self))
 
     def __floordiv__(self, other: Any) -> Any:  # type: ignore[override]
         """Floor divide: HTMLInt // number."""
-        result = HTMLInt(int(self) // int(other))
-        return self._preserve_settings(result)
+        return self._respawn(int(self) // int(other))
 
     def __rfloordiv__(self, other: Any) -> Any:  # type: ignore[override]
         """Reverse floor divide: number // HTMLInt."""
-        result = HTMLInt(int(other) // int(self))
-        return self._preserve_settings(result)
+        return self._respawn(int(other) // int(self))
 
     def __mod__(self, other: Any) -> Any:  # type: ignore[override]
         """Modulo: HTMLInt % number."""
-        result = HTMLInt(int.__mod__(self, other))
-        return self._preserve_settings(result)
+        return self._respawn(int.__mod__(self, other))
 
     def __rmod__(self, other: Any) -> Any:  # type: ignore[override]
         """Reverse modulo: number % HTMLInt."""
-        result = HTMLInt(other % int(self))
-        return self._preserve_settings(result)
+        return self._respawn(other % int(self))
 
     def __pow__(self, other: Any) -> Any:  # type: ignore[override]
         """Power: HTMLInt ** number."""
-        result = HTMLInt(int.__pow__(self, other))
-        return self._preserve_settings(result)
+        return self._respawn(int.__pow__(self, other))
 
     def __neg__(self) -> Any:
         """Negate: -HTMLInt."""
-        result = HTMLInt(-int(self))
-        return self._preserve_settings(result)
+        return self._respawn(-int(self))
 
     def __pos__(self) -> Any:
         """Positive: +HTMLInt."""
-        result = HTMLInt(+int(self))
-        return self._preserve_settings(result)
+        return self._respawn(+int(self))
 
     def __abs__(self) -> Any:
         """Absolute value: abs(HTMLInt)."""
-        result = HTMLInt(abs(int(self)))
-        return self._preserve_settings(result)
+        return self._respawn(abs(int(self)))
 
     def __repr__(self) -> str:
         """Return a detailed representation for debugging."""
         format_info = ""
         if self._display_format != "default":
             format_info = f", format={self._display_format!r}"
-        styles_repr = ", ".join(f"{k}={v!r}" for k, v in self._styles.items())
+        styles_repr = ", ".join([f"{k}={v!r}" for k, v in self._styles.items()])
         if styles_repr:
             return f"HTMLInt({int(self)}{format_info}, {styles_repr})"
         return f"HTMLInt({int(self)}{format_info})"
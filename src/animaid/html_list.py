@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import html
 import uuid
+from collections.abc import Iterable
 from enum import Enum
-from typing import Any, Self
+from functools import lru_cache
+from typing import Any, ClassVar, Self
 
 from animaid.css_types import (
     AlignItems,
@@ -16,7 +18,16 @@ from animaid.css_types import (
     SizeValue,
     SpacingValue,
 )
-from animaid.html_object import HTMLObject
+from animaid.html_object import (
+    _PLAIN_TYPES,
+    HTMLObject,
+    _escape,
+    _item_renderer,
+    _join_classes,
+    _join_styles,
+    _needs_escape,
+    _open_tag,
+)
 
 
 def _to_css(value: object) -> str:
@@ -43,6 +54,31 @@ class ListType(Enum):
     ORDERED = "ol"  # <ol><li>...</li></ol>
     PLAIN = "div"  # <div><div>...</div></div> with flexbox
 
+    # Members compare by identity, so the identity hash matches equality
+    # and skips Enum's Python-level __hash__ in the tag cache key.
+    __hash__ = object.__hash__
+
+
+@lru_cache(maxsize=256)
+def _compile_tags(
+    list_type: ListType, attrs: str, item_attrs: str, last_item_attrs: str
+) -> tuple[str, str, str, str, str]:
+    """Build the container and item tags of a rendered list.
+
+    Returns:
+        Tuple of (open_tag, item_open, last_item_open, item_close, close_tag).
+    """
+    container_tag = list_type.value
+    uses_list_item = list_type in (ListType.UNORDERED, ListType.ORDERED)
+    item_tag = "li" if uses_list_item else "div"
+    return (
+        _open_tag(container_tag, attrs),
+        _open_tag(item_tag, item_attrs),
+        _open_tag(item_tag, last_item_attrs),
+        f"</{item_tag}>",
+        f"</{container_tag}>",
+    )
+
 
 class HTMLList(HTMLObject, list):
     """A list subclass that renders as styled HTML.
@@ -64,6 +100,19 @@ class HTMLList(HTMLObject, list):
         '<ol><li>1</li><li>2</li><li>3</li></ol>'
     """
 
+    __slots__ = (
+        "_styles",
+        "_item_styles",
+        "_css_classes",
+        "_item_classes",
+        "_direction",
+        "_list_type",
+        "_grid_columns",
+        "_separator",
+        "_obs_id",
+        "_anim_id",
+    )
+
     _styles: dict[str, str]
     _item_styles: dict[str, str]
     _css_classes: list[str]
@@ -74,6 +123,9 @@ class HTMLList(HTMLObject, list):
     _separator: str | None
     _obs_id: str
 
+    # grid-template-columns values by column count, shared by all instances
+    _GRID_TEMPLATES: ClassVar[dict[int, str]] = {}
+
     def __init__(
         self, items: list[Any] | None = None, **styles: str | CSSValue
     ) -> None:
@@ -99,14 +151,25 @@ class HTMLList(HTMLObject, list):
             css_key = key.replace("_", "-")
             self._styles[css_key] = _to_css(value)
 
-    def _notify(self) -> None:
-        """Publish change notification via pypubsub."""
-        try:
-            from pubsub import pub
+    def _derive(self, items: Iterable[Any]) -> HTMLList:
+        """Create an HTMLList holding items with this list's settings.
 
-            pub.sendMessage("animaid.changed", obs_id=self._obs_id)
-        except ImportError:
-            pass  # pypubsub not installed
+        Fills the new list directly rather than going through __init__,
+        so the items are copied once and no throwaway ID or containers
+        are created. The observable ID is preserved so updates still work.
+        """
+        result = list.__new__(HTMLList)
+        list.extend(result, items)
+        result._styles = self._styles.copy()
+        result._item_styles = self._item_styles.copy()
+        result._css_classes = self._css_classes.copy()
+        result._item_classes = self._item_classes.copy()
+        result._direction = self._direction
+        result._list_type = self._list_type
+        result._grid_columns = self._grid_columns
+        result._separator = self._separator
+        result._obs_id = self._obs_id
+        return result
 
     def _copy_with_settings(
         self,
@@ -137,16 +200,7 @@ class HTMLList(HTMLObject, list):
         Returns:
             A new HTMLList with combined settings.
         """
-        result = HTMLList(list(self))
-        result._styles = self._styles.copy()
-        result._item_styles = self._item_styles.copy()
-        result._css_classes = self._css_classes.copy()
-        result._item_classes = self._item_classes.copy()
-        result._direction = self._direction
-        result._list_type = self._list_type
-        result._grid_columns = self._grid_columns
-        result._separator = self._separator
-        result._obs_id = self._obs_id  # Preserve ID so updates still work
+        result = self._derive(self)
 
         if new_styles:
             result._styles.update(new_styles)
@@ -621,12 +675,7 @@ class HTMLList(HTMLObject, list):
         Returns:
             HTML string for the item.
         """
-        if isinstance(item, HTMLObject):
-            return item.render()
-        elif isinstance(item, str):
-            return html.escape(item)
-        else:
-            return html.escape(str(item))
+        return _item_renderer(type(item))(item)
 
     def _get_container_styles(self) -> dict[str, str]:
         """Build the complete container styles including layout."""
@@ -651,7 +700,10 @@ class HTMLList(HTMLObject, list):
             elif self._direction == ListDirection.GRID:
                 styles.setdefault("display", "grid")
                 cols = self._grid_columns or 3
-                styles.setdefault("grid-template-columns", f"repeat({cols}, 1fr)")
+                template = self._GRID_TEMPLATES.get(cols)
+                if template is None:
+                    template = self._GRID_TEMPLATES[cols] = f"repeat({cols}, 1fr)"
+                styles.setdefault("grid-template-columns", template)
 
         # Remove list styling for ul/ol if needed
         if self._list_type in (ListType.UNORDERED, ListType.ORDERED):
@@ -676,39 +728,78 @@ class HTMLList(HTMLObject, list):
         Returns:
             CSS style attribute value.
         """
-        styles = self._item_styles.copy()
+        styles = self._item_styles
 
-        # Add separator styles
-        if self._separator:
+        # Add separator styles; copy only when one applies to this item
+        if self._separator and index != total - 1:
             is_horizontal = self._direction in (
                 ListDirection.HORIZONTAL,
                 ListDirection.HORIZONTAL_REVERSE,
             )
-            is_last = index == total - 1
-
-            if not is_last:
-                if is_horizontal:
-                    styles["border-right"] = self._separator
-                else:
-                    styles["border-bottom"] = self._separator
+            side = "border-right" if is_horizontal else "border-bottom"
+            styles = {**styles, side: self._separator}
 
         if not styles:
             return ""
-        return "; ".join(f"{k}: {v}" for k, v in styles.items())
+        return _join_styles(tuple(styles.items()))
 
     def _build_item_attributes(self, index: int, total: int) -> str:
         """Build complete attribute string for an item."""
-        parts = []
-
-        if self._item_classes:
-            class_str = " ".join(self._item_classes)
-            parts.append(f'class="{class_str}"')
-
         style_str = self._build_item_style_string(index, total)
+        if not self._item_classes:
+            return f'style="{style_str}"' if style_str else ""
+        class_attr = f'class="{_join_classes(tuple(self._item_classes))}"'
         if style_str:
-            parts.append(f'style="{style_str}"')
+            return f'{class_attr} style="{style_str}"'
+        return class_attr
+
+    def _tags(self, total: int) -> tuple[str, str, str, str, str]:
+        """Return the container and item tags for rendering ``total`` items.
+
+        Returns:
+            Tuple of (open_tag, item_open, last_item_open, item_close,
+            close_tag).
+        """
+        self._styles = self._get_container_styles()
+        return _compile_tags(
+            self._list_type,
+            self._build_attributes(),
+            self._build_item_attributes(0, total),
+            self._build_item_attributes(total - 1, total),
+        )
+
+    def _render_into(self, out: list[str]) -> None:
+        """Append this list's HTML fragments to a shared output list.
 
-        return " ".join(parts)
+        Nested HTML objects write into the same list rather than returning
+        a string that would then be copied into this one.
+
+        Args:
+            out: List of HTML fragments being accumulated.
+        """
+        total = len(self)
+        if total == 0:
+            out.append(self.render())
+            return
+
+        open_tag, item_open, last_open, item_close, close_tag = self._tags(total)
+        # Pair each item with its open tag up front instead of comparing the
+        # index against the last one on every iteration.
+        item_opens = [item_open] * (total - 1)
+        item_opens.append(last_open)
+        append = out.append
+        append(open_tag)
+        for open_item, item in zip(item_opens, self):
+            append(open_item)
+            item_type = type(item)
+            if item_type in _PLAIN_TYPES:
+                append(_escape(str(item)))
+            elif isinstance(item, HTMLObject):
+                item._render_into(out)
+            else:
+                append(_item_renderer(item_type)(item))
+            append(item_close)
+        append(close_tag)
 
     def render(self) -> str:
         """Return HTML representation of this list.
@@ -724,35 +815,36 @@ class HTMLList(HTMLObject, list):
                 return f"<{container_tag} {attrs}></{container_tag}>"
             return f"<{container_tag}></{container_tag}>"
 
-        # Build container styles
-        container_styles = self._get_container_styles()
-        self._styles = container_styles
-
-        # Determine tags
-        container_tag = self._list_type.value
-        uses_list_item = self._list_type in (ListType.UNORDERED, ListType.ORDERED)
-        item_tag = "li" if uses_list_item else "div"
-
-        # Build container opening tag
-        attrs = self._build_attributes()
-        if attrs:
-            container_open = f"<{container_tag} {attrs}>"
-        else:
-            container_open = f"<{container_tag}>"
-
-        # Render items
+        # Item tags only differ on the last item (no separator), so every
+        # other item is joined with the same close+open fragment in one call.
         total = len(self)
-        items_html = []
-        for i, item in enumerate(self):
-            item_content = self._render_item(item)
-            item_attrs = self._build_item_attributes(i, total)
-            if item_attrs:
-                tag_html = f"<{item_tag} {item_attrs}>{item_content}</{item_tag}>"
-                items_html.append(tag_html)
+        open_tag, item_open, last_open, item_close, close_tag = self._tags(total)
+        if set(map(type, self)) == {str}:
+            # All plain text: scan and escape the NUL-joined text in one pass
+            # and split it back, instead of calling _escape() per item. NUL is
+            # left alone by html.escape(), so the split is exact unless an
+            # item itself contains one.
+            text = "\x00".join(self)
+            if not _needs_escape(text):
+                items = list(self)
+            elif text.count("\x00") == total - 1:
+                items = html.escape(text).split("\x00")
             else:
-                items_html.append(f"<{item_tag}>{item_content}</{item_tag}>")
-
-        return f"{container_open}{''.join(items_html)}</{container_tag}>"
+                items = [_escape(item) for item in self]
+        else:
+            items = [
+                _escape(str(item))
+                if type(item) in _PLAIN_TYPES
+                else _item_renderer(type(item))(item)
+                for item in self
+            ]
+        last_item = items.pop()
+        if items:
+            joiner = item_close + item_open
+            head = f"{item_open}{joiner.join(items)}{item_close}"
+        else:
+            head = ""
+        return f"{open_tag}{head}{last_open}{last_item}{item_close}{close_tag}"
 
     # -------------------------------------------------------------------------
     # List operation overrides
@@ -760,17 +852,7 @@ class HTMLList(HTMLObject, list):
 
     def __add__(self, other: list[Any]) -> Self:
         """Concatenate lists, preserving settings."""
-        result = HTMLList(list.__add__(self, other))
-        result._styles = self._styles.copy()
-        result._item_styles = self._item_styles.copy()
-        result._css_classes = self._css_classes.copy()
-        result._item_classes = self._item_classes.copy()
-        result._direction = self._direction
-        result._list_type = self._list_type
-        result._grid_columns = self._grid_columns
-        result._separator = self._separator
-        result._obs_id = self._obs_id
-        return result  # type: ignore[return-value]
+        return self._derive(list.__add__(self, other))  # type: ignore[return-value]
 
     def __getitem__(self, key: Any) -> Any:
         """Get item or slice.
@@ -778,20 +860,9 @@ class HTMLList(HTMLObject, list):
         Single index returns the item itself.
         Slice returns a new HTMLList with settings preserved.
         """
-        result = list.__getitem__(self, key)
         if isinstance(key, slice):
-            new_list = HTMLList(result)
-            new_list._styles = self._styles.copy()
-            new_list._item_styles = self._item_styles.copy()
-            new_list._css_classes = self._css_classes.copy()
-            new_list._item_classes = self._item_classes.copy()
-            new_list._direction = self._direction
-            new_list._list_type = self._list_type
-            new_list._grid_columns = self._grid_columns
-            new_list._separator = self._separator
-            new_list._obs_id = self._obs_id
-            return new_list
-        return result
+            return self._derive(list.__getitem__(self, key))
+        return list.__getitem__(self, key)
 
     def __setitem__(self, key: Any, value: Any) -> None:
         """Set item, notifying observers."""
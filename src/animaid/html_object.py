@@ -1,7 +1,110 @@
 """Base class for HTML-renderable types."""
 
+import html
 from abc import ABC, abstractmethod
-from typing import Self
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, Self
+
+# Escaped text is memoized up to this length. Keys, labels and formatted
+# numbers repeat across renders; long bodies would only churn the cache.
+_ESCAPE_CACHE_MAX_LEN = 64
+
+# The characters html.escape() rewrites, as bytes for bytes.translate()
+_ESCAPED_BYTES = b"&<>\"'"
+
+
+@lru_cache(maxsize=512)
+def _join_classes(classes: tuple[str, ...]) -> str:
+    """Join CSS class names, sharing one string per distinct class set."""
+    return " ".join(classes)
+
+
+@lru_cache(maxsize=1024)
+def _style_attribute(items: tuple[tuple[str, str], ...]) -> str:
+    """Return a complete style="..." attribute for a set of style items."""
+    return f'style="{_join_styles(items)}"'
+
+
+def _open_tag(tag: str, attrs: str) -> str:
+    """Return an opening tag, with attributes if there are any."""
+    return f"<{tag} {attrs}>" if attrs else f"<{tag}>"
+
+
+@lru_cache(maxsize=1024)
+def _styled_open_tag(
+    tag: str, styles: tuple[tuple[str, str], ...], classes: tuple[str, ...]
+) -> str:
+    """Return the opening tag for a styled element, built once per combination.
+
+    Objects sharing a preset then render as the cached tag plus their
+    content. Attributes come out in _build_attributes() order.
+    """
+    attrs = _style_attribute(styles) if styles else ""
+    if classes:
+        class_attr = f'class="{_join_classes(classes)}"'
+        attrs = f"{class_attr} {attrs}" if attrs else class_attr
+    return f"<{tag} {attrs}>"
+
+
+@lru_cache(maxsize=1)
+def _pubsub() -> Any:
+    """Return pypubsub's publisher, or None if it is not installed.
+
+    Resolved once: a failed import is re-attempted in full every time, and
+    _notify() runs on every styling call.
+    """
+    try:
+        from pubsub import pub
+    except ImportError:
+        return None  # pypubsub not installed
+    return pub
+
+
+@lru_cache(maxsize=1024)
+def _join_styles(items: tuple[tuple[str, str], ...]) -> str:
+    """Serialize style items, formatting each distinct style set once."""
+    return "; ".join([f"{k}: {v}" for k, v in items])
+
+
+# Value types containers render as escaped str() without a _render_item() call
+_PLAIN_TYPES = frozenset((str, int, float))
+
+
+@lru_cache(maxsize=2048)
+def _escape_short(text: str) -> str:
+    """HTML-escape a short string, reusing earlier results."""
+    return html.escape(text)
+
+
+def _needs_escape(text: str) -> bool:
+    """Return whether text contains a character html.escape() rewrites."""
+    # One C pass deleting the special bytes tells us whether there is
+    # anything to escape, instead of five str.replace() scans. Multi-byte
+    # UTF-8 sequences never contain ASCII bytes, so this holds for any text;
+    # surrogatepass keeps lone surrogates from raising.
+    raw = text.encode("utf-8", "surrogatepass")
+    return len(raw.translate(None, _ESCAPED_BYTES)) != len(raw)
+
+
+def _escape(text: str) -> str:
+    """HTML-escape text for element content or attribute values.
+
+    Expects an exact str: callers convert anything else, str subclasses
+    included, with str() first so the cache only ever holds plain strings.
+    Produces exactly the output of html.escape(); short strings are served
+    from a cache instead of being rescanned on every render, and long text
+    with nothing to escape is returned as is.
+    """
+    # Plain words and integers ("name", "Alice", "30") are the common case
+    # and never contain &, <, >, " or ', so hand them back untouched.
+    if text.isalnum():
+        return text
+    if len(text) <= _ESCAPE_CACHE_MAX_LEN:
+        return _escape_short(text)
+    if not _needs_escape(text):
+        return text
+    return html.escape(text)
 
 
 class HTMLObject(ABC):
@@ -13,8 +116,11 @@ class HTMLObject(ABC):
     HTMLObject will have its render() method called automatically.
     """
 
+    __slots__ = ()
+
     _styles: dict[str, str]
     _css_classes: list[str]
+    _obs_id: str
 
     @abstractmethod
     def render(self) -> str:
@@ -25,6 +131,34 @@ class HTMLObject(ABC):
         """
         ...
 
+    def _notify(self) -> None:
+        """Publish change notification via pypubsub."""
+        pub = _pubsub()
+        if pub is None:
+            return
+        # sendMessage() costs several microseconds even with nobody
+        # subscribed, and every styling call lands here. Skip it when neither
+        # the topic nor a parent topic has listeners. A topic that does not
+        # exist yet is still published so pypubsub creates it.
+        topic = pub.getDefaultTopicMgr().getTopic("animaid.changed", okIfNone=True)
+        while topic is not None and not topic.hasListeners():
+            topic = topic.getParent()
+            if topic is None:
+                return
+        pub.sendMessage("animaid.changed", obs_id=self._obs_id)
+
+    def _render_into(self, out: list[str]) -> None:
+        """Append this object's HTML to a shared output list.
+
+        Containers pass one list down through the whole tree and join it
+        once at the top. The default appends render(); types that emit
+        several fragments can override this to skip the intermediate join.
+
+        Args:
+            out: List of HTML fragments being accumulated.
+        """
+        out.append(self.render())
+
     def __html__(self) -> str:
         """Jinja2 auto-escaping protocol.
 
@@ -67,24 +201,53 @@ class HTMLObject(ABC):
         """Convert internal styles dict to CSS style attribute value."""
         if not self._styles:
             return ""
-        return "; ".join(f"{k}: {v}" for k, v in self._styles.items())
+        return _join_styles(tuple(self._styles.items()))
 
     def _build_class_string(self) -> str:
         """Convert internal classes list to CSS class attribute value."""
         if not self._css_classes:
             return ""
-        return " ".join(self._css_classes)
+        return _join_classes(tuple(self._css_classes))
 
     def _build_attributes(self) -> str:
-        """Build the complete HTML attributes string."""
-        parts = []
+        """Build the complete HTML attributes string.
 
-        class_str = self._build_class_string()
-        if class_str:
-            parts.append(f'class="{class_str}"')
+        Reads the styles and classes directly rather than through the
+        _build_*_string() helpers: this runs on every render, and the style
+        attribute is looked up whole from a cache keyed on the style items.
+        Subclasses that override either helper override this too.
+        """
+        styles = self._styles
+        classes = self._css_classes
+        if not classes:
+            return _style_attribute(tuple(styles.items())) if styles else ""
+        class_attr = f'class="{_join_classes(tuple(classes))}"'
+        if not styles:
+            return class_attr
+        return f"{class_attr} {_style_attribute(tuple(styles.items()))}"
 
-        style_str = self._build_style_string()
-        if style_str:
-            parts.append(f'style="{style_str}"')
 
-        return " ".join(parts)
+def _escape_str(value: object) -> str:
+    """HTML-escape str(value), for values that may not be an exact str."""
+    return _escape(str(value))
+
+
+def _resolve_item_renderer(cls: type) -> Callable[[Any], str]:
+    """Return the function that renders a container item of exact type cls.
+
+    Resolved once per type, so containers look the renderer up instead of
+    running isinstance() checks against the HTMLObject ABC for every item.
+    """
+    if issubclass(cls, HTMLObject):
+        return cls.render  # type: ignore[no-any-return]
+    if cls is str:
+        return _escape
+    # Includes str subclasses, which are converted to exact strings first
+    return _escape_str
+
+
+# Typed as a plain callable: the lru_cache wrapper types its arguments as
+# Hashable, which mypy does not accept type(item) as.
+_item_renderer: Callable[[type], Callable[[Any], str]] = lru_cache(maxsize=256)(
+    _resolve_item_renderer
+)
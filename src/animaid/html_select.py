@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import html
 import threading
 from collections.abc import Callable
-from typing import Self
+from typing import ClassVar, Self
+
+from animaid.html_object import _escape, _escape_str, _join_styles
 
 
 class HTMLSelect:
@@ -29,6 +30,17 @@ class HTMLSelect:
         ...     print(color.value)  # Selected option synced from browser
     """
 
+    # Style tables for the sizing presets, built once per class
+    _WIDE_PRESET: ClassVar[dict[str, str]] = {"width": "100%"}
+    _LARGE_PRESET: ClassVar[dict[str, str]] = {
+        "font-size": "18px",
+        "padding": "14px 18px",
+    }
+    _SMALL_PRESET: ClassVar[dict[str, str]] = {
+        "font-size": "12px",
+        "padding": "6px 10px",
+    }
+
     def __init__(
         self,
         options: list[str],
@@ -109,12 +121,12 @@ class HTMLSelect:
         # Add data-anim-id for event handling
         anim_id_attr = ""
         if self._anim_id:
-            anim_id_attr = f' data-anim-id="{html.escape(self._anim_id)}"'
+            anim_id_attr = f' data-anim-id="{_escape(self._anim_id)}"'
 
         # Build options HTML
         options_html = []
         for option in self._options:
-            escaped_option = html.escape(option)
+            escaped_option = _escape_str(option)
             selected = " selected" if option == self._value else ""
             options_html.append(
                 f'<option value="{escaped_option}"{selected}>{escaped_option}</option>'
@@ -138,17 +150,18 @@ class HTMLSelect:
         Returns:
             A new instance with the combined styles.
         """
+        return self._with_styles(
+            {key.replace("_", "-"): value for key, value in styles.items()}
+        )
+
+    def _with_styles(self, styles: dict[str, str]) -> HTMLSelect:
+        """Return a copy with CSS-named styles merged over the current ones."""
         new_select = HTMLSelect(self._options, self._value)
         new_select._on_change = self._on_change
         new_select._anim_id = self._anim_id
-        new_select._styles = dict(self._styles)
+        new_select._styles = {**self._styles, **styles}
         new_select._css_classes = list(self._css_classes)
 
-        # Add new styles, converting underscores to hyphens
-        for key, value in styles.items():
-            css_key = key.replace("_", "-")
-            new_select._styles[css_key] = value
-
         return new_select
 
     def add_class(self, *class_names: str) -> "HTMLSelect":
@@ -171,7 +184,7 @@ class HTMLSelect:
         """Convert internal styles dict to CSS style attribute value."""
         if not self._styles:
             return ""
-        return "; ".join(f"{k}: {v}" for k, v in self._styles.items())
+        return _join_styles(tuple([(k, str(v)) for k, v in self._styles.items()]))
 
     def _build_class_string(self) -> str:
         """Convert internal classes list to CSS class attribute value."""
@@ -200,7 +213,7 @@ class HTMLSelect:
         Returns:
             A new instance with full width styling.
         """
-        return self.styled(width="100%")
+        return self._with_styles(self._WIDE_PRESET)
 
     def large(self) -> "HTMLSelect":
         """Return a copy with larger text and padding.
@@ -208,7 +221,7 @@ class HTMLSelect:
         Returns:
             A new instance with large styling.
         """
-        return self.styled(font_size="18px", padding="14px 18px")
+        return self._with_styles(self._LARGE_PRESET)
 
     def small(self) -> "HTMLSelect":
         """Return a copy with smaller text and padding.
@@ -216,4 +229,4 @@ class HTMLSelect:
         Returns:
             A new instance with small styling.
         """
-        return self.styled(font_size="12px", padding="6px 10px")
+        return self._with_styles(self._SMALL_PRESET)
@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import html
 import uuid
 from collections.abc import Iterable
 from enum import Enum
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
 from animaid.css_types import (
     AlignItems,
@@ -17,7 +16,7 @@ from animaid.css_types import (
     SizeValue,
     SpacingValue,
 )
-from animaid.html_object import HTMLObject
+from animaid.html_object import HTMLObject, _escape, _join_styles
 
 
 def _to_css(value: object) -> str:
@@ -76,6 +75,9 @@ class HTMLSet(HTMLObject, set):
     _sorted: bool
     _obs_id: str
 
+    # grid-template-columns values by column count, shared by all instances
+    _GRID_TEMPLATES: ClassVar[dict[int, str]] = {}
+
     def __init__(self, items: Iterable[Any] = (), **styles: str | CSSValue) -> None:
         """Initialize an HTMLSet.
 
@@ -99,15 +101,6 @@ class HTMLSet(HTMLObject, set):
             css_key = key.replace("_", "-")
             self._styles[css_key] = _to_css(value)
 
-    def _notify(self) -> None:
-        """Publish change notification via pypubsub."""
-        try:
-            from pubsub import pub
-
-            pub.sendMessage("animaid.changed", obs_id=self._obs_id)
-        except ImportError:
-            pass  # pypubsub not installed
-
     def _copy_with_settings(
         self,
         new_styles: dict[str, str] | None = None,
@@ -468,12 +461,13 @@ class HTMLSet(HTMLObject, set):
 
     def _render_item(self, item: Any) -> str:
         """Render a single item to HTML."""
+        if type(item) is str:
+            return _escape(item)
         if isinstance(item, HTMLObject):
             return item.render()
-        elif isinstance(item, str):
-            return html.escape(item)
-        else:
-            return html.escape(str(item))
+        # str() also turns str subclasses into exact strings, so only plain
+        # str values ever become escape-cache keys
+        return _escape(str(item))
 
     def _get_container_styles(self) -> dict[str, str]:
         """Build the complete container styles including layout."""
@@ -498,7 +492,10 @@ class HTMLSet(HTMLObject, set):
             elif self._direction == SetDirection.GRID:
                 styles.setdefault("display", "inline-grid")
                 cols = self._grid_columns or 3
-                styles.setdefault("grid-template-columns", f"repeat({cols}, 1fr)")
+                template = self._GRID_TEMPLATES.get(cols)
+                if template is None:
+                    template = self._GRID_TEMPLATES[cols] = f"repeat({cols}, 1fr)"
+                styles.setdefault("grid-template-columns", template)
 
         return styles
 
@@ -521,7 +518,7 @@ class HTMLSet(HTMLObject, set):
 
         if not styles:
             return ""
-        return "; ".join(f"{k}: {v}" for k, v in styles.items())
+        return _join_styles(tuple(styles.items()))
 
     def _build_item_attributes(self, index: int, total: int) -> str:
         """Build complete attribute string for an item."""
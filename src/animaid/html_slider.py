@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import html
 import threading
 from collections.abc import Callable
-from typing import Self
+from typing import ClassVar, Self
+
+from animaid.html_object import _escape, _join_styles
 
 
 class HTMLSlider:
@@ -26,6 +27,11 @@ class HTMLSlider:
         ...     print(volume.value)  # Numeric value synced from browser
     """
 
+    # Style tables for the sizing presets, built once per class
+    _WIDE_PRESET: ClassVar[dict[str, str]] = {"width": "100%", "max-width": "none"}
+    _THIN_PRESET: ClassVar[dict[str, str]] = {"height": "4px"}
+    _THICK_PRESET: ClassVar[dict[str, str]] = {"height": "10px"}
+
     def __init__(
         self,
         min: float = 0,
@@ -122,7 +128,7 @@ class HTMLSlider:
         # Add data-anim-id for event handling
         anim_id_attr = ""
         if self._anim_id:
-            anim_id_attr = f' data-anim-id="{html.escape(self._anim_id)}"'
+            anim_id_attr = f' data-anim-id="{_escape(self._anim_id)}"'
 
         range_attrs = (
             f'min="{self._min}" max="{self._max}" '
@@ -146,17 +152,18 @@ class HTMLSlider:
         Returns:
             A new instance with the combined styles.
         """
+        return self._with_styles(
+            {key.replace("_", "-"): value for key, value in styles.items()}
+        )
+
+    def _with_styles(self, styles: dict[str, str]) -> HTMLSlider:
+        """Return a copy with CSS-named styles merged over the current ones."""
         new_slider = HTMLSlider(self._min, self._max, self._value, self._step)
         new_slider._on_change = self._on_change
         new_slider._anim_id = self._anim_id
-        new_slider._styles = dict(self._styles)
+        new_slider._styles = {**self._styles, **styles}
         new_slider._css_classes = list(self._css_classes)
 
-        # Add new styles, converting underscores to hyphens
-        for key, value in styles.items():
-            css_key = key.replace("_", "-")
-            new_slider._styles[css_key] = value
-
         return new_slider
 
     def add_class(self, *class_names: str) -> "HTMLSlider":
@@ -179,7 +186,7 @@ class HTMLSlider:
         """Convert internal styles dict to CSS style attribute value."""
         if not self._styles:
             return ""
-        return "; ".join(f"{k}: {v}" for k, v in self._styles.items())
+        return _join_styles(tuple([(k, str(v)) for k, v in self._styles.items()]))
 
     def _build_class_string(self) -> str:
         """Convert internal classes list to CSS class attribute value."""
@@ -208,7 +215,7 @@ class HTMLSlider:
         Returns:
             A new instance with full width styling.
         """
-        return self.styled(width="100%", max_width="none")
+        return self._with_styles(self._WIDE_PRESET)
 
     def thin(self) -> "HTMLSlider":
         """Return a copy with a thinner slider track.
@@ -216,7 +223,7 @@ class HTMLSlider:
         Returns:
             A new instance with thin styling.
         """
-        return self.styled(height="4px")
+        return self._with_styles(self._THIN_PRESET)
 
     def thick(self) -> "HTMLSlider":
         """Return a copy with a thicker slider track.
@@ -224,4 +231,4 @@ class HTMLSlider:
         Returns:
             A new instance with thick styling.
         """
-        return self.styled(height="10px")
+        return self._with_styles(self._THICK_PRESET)
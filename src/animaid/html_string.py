@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import html
 import uuid
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
 from animaid.css_types import (
     BorderValue,
@@ -14,7 +13,7 @@ from animaid.css_types import (
     SizeValue,
     SpacingValue,
 )
-from animaid.html_object import HTMLObject
+from animaid.html_object import HTMLObject, _escape, _styled_open_tag
 
 
 def _to_css(value: object) -> str:
@@ -42,11 +41,65 @@ class HTMLString(HTMLObject, str):
         '<span style="color: blue; text-decoration: underline">Click me</span>'
     """
 
+    __slots__ = ("_styles", "_css_classes", "_tag", "_obs_id", "_anim_id")
+
     _styles: dict[str, str]
     _css_classes: list[str]
     _tag: str
     _obs_id: str
 
+    # Style tables for the multi-property presets, built once per class
+    _HIGHLIGHT_PRESET: ClassVar[dict[str, str]] = {
+        "background-color": "#fff59d",
+        "padding": "2px 4px",
+    }
+    _CODE_PRESET: ClassVar[dict[str, str]] = {
+        "font-family": "monospace",
+        "background-color": "#f5f5f5",
+        "padding": "2px 6px",
+        "border-radius": "4px",
+        "font-size": "0.9em",
+    }
+    _BADGE_PRESET: ClassVar[dict[str, str]] = {
+        "background-color": "#e0e0e0",
+        "padding": "4px 10px",
+        "border-radius": "12px",
+        "font-size": "0.85em",
+        "font-weight": "500",
+    }
+    _SUCCESS_PRESET: ClassVar[dict[str, str]] = {
+        "color": "#2e7d32",
+        "background-color": "#e8f5e9",
+        "padding": "2px 6px",
+        "border-radius": "4px",
+    }
+    _WARNING_PRESET: ClassVar[dict[str, str]] = {
+        "color": "#e65100",
+        "background-color": "#fff3e0",
+        "padding": "2px 6px",
+        "border-radius": "4px",
+    }
+    _ERROR_PRESET: ClassVar[dict[str, str]] = {
+        "color": "#c62828",
+        "background-color": "#ffebee",
+        "padding": "2px 6px",
+        "border-radius": "4px",
+    }
+    _INFO_PRESET: ClassVar[dict[str, str]] = {
+        "color": "#1565c0",
+        "background-color": "#e3f2fd",
+        "padding": "2px 6px",
+        "border-radius": "4px",
+    }
+    _MUTED_PRESET: ClassVar[dict[str, str]] = {
+        "color": "#757575",
+        "font-size": "0.9em",
+    }
+    _LINK_PRESET: ClassVar[dict[str, str]] = {
+        "color": "#1976d2",
+        "text-decoration": "underline",
+    }
+
     def __new__(cls, content: str = "", **styles: str | CSSValue) -> Self:
         """Create a new HTMLString instance.
 
@@ -78,15 +131,6 @@ class HTMLString(HTMLObject, str):
             css_key = key.replace("_", "-")
             self._styles[css_key] = _to_css(value)
 
-    def _notify(self) -> None:
-        """Publish change notification via pypubsub."""
-        try:
-            from pubsub import pub
-
-            pub.sendMessage("animaid.changed", obs_id=self._obs_id)
-        except ImportError:
-            pass  # pypubsub not installed
-
     def _copy_with_styles(
         self,
         new_styles: dict[str, str] | None = None,
@@ -196,13 +240,14 @@ class HTMLString(HTMLObject, str):
             >>> HTMLString("<script>alert('xss')</script>").render()
             '<span>&lt;script&gt;alert(&#x27;xss&#x27;)&lt;/script&gt;</span>'
         """
-        escaped_content = html.escape(str(self))
-        attrs = self._build_attributes()
-
-        if attrs:
-            return f"<{self._tag} {attrs}>{escaped_content}</{self._tag}>"
-        else:
-            return f"<{self._tag}>{escaped_content}</{self._tag}>"
+        tag = self._tag
+        escaped_content = _escape(str(self))
+        styles = self._styles
+        classes = self._css_classes
+        if not styles and not classes:
+            return f"<{tag}>{escaped_content}</{tag}>"
+        open_tag = _styled_open_tag(tag, tuple(styles.items()), tuple(classes))
+        return f"{open_tag}{escaped_content}</{tag}>"
 
     # -------------------------------------------------------------------------
     # Style Methods (no-argument styles)
@@ -436,78 +481,55 @@ class HTMLString(HTMLObject, str):
 
     def highlight(self) -> Self:
         """Apply highlight style (yellow background) in-place."""
-        self._styles["background-color"] = "#fff59d"
-        self._styles["padding"] = "2px 4px"
+        self._styles.update(self._HIGHLIGHT_PRESET)
         self._notify()
         return self
 
     def code(self) -> Self:
         """Apply inline code style in-place."""
-        self._styles["font-family"] = "monospace"
-        self._styles["background-color"] = "#f5f5f5"
-        self._styles["padding"] = "2px 6px"
-        self._styles["border-radius"] = "4px"
-        self._styles["font-size"] = "0.9em"
+        self._styles.update(self._CODE_PRESET)
         self._notify()
         return self
 
     def badge(self) -> Self:
         """Apply badge/pill style in-place."""
-        self._styles["background-color"] = "#e0e0e0"
-        self._styles["padding"] = "4px 10px"
-        self._styles["border-radius"] = "12px"
-        self._styles["font-size"] = "0.85em"
-        self._styles["font-weight"] = "500"
+        self._styles.update(self._BADGE_PRESET)
         self._notify()
         return self
 
     def success(self) -> Self:
         """Apply success style (green) in-place."""
-        self._styles["color"] = "#2e7d32"
-        self._styles["background-color"] = "#e8f5e9"
-        self._styles["padding"] = "2px 6px"
-        self._styles["border-radius"] = "4px"
+        self._styles.update(self._SUCCESS_PRESET)
         self._notify()
         return self
 
     def warning(self) -> Self:
         """Apply warning style (orange) in-place."""
-        self._styles["color"] = "#e65100"
-        self._styles["background-color"] = "#fff3e0"
-        self._styles["padding"] = "2px 6px"
-        self._styles["border-radius"] = "4px"
+        self._styles.update(self._WARNING_PRESET)
         self._notify()
         return self
 
     def error(self) -> Self:
         """Apply error style (red) in-place."""
-        self._styles["color"] = "#c62828"
-        self._styles["background-color"] = "#ffebee"
-        self._styles["padding"] = "2px 6px"
-        self._styles["border-radius"] = "4px"
+        self._styles.update(self._ERROR_PRESET)
         self._notify()
         return self
 
     def info(self) -> Self:
         """Apply info style (blue) in-place."""
-        self._styles["color"] = "#1565c0"
-        self._styles["background-color"] = "#e3f2fd"
-        self._styles["padding"] = "2px 6px"
-        self._styles["border-radius"] = "4px"
+        self._styles.update(self._INFO_PRESET)
         self._notify()
         return self
 
     def muted(self) -> Self:
         """Apply muted/secondary text style in-place."""
-        self._styles["color"] = "#757575"
-        self._styles["font-size"] = "0.9em"
+        self._styles.update(self._MUTED_PRESET)
         self._notify()
         return self
 
     def link(self) -> Self:
         """Apply link style in-place."""
-        self._styles["color"] = "#1976d2"
-        self._styles["text-decoration"] = "underline"
+        self._styles.update(self._LINK_PRESET)
         self._notify()
         return self
 
@@ -639,33 +661,35 @@ class HTMLString(HTMLObject, str):
     # String operation overrides to preserve HTMLString type
     # -------------------------------------------------------------------------
 
-    def __add__(self, other: str) -> Self:
-        """Concatenate strings, preserving styles for this string's content."""
-        result = HTMLString(str.__add__(self, other))
+    def _derive(self, content: str) -> HTMLString:
+        """Create a new HTMLString for content derived from this one.
+
+        Copies this string's styles, classes and tag straight onto the new
+        object instead of running __init__ and discarding its empty ones.
+        The result is a separate object with its own observable ID.
+        """
+        result = str.__new__(HTMLString, content)
         result._styles = self._styles.copy()
         result._css_classes = self._css_classes.copy()
         result._tag = self._tag
-        return result  # type: ignore[return-value]
+        result._obs_id = str(uuid.uuid4())
+        return result
+
+    def __add__(self, other: str) -> Self:
+        """Concatenate strings, preserving styles for this string's content."""
+        return self._derive(str.__add__(self, other))  # type: ignore[return-value]
 
     def __radd__(self, other: str) -> Self:
         """Handle other + HTMLString."""
-        result = HTMLString(str.__add__(other, self))
-        result._styles = self._styles.copy()
-        result._css_classes = self._css_classes.copy()
-        result._tag = self._tag
-        return result  # type: ignore[return-value]
+        return self._derive(str.__add__(other, self))  # type: ignore[return-value]
 
     def __getitem__(self, key: Any) -> Self:  # type: ignore[override]
         """Slice the string, preserving styles."""
-        result = HTMLString(str.__getitem__(self, key))
-        result._styles = self._styles.copy()
-        result._css_classes = self._css_classes.copy()
-        result._tag = self._tag
-        return result  # type: ignore[return-value]
+        return self._derive(str.__getitem__(self, key))  # type: ignore[return-value]
 
     def __repr__(self) -> str:
         """Return a detailed representation for debugging."""
-        styles_repr = ", ".join(f"{k}={v!r}" for k, v in self._styles.items())
+        styles_repr = ", ".join([f"{k}={v!r}" for k, v in self._styles.items()])
         if styles_repr:
             return f"HTMLString({str.__repr__(self)}, {styles_repr})"
         return f"HTMLString({str.__repr__(self)})"
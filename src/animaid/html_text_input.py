@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import html
 import threading
 from collections.abc import Callable
-from typing import Self
+from typing import ClassVar, Self
+
+from animaid.html_object import _escape, _escape_str, _join_styles
 
 
 class HTMLTextInput:
@@ -26,6 +27,17 @@ class HTMLTextInput:
         ...     print(name_input.value)  # Value synced from browser
     """
 
+    # Style tables for the sizing presets, built once per class
+    _WIDE_PRESET: ClassVar[dict[str, str]] = {"width": "100%", "max-width": "none"}
+    _LARGE_PRESET: ClassVar[dict[str, str]] = {
+        "font-size": "18px",
+        "padding": "14px 18px",
+    }
+    _SMALL_PRESET: ClassVar[dict[str, str]] = {
+        "font-size": "12px",
+        "padding": "6px 10px",
+    }
+
     def __init__(
         self,
         value: str = "",
@@ -122,13 +134,13 @@ class HTMLTextInput:
             A string containing valid HTML for the input.
         """
         attrs = self._build_attributes()
-        escaped_value = html.escape(self._value)
-        escaped_placeholder = html.escape(self._placeholder)
+        escaped_value = _escape_str(self._value)
+        escaped_placeholder = _escape_str(self._placeholder)
 
         # Add data-anim-id for event handling
         anim_id_attr = ""
         if self._anim_id:
-            anim_id_attr = f' data-anim-id="{html.escape(self._anim_id)}"'
+            anim_id_attr = f' data-anim-id="{_escape(self._anim_id)}"'
 
         placeholder_attr = ""
         if self._placeholder:
@@ -157,18 +169,19 @@ class HTMLTextInput:
         Returns:
             A new instance with the combined styles.
         """
+        return self._with_styles(
+            {key.replace("_", "-"): value for key, value in styles.items()}
+        )
+
+    def _with_styles(self, styles: dict[str, str]) -> HTMLTextInput:
+        """Return a copy with CSS-named styles merged over the current ones."""
         new_input = HTMLTextInput(self._value, self._placeholder)
         new_input._on_change = self._on_change
         new_input._on_submit = self._on_submit
         new_input._anim_id = self._anim_id
-        new_input._styles = dict(self._styles)
+        new_input._styles = {**self._styles, **styles}
         new_input._css_classes = list(self._css_classes)
 
-        # Add new styles, converting underscores to hyphens
-        for key, value in styles.items():
-            css_key = key.replace("_", "-")
-            new_input._styles[css_key] = value
-
         return new_input
 
     def add_class(self, *class_names: str) -> "HTMLTextInput":
@@ -192,7 +205,7 @@ class HTMLTextInput:
         """Convert internal styles dict to CSS style attribute value."""
         if not self._styles:
             return ""
-        return "; ".join(f"{k}: {v}" for k, v in self._styles.items())
+        return _join_styles(tuple([(k, str(v)) for k, v in self._styles.items()]))
 
     def _build_class_string(self) -> str:
         """Convert internal classes list to CSS class attribute value."""
@@ -221,7 +234,7 @@ class HTMLTextInput:
         Returns:
             A new instance with full width styling.
         """
-        return self.styled(width="100%", max_width="none")
+        return self._with_styles(self._WIDE_PRESET)
 
     def large(self) -> "HTMLTextInput":
         """Return a copy with larger text and padding.
@@ -229,7 +242,7 @@ class HTMLTextInput:
         Returns:
             A new instance with large styling.
         """
-        return self.styled(font_size="18px", padding="14px 18px")
+        return self._with_styles(self._LARGE_PRESET)
 
     def small(self) -> "HTMLTextInput":
         """Return a copy with smaller text and padding.
@@ -237,4 +250,4 @@ class HTMLTextInput:
         Returns:
             A new instance with small styling.
         """
-        return self.styled(font_size="12px", padding="6px 10px")
+        return self._with_styles(self._SMALL_PRESET)
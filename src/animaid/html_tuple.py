@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import html
 import uuid
 from enum import Enum
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
 from animaid.css_types import (
     AlignItems,
@@ -16,7 +15,7 @@ from animaid.css_types import (
     SizeValue,
     SpacingValue,
 )
-from animaid.html_object import HTMLObject
+from animaid.html_object import HTMLObject, _escape, _join_styles, _open_tag
 
 
 def _to_css(value: object) -> str:
@@ -33,6 +32,11 @@ def _is_namedtuple(obj: Any) -> bool:
     )
 
 
+# Opening tags for the labeled format, the same for every label/value pair
+_LABEL_OPEN = '<dt style="margin: 0; font-weight: bold;">'
+_VALUE_OPEN = '<dd style="margin: 0; margin-left: 0;">'
+
+
 class TupleDirection(Enum):
     """Direction in which tuple items are rendered."""
 
@@ -85,6 +89,10 @@ class HTMLTuple(HTMLObject, tuple):
     _field_names: tuple[str, ...] | None
     _obs_id: str
 
+    # grid-template-columns values by column count, shared by all instances
+    _GRID_TEMPLATES: ClassVar[dict[int, str]] = {}
+    _LABELED_GRID_TEMPLATES: ClassVar[dict[int, str]] = {}
+
     def __new__(cls, items: tuple[Any, ...] = (), **styles: str | CSSValue) -> Self:
         """Create a new HTMLTuple instance.
 
@@ -132,15 +140,6 @@ class HTMLTuple(HTMLObject, tuple):
             css_key = key.replace("_", "-")
             self._styles[css_key] = _to_css(value)
 
-    def _notify(self) -> None:
-        """Publish change notification via pypubsub."""
-        try:
-            from pubsub import pub
-
-            pub.sendMessage("animaid.changed", obs_id=self._obs_id)
-        except ImportError:
-            pass  # pypubsub not installed
-
     def _copy_with_settings(
         self,
         new_styles: dict[str, str] | None = None,
@@ -483,12 +482,13 @@ class HTMLTuple(HTMLObject, tuple):
 
     def _render_item(self, item: Any) -> str:
         """Render a single item to HTML."""
+        if type(item) is str:
+            return _escape(item)
         if isinstance(item, HTMLObject):
             return item.render()
-        elif isinstance(item, str):
-            return html.escape(item)
-        else:
-            return html.escape(str(item))
+        # str() also turns str subclasses into exact strings, so only plain
+        # str values ever become escape-cache keys
+        return _escape(str(item))
 
     def _get_container_styles(self) -> dict[str, str]:
         """Build the complete container styles including layout."""
@@ -513,7 +513,10 @@ class HTMLTuple(HTMLObject, tuple):
             elif self._direction == TupleDirection.GRID:
                 styles.setdefault("display", "inline-grid")
                 cols = self._grid_columns or 3
-                styles.setdefault("grid-template-columns", f"repeat({cols}, 1fr)")
+                template = self._GRID_TEMPLATES.get(cols)
+                if template is None:
+                    template = self._GRID_TEMPLATES[cols] = f"repeat({cols}, 1fr)"
+                styles.setdefault("grid-template-columns", template)
 
         return styles
 
@@ -536,7 +539,7 @@ class HTMLTuple(HTMLObject, tuple):
 
         if not styles:
             return ""
-        return "; ".join(f"{k}: {v}" for k, v in styles.items())
+        return _join_styles(tuple(styles.items()))
 
     def _build_item_attributes(self, index: int, total: int) -> str:
         """Build complete attribute string for an item."""
@@ -570,7 +573,11 @@ class HTMLTuple(HTMLObject, tuple):
             # Grid: multiple pairs per row
             cols = self._grid_columns or 3
             styles.setdefault("display", "inline-grid")
-            styles.setdefault("grid-template-columns", f"repeat({cols}, auto auto)")
+            template = self._LABELED_GRID_TEMPLATES.get(cols)
+            if template is None:
+                template = f"repeat({cols}, auto auto)"
+                self._LABELED_GRID_TEMPLATES[cols] = template
+            styles.setdefault("grid-template-columns", template)
             styles.setdefault("gap", "8px")
             styles.setdefault("align-items", "center")
 
@@ -594,17 +601,13 @@ class HTMLTuple(HTMLObject, tuple):
         container_styles = self._get_labeled_container_styles()
         self._styles = container_styles
 
-        # Build content with styled dt/dd
-        items_html = []
-        dt_style = "margin: 0; font-weight: bold;"
-        dd_style = "margin: 0; margin-left: 0;"
-
-        for label, value in zip(labels, self):
-            key_html = html.escape(str(label))
-            value_html = self._render_item(value)
-            dt = f'<dt style="{dt_style}">{key_html}</dt>'
-            dd = f'<dd style="{dd_style}">{value_html}</dd>'
-            items_html.append(f"{dt}{dd}")
+        # Build content with styled dt/dd, one f-string per pair
+        render_item = self._render_item
+        items_html = [
+            f"{_LABEL_OPEN}{_escape(str(label))}</dt>"
+            f"{_VALUE_OPEN}{render_item(value)}</dd>"
+            for label, value in zip(labels, self)
+        ]
 
         attrs = self._build_attributes()
         if attrs:
@@ -616,11 +619,8 @@ class HTMLTuple(HTMLObject, tuple):
         if len(self) == 0:
             return "<span>()</span>"
 
-        items_html = []
-        for item in self:
-            items_html.append(self._render_item(item))
-
-        content = ", ".join(items_html)
+        render_item = self._render_item
+        content = ", ".join([render_item(item) for item in self])
         attrs = self._build_attributes()
 
         if attrs:
@@ -646,21 +646,21 @@ class HTMLTuple(HTMLObject, tuple):
         else:
             container_open = "<div>"
 
-        # Render items with commas between them
+        # Item attributes only differ on the last item (no separator), so
+        # both opening tags are built once and every other item is joined,
+        # comma span included, with the same fragment
         total = len(self)
-        items_html = []
-        for i, item in enumerate(self):
-            item_content = self._render_item(item)
-            item_attrs = self._build_item_attributes(i, total)
-            if item_attrs:
-                items_html.append(f"<span {item_attrs}>{item_content}</span>")
-            else:
-                items_html.append(f"<span>{item_content}</span>")
-            # Add comma separator after each item except the last
-            if i < total - 1:
-                items_html.append("<span>, </span>")
-
-        return f"{container_open}{''.join(items_html)}</div>"
+        item_open = _open_tag("span", self._build_item_attributes(0, total))
+        last_open = _open_tag("span", self._build_item_attributes(total - 1, total))
+        render_item = self._render_item
+        items = [render_item(item) for item in self]
+        last_item = items.pop()
+        if items:
+            joiner = f"</span><span>, </span>{item_open}"
+            head = f"{item_open}{joiner.join(items)}</span><span>, </span>"
+        else:
+            head = ""
+        return f"{container_open}{head}{last_open}{last_item}</span></div>"
 
     def render(self) -> str:
         """Return HTML representation of this tuple.
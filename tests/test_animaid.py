@@ -1,5 +1,7 @@
 """Basic tests for animaid package."""
 
+import pytest
+
 import animaid
 
 
@@ -9,3 +11,29 @@ def test_version():
     parts = animaid.__version__.split(".")
     assert len(parts) == 3
     assert all(part.isdigit() for part in parts)
+
+
+@pytest.mark.parametrize(("name", "target"), sorted(animaid._LAZY_IMPORTS.items()))
+def test_lazy_import_resolves(name, target):
+    """Test that each lazily imported name resolves to its source object."""
+    module_name, attr = target
+    module = pytest.importorskip(module_name)
+    assert getattr(animaid, name) is getattr(module, attr)
+
+
+def test_lazy_imports_listed_by_dir():
+    """Test that dir() lists every lazily imported name."""
+    assert set(animaid._LAZY_IMPORTS) <= set(dir(animaid))
+
+
+def test_lazy_imports_exported_by_star_import():
+    """Test that from animaid import * binds every lazy name."""
+    namespace: dict[str, object] = {}
+    exec("from animaid import *", namespace)
+    assert set(animaid._LAZY_IMPORTS) <= set(namespace)
+
+
+def test_unknown_attribute_raises():
+    """Test that an unknown attribute still raises AttributeError."""
+    with pytest.raises(AttributeError, match="no_such_name"):
+        animaid.no_such_name
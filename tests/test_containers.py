@@ -9,7 +9,9 @@ from animaid import (
     HTMLCard,
     HTMLColumn,
     HTMLContainer,
+    HTMLDict,
     HTMLDivider,
+    HTMLList,
     HTMLRow,
     HTMLSpacer,
     HTMLString,
@@ -45,6 +47,7 @@ class TestHTMLContainerBasics:
         assert "Hello" in html
         assert "World" in html
 
+    @pytest.mark.escape
     def test_container_with_plain_strings(self) -> None:
         """Container escapes plain strings."""
         container = HTMLContainer(["Hello", "<script>bad</script>"])
@@ -52,6 +55,24 @@ class TestHTMLContainerBasics:
         assert "Hello" in html
         assert "&lt;script&gt;" in html  # Escaped
 
+    def test_container_with_mixed_children(self) -> None:
+        """Plain strings and elements render in their original order."""
+        container = HTMLContainer(["a<", 1, HTMLString("B"), "&c"])
+        html = container.render()
+        assert html.startswith("<div>a&lt;1<span")
+        assert html.endswith("</span>&amp;c</div>")
+
+    @pytest.mark.escape
+    def test_container_with_html_protocol_child(self) -> None:
+        """Children providing __html__ are treated as already-safe markup."""
+
+        class Markup(str):
+            def __html__(self) -> str:
+                return str(self)
+
+        container = HTMLContainer(["<a>", Markup("<b>bold</b>")])
+        assert container.render() == "<div>&lt;a&gt;<b>bold</b></div>"
+
     def test_len(self) -> None:
         """Container reports correct length."""
         container = HTMLContainer([1, 2, 3])
@@ -92,6 +113,19 @@ class TestHTMLContainerChildManagement:
         container.extend([HTMLString("A"), HTMLString("B")])
         assert len(container) == 2
 
+    def test_extend_empty_does_not_notify(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """extend() with no children is a no-op."""
+        container = HTMLContainer([HTMLString("A")])
+        calls: list[int] = []
+        monkeypatch.setattr(container, "_notify", lambda: calls.append(1))
+        assert container.extend([]) is container
+        assert calls == []
+        container.extend(["B"])
+        assert calls == [1]
+        assert len(container) == 2
+
     def test_insert(self) -> None:
         """insert() adds at specific position."""
         container = HTMLContainer([HTMLString("A"), HTMLString("C")])
@@ -529,6 +563,26 @@ class TestNestedContainers:
         assert "Header" in html
         assert "Side" in html
 
+    def test_nested_render_matches_child_render(self) -> None:
+        """A nested container renders the same markup as it does alone."""
+        card = HTMLCard([HTMLString("Body")], title="Title")
+        inner = HTMLColumn(["<x>", card])
+        outer = HTMLRow([inner])
+        expected = f"<div {outer._build_attributes()}>{inner.render()}</div>"
+        assert outer.render() == expected
+        assert inner.render().endswith(f"{card.render()}</div>")
+
+    def test_nested_collections_match_their_render(self) -> None:
+        """Dicts and lists inside a container render as they do alone."""
+        items = HTMLList(["<a>", HTMLString("b").bold()]).separator("1px solid")
+        data = HTMLDict({"k&": items, "n": 1}).as_table()
+        column = HTMLColumn([data, items])
+        expected = (
+            f"<div {column._build_attributes()}>"
+            f"{data.render()}{items.render()}</div>"
+        )
+        assert column.render() == expected
+
 
 # =============================================================================
 # Integration with HTMLString Tests
@@ -589,6 +643,7 @@ class TestHTMLCardBasics:
         assert "Body" in html
         assert "font-weight: bold" in html
 
+    @pytest.mark.escape
     def test_card_title_escapes_html(self) -> None:
         """Card title is HTML-escaped."""
         card = HTMLCard(title="<script>bad</script>")
@@ -701,6 +756,14 @@ class TestHTMLCardPresets:
         assert "border:" in html
         assert "box-shadow: none" in html
 
+    def test_preset_does_not_leak_between_cards(self) -> None:
+        """Changing a card after a preset leaves other cards untouched."""
+        first = HTMLCard().default().shadow(ShadowSize.XL)
+        second = HTMLCard().default()
+        assert ShadowSize.XL.to_css() in first.render()
+        assert ShadowSize.XL.to_css() not in second.render()
+        assert ShadowSize.SM.to_css() in second.render()
+
     def test_flat_preset(self) -> None:
         """flat() removes border and shadow."""
         card = HTMLCard().flat()
@@ -754,6 +817,7 @@ class TestHTMLDividerBasics:
         assert "OR" in html
         assert "display: flex" in html
 
+    @pytest.mark.escape
     def test_label_escapes_html(self) -> None:
         """Label is HTML-escaped."""
         divider = HTMLDivider("<script>bad</script>")
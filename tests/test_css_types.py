@@ -8,6 +8,7 @@ from animaid import (
     Border,
     BorderStyle,
     Color,
+    CSSEnum,
     Display,
     DividerStyle,
     FlexDirection,
@@ -142,6 +143,20 @@ class TestSizeParsing:
         with pytest.raises(ValueError, match="Cannot parse"):
             Size("abc")
 
+    @pytest.mark.parametrize(
+        ("text", "css"),
+        [(".5em", "0.5em"), ("-.5em", "-0.5em"), ("10 px", "10px"), ("10PX", "10px")],
+    )
+    def test_parse_number_forms(self, text: str, css: str) -> None:
+        """Leading-dot decimals, inner whitespace and upper case parse."""
+        assert Size(text).to_css() == css
+
+    @pytest.mark.parametrize("text", ["10.", "1e5px", "--1px", "-", "px", "1.5.3px"])
+    def test_malformed_numbers_raise(self, text: str) -> None:
+        """Malformed numbers raise ValueError."""
+        with pytest.raises(ValueError, match="Cannot parse"):
+            Size(text)
+
 
 class TestSizeEquality:
     """Test Size equality and hashing."""
@@ -185,6 +200,50 @@ class TestSizeStringConversion:
         assert Size.px(10.0).to_css() == "10px"
 
 
+class TestInterning:
+    """Test that factories share instances for repeated arguments."""
+
+    def test_size_factories_are_interned(self) -> None:
+        """Repeated factory calls return the same Size."""
+        assert Size.px(10) is Size.px(10)
+        assert Size.percent(50) is Size.percent(50)
+        assert Size.auto() is Size.auto()
+
+    def test_size_interning_is_typed(self) -> None:
+        """int and float arguments stay distinct instances."""
+        assert Size.px(10) is not Size.px(10.0)
+        assert Size.px(10) == Size.px(10.0)
+
+    def test_color_and_spacing_factories_are_interned(self) -> None:
+        """Color and Spacing factories share instances too."""
+        assert Color.rgb(1, 2, 3) is Color.rgb(1, 2, 3)
+        assert Color.hex("fff") is Color.hex("fff")
+        assert Spacing.all(10) is Spacing.all(10)
+        assert Spacing.symmetric(8, 16) is Spacing.symmetric(8, 16)
+
+    def test_border_factories_are_interned(self) -> None:
+        """Border factories share instances per (width, color) pair."""
+        assert Border.solid(2, "red") is Border.solid(2, "red")
+        assert Border.dashed() is Border.dashed()
+        assert Border.thin("navy") is Border.thin("navy")
+        assert Border.solid(2, "red") is not Border.dashed(2, "red")
+
+    def test_border_factories_keep_color_spelling(self) -> None:
+        """Colors equal up to case still render their own hex."""
+        upper = Border.solid(1, Color.hex("#FF0000"))
+        lower = Border.solid(1, Color.hex("#ff0000"))
+        assert upper.to_css() == "1px solid #FF0000"
+        assert lower.to_css() == "1px solid #ff0000"
+        assert Border.thin(Color.hex("#ABC")).to_css() == "1px solid #ABC"
+        assert Border.thin(Color.hex("#abc")).to_css() == "1px solid #abc"
+
+    def test_invalid_arguments_still_raise(self) -> None:
+        """Validation errors are not cached away."""
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                Color.rgb(256, 0, 0)
+
+
 # =============================================================================
 # Color Tests
 # =============================================================================
@@ -297,6 +356,18 @@ class TestColorValidation:
         with pytest.raises(ValueError, match="Invalid hex"):
             Color("#gggggg")
 
+    @pytest.mark.parametrize(
+        "code", ["#12", "#abcde", "#ff00zz", "#\uff11\uff12\uff13"]
+    )
+    def test_malformed_hex_raises(self, code: str) -> None:
+        """Wrong lengths and non-ASCII-hex digits are rejected."""
+        with pytest.raises(ValueError, match="Invalid hex"):
+            Color(code)
+
+    def test_mixed_case_hex_accepted(self) -> None:
+        """Upper- and lower-case hex digits are both valid."""
+        assert Color("#FfF0").to_css() == "#FfF0"
+
 
 class TestColorEquality:
     """Test Color equality."""
@@ -371,11 +442,30 @@ class TestDisplay:
         """Display.FLEX works."""
         assert Display.FLEX.to_css() == "flex"
 
+    def test_all_enums_are_css_enums(self) -> None:
+        """Every CSS enum shares the CSSEnum base and its css attribute."""
+        for enum_cls in (FontWeight, BorderStyle, Display, TextTransform, PlaceItems):
+            assert issubclass(enum_cls, CSSEnum)
+            for member in enum_cls:
+                assert member.css == member.value == member.to_css() == str(member)
+
     def test_grid(self) -> None:
         """Display.GRID works."""
         assert Display.GRID.to_css() == "grid"
 
 
+class TestContainerEnums:
+    """Test the enums used by container widgets."""
+
+    def test_container_enums_expose_css_attribute(self) -> None:
+        """Container enums carry their CSS text as a plain attribute."""
+        assert AlignItems.CENTER.css == "center"
+        assert JustifyContent.SPACE_BETWEEN.css == "space-between"
+        assert ShadowSize.NONE.css == ShadowSize.NONE.value
+        assert RadiusSize.LG.css == RadiusSize.LG.to_css() == str(RadiusSize.LG)
+        assert DividerStyle("dashed") is DividerStyle.DASHED
+
+
 class TestFlexDirection:
     """Test FlexDirection enum."""
 
@@ -509,6 +599,24 @@ class TestBorderImmutability:
         assert b1.to_css() == "1px solid black"
         assert b2.to_css() == "2px solid black"
 
+    def test_builders_reuse_unchanged_parts(self) -> None:
+        """Fluent builders keep the existing Size and Color objects."""
+        b1 = Border(Size.px(2), BorderStyle.DASHED, Color.red)
+        b2 = b1.as_dotted()
+        assert b2.width_value is b1.width_value
+        assert b2.color_value is b1.color_value
+
+    def test_named_color_strings_use_constants(self) -> None:
+        """Plain color names resolve to the shared Color constants."""
+        assert Border().color_value is Color.black
+        assert Border.solid(2, "red").color_value is Color.red
+        assert Border.solid(2, "#ABC").color_value == Color("#abc")
+
+    def test_invalid_style_raises(self) -> None:
+        """An unknown style string raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid border style"):
+            Border(1, "wavy")
+
 
 # =============================================================================
 # Spacing Tests
@@ -650,6 +758,11 @@ class TestCSSValueProtocol:
         assert hasattr(s, "to_css")
         assert str(s) == s.to_css()
 
+    def test_value_types_have_no_instance_dict(self) -> None:
+        """Value types use __slots__ instead of a per-instance __dict__."""
+        for value in (Size.px(1), Color.red, Border(), Spacing.all(1)):
+            assert not hasattr(value, "__dict__")
+
     def test_enums_have_to_css(self) -> None:
         """Enums have to_css method."""
         assert FontWeight.BOLD.to_css() == "bold"
@@ -1,5 +1,7 @@
 """Tests for HTMLDict class."""
 
+import pytest
+
 from animaid import HTMLDict, HTMLList, HTMLString
 
 
@@ -48,6 +50,7 @@ class TestHTMLDictRendering:
         assert "<dt>a</dt><dd>1</dd>" in rendered
         assert "<dt>b</dt><dd>2</dd>" in rendered
 
+    @pytest.mark.escape
     def test_render_escapes_html(self) -> None:
         """Render should escape HTML in keys and values."""
         d = HTMLDict({"<key>": "<value>"})
@@ -55,6 +58,15 @@ class TestHTMLDictRendering:
         assert "&lt;key&gt;" in rendered
         assert "&lt;value&gt;" in rendered
 
+    @pytest.mark.escape
+    def test_render_escapes_quotes_and_long_values(self) -> None:
+        """Escaping should match html.escape for short and long text."""
+        long_value = "<b>" + "x" * 100 + "</b>"
+        d = HTMLDict({"it's": '"q" & a', "long": long_value})
+        rendered = d.render()
+        assert "<dt>it&#x27;s</dt><dd>&quot;q&quot; &amp; a</dd>" in rendered
+        assert "&lt;b&gt;" + "x" * 100 + "&lt;/b&gt;" in rendered
+
     def test_render_with_styles(self) -> None:
         """Render should include container styles."""
         d = HTMLDict({"a": 1}).styled(color="red")
@@ -72,6 +84,18 @@ class TestHTMLDictRendering:
         d = HTMLDict({"a": 1})
         assert d.__html__() == d.render()
 
+    def test_dunder_html_after_mutation(self) -> None:
+        """__html__ should reflect changes made after an earlier call."""
+        inner = HTMLString("x")
+        d = HTMLDict({"a": inner})
+        first = d.__html__()
+        inner.bold()
+        d["b"] = 2
+        second = d.__html__()
+        assert second != first
+        assert "font-weight: bold" in second
+        assert "<dt>b</dt>" in second
+
 
 class TestHTMLDictFormats:
     """Test different rendering formats."""
@@ -234,6 +258,26 @@ class TestHTMLDictSeparators:
         rendered = d.render()
         assert "border-bottom: 1px solid gray" in rendered
 
+    def test_entry_separator_skips_last_entry(self) -> None:
+        """The last entry should not get an entry separator."""
+        d = HTMLDict({"a": 1, "b": 2, "c": 3}).as_table()
+        d.entry_separator("1px solid gray")
+        assert d.render() == (
+            "<table>"
+            '<tr><td>a</td><td style="border-bottom: 1px solid gray">1</td></tr>'
+            '<tr><td>b</td><td style="border-bottom: 1px solid gray">2</td></tr>'
+            "<tr><td>c</td><td>3</td></tr>"
+            "</table>"
+        )
+
+    def test_restyle_between_renders(self) -> None:
+        """Changing styles after a render should show up in the next one."""
+        d = HTMLDict({"a": 1})
+        assert d.render() == "<dl><dt>a</dt><dd>1</dd></dl>"
+        d.separator(": ").key_bold()
+        expected = '<dl><dt style="font-weight: bold">a: </dt><dd>1</dd></dl>'
+        assert d.render() == expected
+
 
 class TestHTMLDictContainerStyles:
     """Test container styling methods."""
@@ -1,5 +1,7 @@
 """Tests for HTMLFloat class."""
 
+import pytest
+
 from animaid import HTMLFloat
 
 
@@ -52,6 +54,24 @@ class TestHTMLFloatFormatting:
         n = HTMLFloat(1000.50).currency("$", 0)
         assert n.render() == "<span>$1,000</span>"
 
+    def test_currency_symbol_with_braces(self) -> None:
+        """Braces in the currency symbol are kept literally."""
+        n = HTMLFloat(1000.50).currency("{USD} ")
+        assert n.render() == "<span>{USD} 1,000.50</span>"
+
+    @pytest.mark.escape
+    def test_currency_symbol_is_escaped(self) -> None:
+        """Markup in the currency symbol is escaped."""
+        n = HTMLFloat(2.5).currency("<b>")
+        assert n.render() == "<span>&lt;b&gt;2.50</span>"
+
+    def test_format_change_replaces_previous(self) -> None:
+        """Switching format after a render uses the new format."""
+        n = HTMLFloat(0.5).currency()
+        assert n.render() == "<span>$0.50</span>"
+        n.percent(0)
+        assert n.render() == "<span>50%</span>"
+
     def test_percent(self) -> None:
         """Test percent formatting."""
         n = HTMLFloat(0.856).percent()
@@ -95,9 +115,31 @@ class TestHTMLFloatFormatting:
         assert "0.0012" in n.render()
 
 
+class TestHTMLFloatRenderMany:
+    """Test rendering several values with one HTMLFloat's settings."""
+
+    def test_render_many_matches_render(self) -> None:
+        """Each result should match rendering that value on its own."""
+        template = HTMLFloat(0).currency().bold()
+        values = [0.5, 1234.5, -3.0]
+        expected = [(template + v).render() for v in values]
+        assert template.render_many(values) == expected
+
+    def test_render_many_empty(self) -> None:
+        """No values should give an empty list."""
+        assert HTMLFloat(0).render_many([]) == []
+
+
 class TestHTMLFloatStyles:
     """Test HTMLFloat styling."""
 
+    def test_classes_and_styles_render_together(self) -> None:
+        """Classes come before styles in the rendered attributes."""
+        n = HTMLFloat(3.14).bold().red().add_class("metric")
+        assert n.render() == (
+            '<span class="metric" style="font-weight: bold; color: red">3.14</span>'
+        )
+
     def test_bold(self) -> None:
         """Test bold style."""
         n = HTMLFloat(3.14).bold()
@@ -306,6 +348,24 @@ class TestHTMLFloatStylePreservation:
         assert "color: #2e7d32" in html
         assert "21" in html
 
+    def test_result_keeps_observable_id(self) -> None:
+        """Test arithmetic results share the original's observable ID."""
+        n = HTMLFloat(1.5).bold()
+        result = -n
+        assert result._obs_id == n._obs_id
+        assert result.render() == '<span style="font-weight: bold">-1.5</span>'
+
+    def test_result_styles_are_independent(self) -> None:
+        """Test restyling a result does not change the original."""
+        n = HTMLFloat(1.5).bold()
+        result = n * 2
+        result.italic()
+        assert "font-style" not in n.render()
+
+    def test_has_no_instance_dict(self) -> None:
+        """Test HTMLFloat stores its settings in slots."""
+        assert not hasattr(HTMLFloat(1.5), "__dict__")
+
 
 class TestHTMLFloatChaining:
     """Test method chaining."""
@@ -1,5 +1,7 @@
 """Tests for HTMLInt class."""
 
+import pytest
+
 from animaid import HTMLFloat, HTMLInt
 
 
@@ -28,6 +30,13 @@ class TestHTMLIntBasics:
         assert int(n) == 0
         assert n.render() == "<span>0</span>"
 
+    def test_render_reflects_in_place_changes(self) -> None:
+        """Rendering again after restyling shows the new styles."""
+        n = HTMLInt(7)
+        assert n.__html__() == "<span>7</span>"
+        n.bold().padded(3)
+        assert n.__html__() == '<span style="font-weight: bold">007</span>'
+
 
 class TestHTMLIntFormatting:
     """Test HTMLInt number formatting."""
@@ -108,6 +117,21 @@ class TestHTMLIntFormatting:
         assert n.render() == "<span>07</span>"
 
 
+class TestHTMLIntRenderMany:
+    """Test rendering several values with one HTMLInt's settings."""
+
+    def test_render_many_matches_render(self) -> None:
+        """Each result should match rendering that value on its own."""
+        for template in (HTMLInt(0).bold(), HTMLInt(0).currency("<$>").ordinal()):
+            values = [0, 1234, -3]
+            expected = [(template + v).render() for v in values]
+            assert template.render_many(values) == expected
+
+    def test_render_many_empty(self) -> None:
+        """No values should give an empty list."""
+        assert HTMLInt(0).render_many([]) == []
+
+
 class TestHTMLIntStyles:
     """Test HTMLInt styling."""
 
@@ -203,6 +227,14 @@ class TestHTMLIntPresets:
         assert "background-color: #e0e0e0" in html
         assert "border-radius: 12px" in html
 
+    def test_shared_preset_renders_each_value(self) -> None:
+        """Test objects sharing a preset keep their own value and classes."""
+        a = HTMLInt(1).success()
+        b = HTMLInt(2).success().add_class("total")
+        assert a.render().endswith(">1</span>")
+        assert b.render().startswith('<span class="total" style="color: #2e7d32')
+        assert b.render().endswith(">2</span>")
+
 
 class TestHTMLIntArithmetic:
     """Test HTMLInt arithmetic operations."""
@@ -292,6 +324,15 @@ class TestHTMLIntArithmetic:
         assert isinstance(result, HTMLInt)
         assert int(result) == 10
 
+    def test_huge_value_formats_only_on_render(self) -> None:
+        """Test ints past the str-conversion limit construct and combine."""
+        n = HTMLInt(10**5000)
+        result = n + 1
+        assert isinstance(result, HTMLInt)
+        assert int(result) == 10**5000 + 1
+        with pytest.raises(ValueError):
+            result.render()
+
 
 class TestHTMLIntStylePreservation:
     """Test that styles are preserved across operations."""
@@ -319,6 +360,13 @@ class TestHTMLIntStylePreservation:
         assert "color: #2e7d32" in html
         assert ">50<" in html
 
+    def test_format_preserved_in_float_result(self) -> None:
+        """Test formatting carries over when the result is an HTMLFloat."""
+        n = HTMLInt(5).currency()
+        result = n + 0.5
+        assert isinstance(result, HTMLFloat)
+        assert result.render() == "<span>$5.50</span>"
+
 
 class TestHTMLIntChaining:
     """Test method chaining."""
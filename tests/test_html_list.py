@@ -1,5 +1,7 @@
 """Tests for HTMLList class."""
 
+import pytest
+
 from animaid import HTMLList, HTMLString
 
 
@@ -11,6 +13,10 @@ class TestHTMLListBasics:
         lst = HTMLList(["a", "b", "c"])
         assert isinstance(lst, list)
 
+    def test_has_no_instance_dict(self) -> None:
+        """HTMLList should store its settings in slots."""
+        assert not hasattr(HTMLList(["a"]), "__dict__")
+
     def test_list_value(self) -> None:
         """HTMLList should preserve list items."""
         lst = HTMLList(["a", "b", "c"])
@@ -41,6 +47,7 @@ class TestHTMLListRendering:
         lst = HTMLList(["Apple", "Banana"])
         assert lst.render() == "<ul><li>Apple</li><li>Banana</li></ul>"
 
+    @pytest.mark.escape
     def test_render_escapes_html(self) -> None:
         """Render should escape HTML in items."""
         lst = HTMLList(["<script>alert('xss')</script>"])
@@ -48,6 +55,28 @@ class TestHTMLListRendering:
         assert "<script>" not in rendered
         assert "&lt;script&gt;" in rendered
 
+    @pytest.mark.escape
+    def test_render_escapes_only_items_that_need_it(self) -> None:
+        """One item needing escaping does not affect the others."""
+        lst = HTMLList(["plain", "a & b", "also plain"])
+        assert lst.render() == (
+            "<ul><li>plain</li><li>a &amp; b</li><li>also plain</li></ul>"
+        )
+
+    @pytest.mark.escape
+    def test_render_escapes_string_items_containing_nul(self) -> None:
+        """Items containing a NUL character are still escaped separately."""
+        lst = HTMLList(["a\x00<b>", "c & d"])
+        assert lst.render() == "<ul><li>a\x00&lt;b&gt;</li><li>c &amp; d</li></ul>"
+
+    def test_render_string_items_with_html_strings(self) -> None:
+        """HTMLString items still render as HTML among plain strings."""
+        lst = HTMLList(["plain", HTMLString("bold").bold()])
+        assert lst.render() == (
+            '<ul><li>plain</li><li><span style="font-weight: bold">bold</span>'
+            "</li></ul>"
+        )
+
     def test_render_with_styles(self) -> None:
         """Render should include container styles."""
         lst = HTMLList(["a", "b"]).styled(color="red")
@@ -208,6 +237,18 @@ class TestHTMLListBorders:
         rendered = lst.render()
         assert "border-right: 1px solid gray" in rendered
 
+    def test_separator_skips_last_item(self) -> None:
+        """Only the items before the last one get a separator."""
+        lst = HTMLList(["a", "b", "c"]).plain().separator("1px solid gray")
+        rendered = lst.render()
+        assert rendered.count("border-bottom: 1px solid gray") == 2
+        assert rendered.endswith("<div>c</div></div>")
+
+    def test_single_item_has_no_separator(self) -> None:
+        """A one-item list has no separator."""
+        lst = HTMLList(["only"]).plain().separator("1px solid gray")
+        assert "border-bottom" not in lst.render()
+
 
 class TestHTMLListColors:
     """Test color methods."""
@@ -316,6 +357,17 @@ class TestHTMLListNesting:
         assert "mid" in rendered
         assert "top" in rendered
 
+    def test_nested_changes_after_render(self) -> None:
+        """In-place changes to nested items show up on the next render."""
+        inner = HTMLList(["x"])
+        outer = HTMLList([inner, "top"])
+        outer.render()
+        inner.append("y")
+        inner.horizontal()
+        rendered = outer.render()
+        assert "<div>y</div>" in rendered
+        assert "display: flex" in rendered
+
     def test_mixed_content(self) -> None:
         """Lists with mixed content types should render."""
         lst = HTMLList(
@@ -374,6 +426,15 @@ class TestHTMLListOperations:
         assert list(result) == ["b", "c"]
         assert "gap: 5px" in result.render()
 
+    def test_slice_settings_are_independent(self) -> None:
+        """Restyling a slice should not affect the original list."""
+        lst = HTMLList(["a", "b", "c"]).ordered().color("red")
+        result = lst[:2]
+        result.color("blue").add_item_class("x").unordered()
+        assert lst.render() == (
+            '<ol style="color: red"><li>a</li><li>b</li><li>c</li></ol>'
+        )
+
     def test_indexing_returns_item(self) -> None:
         """Indexing should return the item, not HTMLList."""
         lst = HTMLList(["a", "b", "c"])
@@ -1,5 +1,7 @@
 """Tests for HTMLString class."""
 
+import pytest
+
 from animaid import HTMLString
 
 
@@ -11,6 +13,10 @@ class TestHTMLStringBasics:
         s = HTMLString("Hello")
         assert isinstance(s, str)
 
+    def test_has_no_instance_dict(self) -> None:
+        """HTMLString should store its settings in slots."""
+        assert not hasattr(HTMLString("Hello"), "__dict__")
+
     def test_string_value(self) -> None:
         """HTMLString should preserve string value."""
         s = HTMLString("Hello World")
@@ -47,10 +53,9 @@ class TestHTMLStringRendering:
     def test_render_multiple_styles(self) -> None:
         """Render should include multiple styles."""
         s = HTMLString("Hello", color="red", font_size="16px")
-        rendered = s.render()
-        assert "color: red" in rendered
-        assert "font-size: 16px" in rendered
+        assert s.render() == '<span style="color: red; font-size: 16px">Hello</span>'
 
+    @pytest.mark.escape
     def test_render_escapes_html(self) -> None:
         """Render should escape HTML to prevent XSS."""
         s = HTMLString("<script>alert('xss')</script>")
@@ -58,6 +63,27 @@ class TestHTMLStringRendering:
         assert "<script>" not in rendered
         assert "&lt;script&gt;" in rendered
 
+    @pytest.mark.escape
+    def test_render_long_text(self) -> None:
+        """Long text should be escaped only where needed."""
+        plain = "word " * 40
+        assert HTMLString(plain).render() == f"<span>{plain}</span>"
+        quoted = plain + "it's"
+        assert HTMLString(quoted).render().endswith("it&#x27;s</span>")
+        unicode_text = "café 世界 " * 30
+        assert HTMLString(unicode_text).render() == f"<span>{unicode_text}</span>"
+        accented = "café " * 40 + "&"
+        assert HTMLString(accented).render().endswith("café &amp;</span>")
+
+    @pytest.mark.escape
+    def test_render_escapes_every_special_character(self) -> None:
+        """All five special characters are escaped whatever the text length."""
+        specials = """<>&"'"""
+        expected = "&lt;&gt;&amp;&quot;&#x27;"
+        for prefix in ("", "word " * 20, "café " * 20):
+            rendered = HTMLString(prefix + specials).render()
+            assert rendered == f"<span>{prefix}{expected}</span>"
+
     def test_render_with_classes(self) -> None:
         """Render should include CSS classes."""
         s = HTMLString("Hello").add_class("highlight")
@@ -89,135 +115,72 @@ class TestHTMLStringRendering:
         assert s.__html__() == s.render()
 
 
+# (method name, CSS it adds) for the no-argument style methods
+STYLE_METHODS = [
+    ("bold", "font-weight: bold"),
+    ("italic", "font-style: italic"),
+    ("underline", "text-decoration: underline"),
+    ("strikethrough", "text-decoration: line-through"),
+    ("uppercase", "text-transform: uppercase"),
+    ("lowercase", "text-transform: lowercase"),
+    ("capitalize", "text-transform: capitalize"),
+    ("nowrap", "white-space: nowrap"),
+    ("monospace", "font-family: monospace"),
+]
+
+# (method name, argument, CSS it adds) for the style methods taking a value
+STYLE_METHODS_WITH_ARGS = [
+    ("color", "red", "color: red"),
+    ("background", "yellow", "background-color: yellow"),
+    ("font_size", "20px", "font-size: 20px"),
+    ("font_family", "Arial, sans-serif", "font-family: Arial, sans-serif"),
+    ("padding", "10px", "padding: 10px"),
+    ("margin", "5px", "margin: 5px"),
+    ("border", "1px solid black", "border: 1px solid black"),
+    ("border_radius", "5px", "border-radius: 5px"),
+    ("opacity", 0.5, "opacity: 0.5"),
+    ("width", "100px", "width: 100px"),
+    ("height", "50px", "height: 50px"),
+    ("display", "block", "display: block"),
+]
+
+
 class TestHTMLStringStyleMethods:
     """Test style methods."""
 
-    def test_bold(self) -> None:
-        """Bold method should add font-weight: bold."""
-        s = HTMLString("Hello").bold()
-        assert "font-weight: bold" in s.render()
-
-    def test_italic(self) -> None:
-        """Italic method should add font-style: italic."""
-        s = HTMLString("Hello").italic()
-        assert "font-style: italic" in s.render()
-
-    def test_underline(self) -> None:
-        """Underline method should add text-decoration: underline."""
-        s = HTMLString("Hello").underline()
-        assert "text-decoration: underline" in s.render()
-
-    def test_strikethrough(self) -> None:
-        """Strikethrough method should add text-decoration: line-through."""
-        s = HTMLString("Hello").strikethrough()
-        assert "text-decoration: line-through" in s.render()
-
-    def test_uppercase(self) -> None:
-        """Uppercase method should add text-transform: uppercase."""
-        s = HTMLString("Hello").uppercase()
-        assert "text-transform: uppercase" in s.render()
-
-    def test_lowercase(self) -> None:
-        """Lowercase method should add text-transform: lowercase."""
-        s = HTMLString("Hello").lowercase()
-        assert "text-transform: lowercase" in s.render()
-
-    def test_capitalize(self) -> None:
-        """Capitalize method should add text-transform: capitalize."""
-        s = HTMLString("Hello").capitalize()
-        assert "text-transform: capitalize" in s.render()
-
-    def test_nowrap(self) -> None:
-        """Nowrap method should add white-space: nowrap."""
-        s = HTMLString("Hello").nowrap()
-        assert "white-space: nowrap" in s.render()
-
-    def test_monospace(self) -> None:
-        """Monospace method should add font-family: monospace."""
-        s = HTMLString("Hello").monospace()
-        assert "font-family: monospace" in s.render()
+    @pytest.mark.parametrize(("method", "css"), STYLE_METHODS)
+    def test_style_method(self, method: str, css: str) -> None:
+        """Each no-argument style method should add its CSS."""
+        s = getattr(HTMLString("Hello"), method)()
+        assert css in s.render()
 
     def test_chained_methods(self) -> None:
         """Methods should be chainable."""
         s = HTMLString("Hello").bold().italic().underline()
-        rendered = s.render()
-        assert "font-weight: bold" in rendered
-        assert "font-style: italic" in rendered
-        assert "text-decoration: underline" in rendered
+        assert s.render() == (
+            '<span style="font-weight: bold; font-style: italic; '
+            'text-decoration: underline">Hello</span>'
+        )
 
 
 class TestHTMLStringStyleMethodsWithArgs:
     """Test style methods that take arguments."""
 
-    def test_color(self) -> None:
-        """Color method should set color style."""
-        s = HTMLString("Hello").color("red")
-        assert "color: red" in s.render()
-
-    def test_background(self) -> None:
-        """Background method should set background-color style."""
-        s = HTMLString("Hello").background("yellow")
-        assert "background-color: yellow" in s.render()
-
-    def test_font_size(self) -> None:
-        """Font size method should set font-size style."""
-        s = HTMLString("Hello").font_size("20px")
-        assert "font-size: 20px" in s.render()
-
-    def test_font_family(self) -> None:
-        """Font family method should set font-family style."""
-        s = HTMLString("Hello").font_family("Arial, sans-serif")
-        assert "font-family: Arial, sans-serif" in s.render()
-
-    def test_padding(self) -> None:
-        """Padding method should set padding style."""
-        s = HTMLString("Hello").padding("10px")
-        assert "padding: 10px" in s.render()
-
-    def test_margin(self) -> None:
-        """Margin method should set margin style."""
-        s = HTMLString("Hello").margin("5px")
-        assert "margin: 5px" in s.render()
-
-    def test_border(self) -> None:
-        """Border method should set border style."""
-        s = HTMLString("Hello").border("1px solid black")
-        assert "border: 1px solid black" in s.render()
-
-    def test_border_radius(self) -> None:
-        """Border radius method should set border-radius style."""
-        s = HTMLString("Hello").border_radius("5px")
-        assert "border-radius: 5px" in s.render()
-
-    def test_opacity(self) -> None:
-        """Opacity method should set opacity style."""
-        s = HTMLString("Hello").opacity(0.5)
-        assert "opacity: 0.5" in s.render()
-
-    def test_width(self) -> None:
-        """Width method should set width style."""
-        s = HTMLString("Hello").width("100px")
-        assert "width: 100px" in s.render()
-
-    def test_height(self) -> None:
-        """Height method should set height style."""
-        s = HTMLString("Hello").height("50px")
-        assert "height: 50px" in s.render()
-
-    def test_display(self) -> None:
-        """Display method should set display style."""
-        s = HTMLString("Hello").display("block")
-        assert "display: block" in s.render()
+    @pytest.mark.parametrize(("method", "value", "css"), STYLE_METHODS_WITH_ARGS)
+    def test_style_method_with_arg(self, method: str, value: object, css: str) -> None:
+        """Each style method taking a value should add its CSS."""
+        s = getattr(HTMLString("Hello"), method)(value)
+        assert css in s.render()
 
     def test_styled_method(self) -> None:
         """Styled method should set arbitrary styles."""
         s = HTMLString("Hello").styled(
             color="blue", font_size="18px", text_align="center"
         )
-        rendered = s.render()
-        assert "color: blue" in rendered
-        assert "font-size: 18px" in rendered
-        assert "text-align: center" in rendered
+        assert s.render() == (
+            '<span style="color: blue; font-size: 18px; text-align: center">'
+            "Hello</span>"
+        )
 
 
 class TestHTMLStringInPlace:
@@ -234,8 +197,23 @@ class TestHTMLStringInPlace:
         """Chaining should modify the original object."""
         s1 = HTMLString("Hello")
         s1.bold().color("red")
-        assert "font-weight: bold" in s1.render()
-        assert "color: red" in s1.render()
+        rendered = s1.render()
+        assert "font-weight: bold" in rendered
+        assert "color: red" in rendered
+
+    def test_equal_strings_do_not_share_styles(self) -> None:
+        """Styling one instance should not affect another with equal text."""
+        s1 = HTMLString("Hello").bold()
+        s2 = HTMLString("Hello")
+        assert s1 == s2
+        assert s2.render() == "<span>Hello</span>"
+
+    def test_preset_override_does_not_leak(self) -> None:
+        """Overriding a preset style should not affect other instances."""
+        s1 = HTMLString("Saved").success().color("purple")
+        s2 = HTMLString("Done").success()
+        assert "color: purple" in s1.render()
+        assert "color: #2e7d32" in s2.render()
 
 
 class TestHTMLStringOperations:
@@ -272,10 +250,19 @@ class TestHTMLStringOperations:
         assert str(result) == "H"
         assert "color: red" in result.render()
 
+    def test_derived_string_styles_are_independent(self) -> None:
+        """Styling a concatenation or slice should not affect the original."""
+        s = HTMLString("Hello").color("red")
+        for result in (s + "!", "!" + s, s[1:]):
+            result.color("blue").add_class("x")
+            assert result._obs_id != s._obs_id
+        assert s.render() == '<span style="color: red">Hello</span>'
+
 
 class TestHTMLStringEdgeCases:
     """Test edge cases and special scenarios."""
 
+    @pytest.mark.escape
     def test_special_characters(self) -> None:
         """Special characters should be escaped properly."""
         s = HTMLString("5 > 3 && 3 < 5")
@@ -289,6 +276,7 @@ class TestHTMLStringEdgeCases:
         s = HTMLString("Hello \u4e16\u754c")
         assert s.render() == "<span>Hello \u4e16\u754c</span>"
 
+    @pytest.mark.escape
     def test_quotes_in_content(self) -> None:
         """Quotes in content should be escaped."""
         s = HTMLString('He said "Hello"')
@@ -298,5 +286,6 @@ class TestHTMLStringEdgeCases:
     def test_style_override(self) -> None:
         """Later styles should override earlier ones."""
         s = HTMLString("Hello").color("red").color("blue")
-        assert "color: blue" in s.render()
-        assert s.render().count("color:") == 1
+        rendered = s.render()
+        assert "color: blue" in rendered
+        assert rendered.count("color:") == 1
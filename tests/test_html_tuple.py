@@ -2,6 +2,8 @@
 
 from collections import namedtuple
 
+import pytest
+
 from animaid import HTMLTuple
 
 
@@ -38,6 +40,16 @@ class TestHTMLTupleBasics:
         t = HTMLTuple((1, "two", 3.0))
         assert t.render() == "<span>(1, two, 3.0)</span>"
 
+    @pytest.mark.escape
+    def test_str_subclass_items(self) -> None:
+        """Items that subclass str render and escape like plain strings."""
+
+        class Label(str):
+            pass
+
+        t = HTMLTuple((Label("a&b"), Label("c")))
+        assert t.render() == "<span>(a&amp;b, c)</span>"
+
 
 class TestNamedTuples:
     """Test named tuple support."""
@@ -198,6 +210,16 @@ class TestTupleItemStyles:
         html = t.render()
         assert "border-radius: 4px" in html
 
+    def test_separator_skips_last_item(self) -> None:
+        """Test the separator is applied to every item but the last."""
+        t = HTMLTuple((1, 2, 3)).plain().vertical().separator("1px solid gray")
+        sep = '<span style="border-bottom: 1px solid gray">'
+        assert t.render() == (
+            '<div style="display: inline-flex; flex-direction: column">'
+            f"{sep}1</span><span>, </span>{sep}2</span><span>, </span>"
+            "<span>3</span></div>"
+        )
+
 
 class TestTuplePresets:
     """Test style presets."""
@@ -3,6 +3,8 @@
 import threading
 import time
 
+import pytest
+
 
 class TestInputEvent:
     """Tests for InputEvent dataclass."""
@@ -129,6 +131,16 @@ class TestHTMLButton:
         html = button.render()
         assert "12px" in html
 
+    def test_button_preset_then_styled(self) -> None:
+        """Overriding a preset style leaves the original and the preset intact."""
+        from animaid import HTMLButton
+
+        large = HTMLButton("Big").large()
+        custom = large.styled(font_size="30px")
+        assert "font-size: 30px" in custom.render()
+        assert "font-size: 18px" in large.render()
+        assert "font-size: 18px" in HTMLButton("Other").large().render()
+
     def test_button_styled(self) -> None:
         """Test custom styling."""
         from animaid import HTMLButton
@@ -138,6 +150,25 @@ class TestHTMLButton:
         assert "font-size: 20px" in html
         assert "color: purple" in html
 
+    def test_button_styled_value_text_is_kept(self) -> None:
+        """Test that equal style values keep their own text across buttons."""
+        from animaid import HTMLButton
+        from animaid.css_types import Color
+
+        assert 'style="opacity: 1.0"' in HTMLButton("a").styled(opacity=1.0).render()
+        assert 'style="opacity: 1"' in HTMLButton("b").styled(opacity=1).render()
+        upper = HTMLButton("c").styled(color=Color("#FF0000")).render()
+        lower = HTMLButton("d").styled(color=Color("#ff0000")).render()
+        assert 'style="color: #FF0000"' in upper
+        assert 'style="color: #ff0000"' in lower
+
+    def test_button_styled_unhashable_value(self) -> None:
+        """Test that an unhashable style value renders through its str()."""
+        from animaid import HTMLButton
+
+        html = HTMLButton("a").styled(font_family=["Arial"]).render()
+        assert "style=\"font-family: ['Arial']\"" in html
+
     def test_button_add_class(self) -> None:
         """Test adding CSS classes."""
         from animaid import HTMLButton
@@ -156,6 +187,7 @@ class TestHTMLButton:
         assert "primary" in html
         assert "18px" in html
 
+    @pytest.mark.escape
     def test_button_html_escaping(self) -> None:
         """Test HTML escaping in label."""
         from animaid import HTMLButton
@@ -165,6 +197,14 @@ class TestHTMLButton:
         assert "<script>" not in html
         assert "&lt;script&gt;" in html
 
+    @pytest.mark.escape
+    def test_button_html_string_label(self) -> None:
+        """Test that an HTMLString label is escaped as its plain text."""
+        from animaid import HTMLButton, HTMLString
+
+        button = HTMLButton(HTMLString("Save & <exit>").bold())
+        assert button.render().endswith(">Save &amp; &lt;exit&gt;</button>")
+
     def test_button_anim_id_in_render(self) -> None:
         """Test that anim_id appears in rendered HTML."""
         from animaid import HTMLButton
@@ -298,6 +338,7 @@ class TestHTMLTextInput:
         html = text.render()
         assert "12px" in html
 
+    @pytest.mark.escape
     def test_text_input_html_escaping(self) -> None:
         """Test HTML escaping."""
         from animaid import HTMLTextInput
@@ -516,6 +557,7 @@ class TestHTMLSelect:
         html = select.render()
         assert "18px" in html
 
+    @pytest.mark.escape
     def test_select_html_escaping(self) -> None:
         """Test HTML escaping in options."""
         from animaid import HTMLSelect
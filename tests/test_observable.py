@@ -32,6 +32,22 @@ class TestHTMLListObservable:
         finally:
             pub.unsubscribe(listener, "animaid.changed")
 
+    def test_publishes_to_listener_subscribed_later(self) -> None:
+        """Changes made before anyone subscribes do not stop later ones."""
+        html_list = HTMLList([1, 2, 3])
+        html_list.append(4)
+        received: list[str] = []
+
+        def listener(obs_id: str) -> None:
+            received.append(obs_id)
+
+        pub.subscribe(listener, "animaid.changed")
+        try:
+            html_list.append(5)
+            assert received == [html_list._obs_id]
+        finally:
+            pub.unsubscribe(listener, "animaid.changed")
+
     def test_extend_publishes(self) -> None:
         """Extend should publish change notification."""
         received: list[str] = []